@@ -0,0 +1,150 @@
+"""
+Font Bakery baseline reuses the results of a previous run, as recorded
+in its report (the document of `SerializeReporter.getdoc`, e.g. written
+by `--json`), and reports how the results changed since.
+
+A `Baseline` is used as the result cache of the CheckRunner: a check
+execution whose result key (see `fontbakery.resultcache`) is recorded in
+the report, i.e. neither the checked files (paths and contents), nor the
+check and its conditions, nor the other consumed values changed, is not
+executed again. Its recorded result is replayed instead, unless the name
+of the checked file relative to the common directory of all files (see
+`get_relative_names`) changed, then its results would be reported under
+another name.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+import os
+
+from fontbakery.checkrunner import (
+              DEBUG
+            , PASS
+            , SKIP
+            , INFO
+            , WARN
+            , FAIL
+            , ERROR
+            , STARTCHECK
+            , ENDCHECK
+            )
+from fontbakery.multiproc import RemoteMessage
+from fontbakery.resultcache import ResultCache
+
+_STATUSES = {status.name: status
+             for status in (DEBUG, PASS, SKIP, INFO, WARN, FAIL, ERROR)}
+
+
+def iter_check_items(doc):
+  """ Yields the check items of a report document, also when the checks
+  are clustered (`collect_results_by`). """
+  for section in doc['sections']:
+    for cluster in section['checks']:
+      if not isinstance(cluster, list):
+        cluster = [cluster]
+      for item in cluster:
+        yield item
+
+
+def get_check_id(item):
+  # the key is (section, check, iterargs), check is e.g.
+  # '<FontBakeryCheck:com.google.fonts/check/name/trailing_spaces>'
+  return item['key'][1].split(':', 1)[1].rstrip('>')
+
+
+def get_relative_names(filenames):
+  """ Returns a dict {filename: name} of the paths in `filenames`, where
+  name is the path relative to the common directory of all of them.
+  That way files are matched across runs, even when the checked
+  directory moved, but not files of the same name in other directories.
+  """
+  paths = {filename: os.path.abspath(filename) for filename in filenames
+                                                if isinstance(filename, str)}
+  if not paths:
+    return {}
+  root = os.path.commonpath([os.path.dirname(path) for path in paths.values()])
+  return {filename: os.path.relpath(path, root)
+                                      for filename, path in paths.items()}
+
+
+def get_results(doc):
+  """ Returns a dict {(check id, name): status name} of a report
+  document, name is the filename relative to the common directory of all
+  files, see `get_relative_names`, None e.g. for family checks. """
+  items = list(iter_check_items(doc))
+  names = get_relative_names(item['filename'] for item in items
+                                                      if 'filename' in item)
+  return {(get_check_id(item), names.get(item.get('filename', None), None)):
+                                          item['result'] for item in items}
+
+
+class Baseline(ResultCache):
+  def __init__(self, doc, directory=None, salt='', filenames=None):
+    """
+    doc: the report document of the previous run
+    directory, salt: see ResultCache, results that are not in the
+                     baseline are looked up and stored in `directory`.
+                     Use the same salt as the previous run.
+    filenames: the files checked by this run, if given recorded results
+               are only reused when the relative name of the checked
+               file is the recorded one.
+    """
+    super(Baseline, self).__init__(directory, salt=salt)
+    self._doc = doc
+    self._names = None if filenames is None \
+                       else get_relative_names(filenames)
+    items = list(iter_check_items(doc))
+    recorded_names = get_relative_names(item['filename'] for item in items
+                                                        if 'filename' in item)
+    # {result key: (check item, recorded relative name)}
+    self._items = {}
+    for item in items:
+      # like ResultCache.set: results with an ERROR are not reused
+      statuses = [item['result']] + [log['status'] for log in item['logs']]
+      if 'resultKey' in item and ERROR.name not in statuses \
+                             and all(name in _STATUSES for name in statuses):
+        self._items[item['resultKey']] = item, recorded_names.get(
+                                              item.get('filename', None), None)
+
+  @property
+  def doc(self):
+    return self._doc
+
+  def has_result(self, key, filename=None):
+    """ Whether the result of `key` of a check of `filename` is recorded
+    in the baseline. """
+    if key not in self._items:
+      return False
+    if self._names is None:
+      return True
+    _, recorded_name = self._items[key]
+    return recorded_name == self._names.get(filename, None)
+
+  def get_key(self, check, conditions, inputs, filename=None):
+    key = super(Baseline, self).get_key(check, conditions, inputs,
+                                        filename=filename)
+    if key in self._items and not self.has_result(key, filename):
+      # Recorded for a file of another name, don't replay its messages.
+      del self._items[key]
+    return key
+
+  def has(self, key):
+    return key in self._items or super(Baseline, self).has(key)
+
+  def get(self, key):
+    if key not in self._items:
+      return super(Baseline, self).get(key)
+    item, _ = self._items[key]
+    events = [(STARTCHECK, None)]
+    for log in item['logs']:
+      events.append((_STATUSES[log['status']],
+                     RemoteMessage(log['message'],
+                                   code=log.get('code', None),
+                                   traceback=log.get('traceback', None))))
+    events.append((ENDCHECK, _STATUSES[item['result']]))
+    return events
@@ -129,7 +129,10 @@ class FontBakeryCondition(FontbakeryCallable):
        name = None, # very short text
        description = None, # short text
        documentation=None, # long text, markdown?
-       force=False
+       force=False,
+       volatile=False, # see FontBakeryCheck
+       persistent=False, # True if the value can be stored in a result cache
+       tool_version=None # see FontBakeryCheck
       ):
     super(FontBakeryCondition, self).__init__(func)
     # self.id = id
@@ -137,6 +140,12 @@ class FontBakeryCondition(FontbakeryCallable):
     self.description, self.documentation = get_doc_desc(
                                         func, description, documentation)
     self.force = force
+    self.volatile = volatile
+    # The value of a persistent condition must be JSON compatible. Like
+    # check results it is stored in the result cache, if there's one,
+    # and reused while the inputs of the condition don't change.
+    self.persistent = persistent
+    self.tool_version = tool_version
 
 class FontBakeryCheck(FontbakeryCallable):
   def __init__(
@@ -150,6 +159,9 @@ class FontBakeryCheck(FontbakeryCallable):
        conditions=None,
        # arguments_setup=None,
        rationale=None, # long text explaining why this check is needed. Using markdown, perhaps?
+       io_bound=False, # True if the check mostly waits for subprocesses or the network
+       volatile=False, # True if the result depends on more than the checked files
+       tool_version=None, # callable, the version of the external tools used
        misc_metadata=None, # miscelaneous free-form metadata fields
                            # some of them may be promoted to first-class metadata fields
                            # if they start being used by the check-runner.
@@ -204,6 +216,24 @@ class FontBakeryCheck(FontbakeryCallable):
     to prepare the arguments for this check.
     TODO: flesh out the format.
 
+    io_bound: bool, True if the check spends most of its time waiting
+    for child processes or network responses instead of computing.
+    The check runner may execute such checks early and concurrently
+    in a thread pool. Their dependencies are still resolved in the main
+    thread, so the check itself should not use shared state beyond
+    its arguments.
+
+    volatile: bool, True if the result can change while the checked
+    files and the values it receives stay the same, e.g. because it
+    reads other files or queries the network. Results of volatile
+    checks, or of checks that depend on volatile conditions, are never
+    stored in a result cache.
+
+    tool_version: callable without arguments, returns the version of
+    the external tools the check runs, e.g. a string. It is part of the
+    result cache key, so stored results are not reused after a tool was
+    updated. Conditions accept it as well.
+
     documentation: text, used as a detailed documentation,
     read by humans(I suggest to make it markdown formatted).
 
@@ -225,6 +255,9 @@ class FontBakeryCheck(FontbakeryCallable):
     self.name = checkfunc.__name__ if name is None else name
     self.conditions = conditions or []
     self.rationale = rationale
+    self.io_bound = io_bound
+    self.volatile = volatile
+    self.tool_version = tool_version
     self.description, self.documentation = get_doc_desc(
                                       checkfunc, description, documentation)
     if not self.description:
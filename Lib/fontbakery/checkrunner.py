@@ -12,7 +12,8 @@ Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 
 """
 import types
-from collections import OrderedDict, Counter
+from collections import OrderedDict, Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial, wraps
 from itertools import chain
 import importlib
@@ -21,7 +22,10 @@ import json
 import logging
 from typing import Dict, Any, Iterable
 import re
+import time
 
+from fontbakery.timings import (CHECK as TIMED_CHECK,
+                                CONDITION as TIMED_CONDITION)
 from fontbakery.callable import ( FontbakeryCallable
                                 , FontBakeryCheck
                                 , FontBakeryCondition
@@ -225,12 +229,68 @@ def is_negated(name):
     return True, stripped[1:].strip()
   return False, stripped
 
+class ConditionCache:
+  """ The cache of evaluated conditions used by CheckRunner.
+
+  Keys are tuples (condition name, used iterargs), values are tuples
+  (error, value).
+
+  max_entries: None or the maximum number of cached conditions. When
+  it is exceeded, the least recently used entries are dropped and will
+  be evaluated again when they are needed.
+
+  Subclasses can implement other strategies, e.g. a budget in bytes,
+  the runner only uses the mapping interface and `release`.
+  """
+  def __init__(self, max_entries=None):
+    self._entries = OrderedDict()
+    self._max_entries = max_entries
+
+  @property
+  def max_entries(self):
+    return self._max_entries
+
+  def __len__(self):
+    return len(self._entries)
+
+  def __contains__(self, key):
+    return key in self._entries
+
+  def __getitem__(self, key):
+    self._entries.move_to_end(key)
+    return self._entries[key]
+
+  def __setitem__(self, key, value):
+    self._entries[key] = value
+    self._entries.move_to_end(key)
+    if self._max_entries is not None:
+      while len(self._entries) > self._max_entries:
+        self._entries.popitem(last=False)
+
+  def release(self, iterarg):
+    """ Drop all entries that were evaluated using `iterarg`, a tuple
+    (name, index). Called by the runner after the last check in the
+    execution order that uses `iterarg` directly.
+    """
+    for key in [key for key in self._entries if iterarg in key[1]]:
+      del self._entries[key]
+
+  def clear(self):
+    self._entries.clear()
+
+
 class CheckRunner:
   def __init__(self, profile, values
              , values_can_override_profile_names=True
              , custom_order=None
              , explicit_checks=None
              , exclude_checks=None
+             , io_threads=0
+             , io_lookahead=None
+             , result_cache=None
+             , condition_cache=None
+             , major_iterarg=None
+             , timings=None
              ):
     # TODO: transform all iterables that are list like to tuples
     # to make sure that they won't change anymore.
@@ -239,6 +299,23 @@ class CheckRunner:
     self._custom_order = custom_order
     self._explicit_checks = explicit_checks
     self._exclude_checks = exclude_checks
+    self._major_iterarg = major_iterarg
+    # number of threads for checks marked as `io_bound`, 0 means
+    # they run in order like all other checks.
+    self._io_threads = io_threads
+    # io-bound checks are started at most this many identities of the
+    # execution order ahead, their arguments, e.g. a loaded font, are
+    # prepared when they are started. By default as many as there are
+    # threads.
+    self._io_lookahead = io_threads if io_lookahead is None else io_lookahead
+    # optional, a fontbakery.resultcache.ResultCache
+    self._result_cache = result_cache
+    # optional, a fontbakery.timings.Timings
+    self._timings = timings
+    # {(check.id, iterargs): seconds} of the executed checks
+    self._durations = {}
+    # {(check.id, iterargs): key}, see `_get_result_cache_key`
+    self._result_keys = {}
     self._iterargs = OrderedDict()
     for singular, plural in profile.iterargs.items():
       values[plural] = tuple(values[plural])
@@ -261,7 +338,8 @@ class CheckRunner:
     self._values = values
 
     self._cache = {
-      'conditions': {}
+      'conditions': condition_cache if condition_cache is not None \
+                                                      else ConditionCache()
     , 'order': None
     }
 
@@ -274,6 +352,11 @@ class CheckRunner:
       iterargs[name] = tuple(self._values[plural])
     return iterargs
 
+  @property
+  def timings(self):
+    """ None or the fontbakery.timings.Timings of this runner """
+    return self._timings
+
   @property
   def profile(self):
     return self._profile
@@ -372,11 +455,31 @@ class CheckRunner:
       return error, None
 
     path.pop()
+    key = self._get_condition_cache_key(condition, iterargs)
+    if key is not None:
+      found, value = self._result_cache.get_value(key)
+      if found:
+        return None, value
     try:
-      return None, condition(**args)
+      value = condition(**args)
     except Exception as err:
       error = FailedConditionError(condition, err)
       return error, None
+    if key is not None:
+      self._result_cache.set_value(key, value)
+    return None, value
+
+  def _get_condition_cache_key(self, condition, iterargs):
+    """ Returns the result cache key of the value of a persistent condition
+    or None if the value can't be stored.
+    """
+    if self._result_cache is None or not condition.persistent \
+                                  or condition.volatile:
+      return None
+    conditions, inputs = self._get_inputs(condition.args, iterargs)
+    if any(condition.volatile for condition in conditions):
+      return None
+    return self._result_cache.get_condition_key(condition, conditions, inputs)
 
   def _filter_condition_used_iterargs(self, name, iterargs):
     allArgs = set()
@@ -396,8 +499,15 @@ class CheckRunner:
     usecache = True #False
     used_iterargs = self._filter_condition_used_iterargs(name, iterargs)
     key = (name, used_iterargs)
+    if self._timings is not None:
+      self._timings.count_cache(TIMED_CONDITION, name
+                              , key in self._cache['conditions'])
     if not usecache or key not in self._cache['conditions']:
-      err, val = self._evaluate_condition(name, used_iterargs, path)
+      if self._timings is None:
+        err, val = self._evaluate_condition(name, used_iterargs, path)
+      else:
+        with self._timings.measure(TIMED_CONDITION, name, used_iterargs):
+          err, val = self._evaluate_condition(name, used_iterargs, path)
       if usecache:
         self._cache['conditions'][key] = err, val
     else:
@@ -539,24 +649,186 @@ class CheckRunner:
       status = (ERROR, FailedDependenciesError(check, error))
       return (status, None)
 
-  def _run_check(self, check, iterargs):
-    summary_status = None
+  def _prepare_check(self, check, iterargs):
+    """ Returns a tuple (skipped, args).
+
+    `skipped` is None or the result tuple (status, message) that is
+    reported instead of running the check. Otherwise `args` are the
+    arguments to call the check with.
+    """
     # A check is more than just a function, it carries
     # a lot of meta-data for us, in this case we can use
     # meta-data to learn how to call the check (via
     # configuration or inspection, where inspection would be
     # the default and configuration could be used to override
     # inspection results).
-
-    skipped = None
     if self._profile.check_skip_filter:
       iterargsDict = {key:self.get_iterarg(key, index) for key, index in iterargs}
       accepted, message = self._profile.check_skip_filter(check.id, **iterargsDict)
       if not accepted:
-        skipped = (SKIP, 'Filtered: {}'.format(message or '(no message)'))
+        return (SKIP, 'Filtered: {}'.format(message or '(no message)')), None
+
+    return self._get_check_dependencies(check, iterargs)
+
+  def _get_check_inputs(self, check, iterargs):
+    """ Returns a tuple (conditions, inputs) of everything `check` depends
+    on when executed with `iterargs`, directly or via its conditions.
+
+    `conditions` is a list of the conditions. `inputs` is a dict of the
+    values that are not computed by the profile, i.e. the values of the
+    iterargs and other runner values and the defaults of expected values.
+    Iterargs that are consumed via derived iterables are represented by
+    all of their values.
+    """
+    names = list(check.args)
+    names += [name for _, name in map(is_negated, check.conditions)]
+    return self._get_inputs(names, iterargs)
+
+  def _get_inputs(self, names, iterargs):
+    """ See `_get_check_inputs`, `names` are the arguments and conditions
+    of a check or condition.
+    """
+    iterargsDict = dict(iterargs)
+    conditions = {}
+    inputs = {}
+    seen = set()
+    # (name, derived) where derived means: reached via a derived iterable
+    names = [(name, False) for name in names]
+    while names:
+      name, derived = names.pop()
+      if (name, derived) in seen:
+        continue
+      seen.add((name, derived))
+      if name in self._values:
+        inputs[name] = self._values[name]
+        continue
+      name = self._profile.resolve_alias(name)
+      if name in self._values:
+        inputs[name] = self._values[name]
+        continue
+      nametype = self._profile.get_type(name, None)
+      if nametype == 'conditions':
+        condition = self._profile.conditions[name]
+        conditions[name] = condition
+        names += [(arg, derived) for arg in condition.args]
+      elif nametype == 'derived_iterables':
+        condition_name, _ = self._profile.get(name)
+        names.append((condition_name, True))
+      elif nametype == 'iterargs':
+        plural = self._profile.get(name)
+        if not derived and name in iterargsDict:
+          inputs[name] = self._values[plural][iterargsDict[name]]
+        else:
+          inputs[plural] = self._values[plural]
+      elif nametype == 'expected_values':
+        expected_value = self._profile.get(name)
+        if expected_value.has_default:
+          inputs[name] = expected_value.default
+    return list(conditions.values()), inputs
+
+  def get_result_key(self, check, iterargs):
+    """ Used by e.g. reporters: the result cache key of the check
+    execution, see `_get_result_cache_key`. """
+    return self._get_result_cache_key(check, iterargs)
+
+  def _set_result_key(self, check, iterargs, key):
+    """ Used by runners that execute the checks elsewhere, e.g. in worker
+    processes: the key computed there. """
+    if key is not None and self._result_cache is not None:
+      self._result_keys[(check.id, iterargs)] = key
+
+  def _get_result_cache_key(self, check, iterargs):
+    """ Returns the result cache key of the check execution or None if
+    the results of the check execution can't be cached.
+
+    The key is computed once per check execution.
+    """
+    if self._result_cache is None or check.volatile:
+      return None
+    identity = (check.id, iterargs)
+    if identity not in self._result_keys:
+      self._result_keys[identity] = self._compute_result_cache_key(check,
+                                                                   iterargs)
+    return self._result_keys[identity]
+
+  def _compute_result_cache_key(self, check, iterargs):
+    if self._profile.check_skip_filter:
+      # This could also be added to the key, but filtered checks are
+      # not executed anyways.
+      iterargsDict = {key:self.get_iterarg(key, index) for key, index in iterargs}
+      accepted, _ = self._profile.check_skip_filter(check.id, **iterargsDict)
+      if not accepted:
+        return None
+    conditions, inputs = self._get_check_inputs(check, iterargs)
+    if any(condition.volatile for condition in conditions):
+      return None
+    filename = self.get_iterarg(*iterargs[0]) if iterargs else None
+    return self._result_cache.get_key(check, conditions, inputs,
+                                      filename=filename)
+
+  def _run_check(self, check, iterargs, prepared=None):
+    """ Yields the events of one check execution, if possible replayed
+    from the result cache.
+
+    `prepared`: see `_execute_check`.
+    """
+    if self._timings is None:
+      events = self._get_check_events(check, iterargs, prepared)
+    else:
+      with self._timings.measure(TIMED_CHECK, check.id, iterargs):
+        # Run the check to its end here, otherwise the time the
+        # consumer of the events takes is measured as well.
+        events = list(self._get_check_events(check, iterargs, prepared))
+    for event in events:
+      yield event
+
+  def _get_check_events(self, check, iterargs, prepared=None):
+    key = self._get_result_cache_key(check, iterargs)
+    if key is None:
+      return self._execute_check(check, iterargs, prepared)
+    events = self._result_cache.get(key)
+    if self._timings is not None:
+      self._timings.count_cache(TIMED_CHECK, check.id, events is not None)
+    if events is None:
+      events = list(self._execute_check(check, iterargs, prepared))
+      self._result_cache.set(key, events)
+    return events
+
+  def _exec_check_timed(self, check, args):
+    """ Returns a tuple (seconds, sub results) of running the check
+    to its end. """
+    started = time.perf_counter()
+    sub_results = list(self._exec_check(check, args))
+    return time.perf_counter() - started, sub_results
+
+  def get_check_duration(self, check, iterargs):
+    """ Used by e.g. reporters: the seconds the check function took
+    when executed with `iterargs`, without evaluating its conditions.
+    None if it was not executed by this run, e.g. it was skipped or its
+    result was replayed from the result cache.
+    """
+    return self._durations.get((check.id, iterargs), None)
 
-    if not skipped:
-      skipped, args = self._get_check_dependencies(check, iterargs)
+  def _set_check_duration(self, check, iterargs, duration):
+    if duration is not None:
+      self._durations[(check.id, iterargs)] = duration
+
+  def _execute_check(self, check, iterargs, prepared=None):
+    """ Yields the events of one check execution.
+
+    `prepared` is optional, a tuple (skipped, (seconds, sub_results))
+    of a check that was prepared and executed in advance, see
+    `_run_io_bound`.
+    """
+    summary_status = None
+    if prepared is None:
+      skipped, args = self._prepare_check(check, iterargs)
+      timed = None if skipped else self._exec_check_timed(check, args)
+    else:
+      skipped, timed = prepared
+    if timed is not None:
+      duration, sub_results = timed
+      self._set_check_duration(check, iterargs, duration)
 
     # FIXME: check is not a message
     # so, to use it as a message, it should have a "message-interface"
@@ -573,7 +845,7 @@ class CheckRunner:
       # correctly.
       yield skipped
     else:
-      for sub_result in self._exec_check(check, args):
+      for sub_result in sub_results:
         status, _ = sub_result
         if summary_status is None or status >= summary_status:
           summary_status = status
@@ -604,38 +876,152 @@ class CheckRunner:
   #         yield event;
   #     yield ENDSECTION, None
 
+  def _get_order_arguments(self):
+    return dict(custom_order=self._custom_order
+              , explicit_checks=self._explicit_checks
+              , exclude_checks=self._exclude_checks
+              , major_iterarg=self._major_iterarg)
+
   @property
   def order(self):
     order = self._cache.get('order', None)
     if order is None:
-      order = []
       # section, check, iterargs = identity
-      for identity in self._profile.execution_order(self._iterargs,
-                                    custom_order=self._custom_order,
-                                    explicit_checks=self._explicit_checks,
-                                    exclude_checks=self._exclude_checks):
-        order.append(identity)
-      self._cache['order'] = order = tuple(order)
+      order = self._profile.execution_order(self._iterargs,
+                                            **self._get_order_arguments())
+      self._cache['order'] = order
     return order
 
+  def dump_order(self, file):
+    """ Write the execution order to `file` (opened for writing text)
+    as JSON, including what is needed to validate it in `load_order`.
+    """
+    key = self._profile.get_execution_order_key(self._iterargs,
+                                                **self._get_order_arguments())
+    json.dump({'key': key
+             , 'order': list(self._profile.serialize_order(self.order))}
+             , file)
+
+  def load_order(self, file):
+    """ Use the execution order from `file`, which was written by
+    `dump_order`, instead of computing it.
+
+    Returns False, if it was not computed for the same profile checks and
+    runner arguments, or if its identities don't match the iterargs of
+    their checks, the order is not used then.
+    """
+    key = self._profile.get_execution_order_key(self._iterargs,
+                                                **self._get_order_arguments())
+    try:
+      data = json.load(file)
+      if data['key'] != key:
+        return False
+      order = self._profile.deserialize_order(data['order'])
+    except (ValueError, KeyError, TypeError):
+      return False
+    for _, check, iterargs in order:
+      names = tuple(sorted(name for name, _ in iterargs))
+      if names != self._profile.get_iterargs(check) \
+              or any(not 0 <= index < self._iterargs[name]
+                                              for name, index in iterargs):
+        return False
+    self._cache['order'] = order
+    return True
+
   def check_order(self, order):
     """
       order must be a subset of self.order
     """
-    own_order = self.order
+    # Sections are not hashable.
+    own_order = set((check.id, iterargs) for _, check, iterargs in self.order)
     for item in order:
-      if item not in own_order:
+      _, check, iterargs = item
+      if (check.id, iterargs) not in own_order:
         raise ValueError(f'Order item {item} not found.')
     return order
 
   def run(self, order=None):
-    checkrun_summary = Counter()
-
     if order is not None:
       order = self.check_order(order)
     else:
       order = self.order
 
+    if self._io_threads and any(check.io_bound for _, check, _ in order):
+      events = self._run_io_bound(order)
+    else:
+      events = self._run_order(order, self._run_check)
+    for event in events:
+      yield event
+
+  def _run_io_bound(self, order):
+    """ Like `_run_order` but the checks flagged as `io_bound` are
+    started in a thread pool up to `io_lookahead` identities before their
+    turn, while all other checks run in this thread. The results are
+    still reported in execution order.
+
+    Dependencies, i.e. conditions, are resolved in this thread only,
+    the threads just call the checks with the prepared arguments.
+    """
+    positions = {(check.id, iterargs): position
+                        for position, (_, check, iterargs) in enumerate(order)}
+    # the io-bound identities that were not started yet, in order
+    pending = deque((position, check, iterargs)
+                        for position, (_, check, iterargs) in enumerate(order)
+                        if check.io_bound)
+    with ThreadPoolExecutor(max_workers=self._io_threads) as executor:
+      scheduled = {}
+      def schedule(position):
+        while pending and pending[0][0] <= position + self._io_lookahead:
+          _, check, iterargs = pending.popleft()
+          key = self._get_result_cache_key(check, iterargs)
+          if key is not None and self._result_cache.has(key):
+            # will be replayed by `_run_check`
+            continue
+          skipped, args = self._prepare_check(check, iterargs)
+          future = None if skipped else \
+                        executor.submit(self._exec_check_timed, check, args)
+          scheduled[(check.id, iterargs)] = skipped, future
+
+      def run_check(check, iterargs):
+        schedule(positions[(check.id, iterargs)])
+        item = scheduled.pop((check.id, iterargs), None)
+        if item is None:
+          return self._run_check(check, iterargs)
+        skipped, future = item
+        return self._run_check(check, iterargs, prepared=(skipped,
+                                      future.result() if future else None))
+
+      for event in self._run_order(order, run_check):
+        yield event
+
+  def _get_condition_releases(self, order):
+    """ Returns a dict {(check.id, iterargs): [iterarg, ...]} of the
+    iterargs, i.e. (name, index) tuples, that are not used by any later
+    identity of `order`. After running that check, conditions evaluated
+    with these iterargs are not needed anymore.
+
+    Checks that use these conditions via derived iterables (e.g. all
+    fonts of the family) will evaluate them again when needed.
+    """
+    last_uses = {}
+    for _, check, iterargs in order:
+      for iterarg in iterargs:
+        last_uses[iterarg] = (check.id, iterargs)
+    releases = {}
+    for iterarg, identity in last_uses.items():
+      releases.setdefault(identity, []).append(iterarg)
+    return releases
+
+  def _run_order(self, order, run_check):
+    """ Yields the events of the check runner protocol for `order`.
+
+    `run_check(check, iterargs)` must return an iterable of the
+    (status, message) sub results of that check, ending with ENDCHECK,
+    like `_run_check` does. This way the protocol framing stays the
+    same, no matter where and how the checks are actually executed.
+    """
+    checkrun_summary = Counter()
+
     # prepare: we'll have less ENDSECTION code in the actual run
     # also, we can prepare section_order tuples
     section = None
@@ -652,6 +1038,9 @@ class CheckRunner:
     if section is not None:
       section_orders.append((section, tuple(section_order)))
 
+    releases = self._get_condition_releases(order)
+    condition_cache = self._cache['conditions']
+
     # run
     yield START, order, (None, None, None)
     section = None
@@ -659,12 +1048,14 @@ class CheckRunner:
       section_summary = Counter()
       yield STARTSECTION, section_order, (section, None, None)
       for check, iterargs in section_order:
-        for status, message in self._run_check(check, iterargs):
+        for status, message in run_check(check, iterargs):
           yield status, message, (section, check, iterargs)
         # after _run_check the last status must be ENDCHECK
         assert status == ENDCHECK
         # message is the summary_status of the check when status is ENDCHECK
         section_summary[message.name] += 1
+        for iterarg in releases.get((check.id, iterargs), ()):
+          condition_cache.release(iterarg)
       yield ENDSECTION, section_summary, (section, None, None)
       checkrun_summary.update(section_summary)
     yield END, checkrun_summary, (None, None, None)
@@ -892,6 +1283,9 @@ def check_log_override(check, new_id, overrides, reason=None):
     , new_id
       # Untouched, the reason for this checks existence stays the same!
     , rationale = check.rationale
+    , io_bound = check.io_bound
+    , volatile = check.volatile
+    , tool_version = check.tool_version
       # the "Derived ..." part should be prominent, so we always see it
     , description = f'{check.description} (derived from {check.id})'
       # ONLY if there's a reason for derivation, otherwise will take
@@ -986,6 +1380,8 @@ class Profile:
       self._add_dict_to_namespace('expected_values', expected_values)
 
     self._check_registry = {}
+    # {key: order} see execution_order
+    self._execution_orders = {}
     self._sections = OrderedDict()
     if sections:
       for section in sections:
@@ -1386,12 +1782,94 @@ class Profile:
       # defined order, by clustering.
       yield check, tuple(args)
 
+  def get_execution_order_key(self, iterargs
+                      , custom_order=None
+                      , explicit_checks=None
+                      , exclude_checks=None
+                      , major_iterarg=None):
+    """ Returns a string that identifies the result of `execution_order`
+    for these arguments and the currently registered checks.
+    """
+    return json.dumps({
+        'iterargs': list(iterargs.items())
+      , 'custom_order': list(custom_order) if custom_order is not None else None
+      , 'explicit_checks': sorted(set(explicit_checks or ()))
+      , 'exclude_checks': sorted(set(exclude_checks or ()))
+      , 'major_iterarg': major_iterarg
+      , 'checks': [(str(section), [(check.id, self.get_iterargs(check))
+                                              for check in section.checks])
+                                    for section in self._sections.values()]
+    }, separators=(',', ':'))
+
   def execution_order(self, iterargs
                       , custom_order=None
                       , explicit_checks=None
-                      , exclude_checks=None):
+                      , exclude_checks=None
+                      , major_iterarg=None):
+    """
+      Returns the execution order, a tuple of (section, check, iterargs)
+      identities. It is computed once per profile and arguments, until
+      checks are added or removed.
+
+      iterargs: a dictionary {"singular": number of values}
+
+      major_iterarg: optional, the name of an iterarg, e.g. "font".
+      Then all checks that use this iterarg are grouped by its value,
+      across sections: all checks of the first font run before all
+      checks of the second font and so on. Checks that don't use it,
+      e.g. family checks, run at the end. Within these groups the
+      order is kept. That way the conditions of each value can be
+      released early (see `ConditionCache`).
+      NOTE: a section can then start and end more than once.
+    """
+    if custom_order is not None:
+      # could be an iterator, it is used once per section
+      custom_order = tuple(custom_order)
+    key = self.get_execution_order_key(iterargs
+                                     , custom_order=custom_order
+                                     , explicit_checks=explicit_checks
+                                     , exclude_checks=exclude_checks
+                                     , major_iterarg=major_iterarg)
+    order = self._execution_orders.get(key, None)
+    if order is None:
+      order = tuple(self._compute_execution_order(iterargs
+                                     , custom_order=custom_order
+                                     , explicit_checks=explicit_checks
+                                     , exclude_checks=exclude_checks
+                                     , major_iterarg=major_iterarg))
+      self._execution_orders[key] = order
+    return order
+
+  def _compute_execution_order(self, iterargs
+                      , custom_order=None
+                      , explicit_checks=None
+                      , exclude_checks=None
+                      , major_iterarg=None):
     # TODO: a custom_order per section may become necessary one day
     explicit_checks = set() if not explicit_checks else set(explicit_checks)
+    order = self._execution_order(iterargs
+                                , custom_order=custom_order
+                                , explicit_checks=explicit_checks
+                                , exclude_checks=exclude_checks)
+    if major_iterarg is None:
+      for identity in order:
+        yield identity
+      return
+
+    if major_iterarg not in iterargs:
+      raise SetupError(f'Unknown iterarg "{major_iterarg}", expected one of:'
+                       f' {", ".join(iterargs)}.')
+    def key(identity):
+      index = dict(identity[2]).get(major_iterarg, None)
+      return (1, 0) if index is None else (0, index)
+    # sorted is stable
+    for identity in sorted(order, key=key):
+      yield identity
+
+  def _execution_order(self, iterargs
+                      , custom_order=None
+                      , explicit_checks=None
+                      , exclude_checks=None):
     for _, section in self._sections.items():
       for check, section_iterargs in self._section_execution_order(section, iterargs
                                           , custom_order=custom_order
@@ -1400,6 +1878,7 @@ class Profile:
         yield (section, check, section_iterargs)
 
   def _register_check(self, section, func):
+    self._execution_orders.clear()
     other_section = self._check_registry.get(func.id, None)
     if other_section:
       other_check = other_section.get_check(func.id)
@@ -1417,6 +1896,7 @@ class Profile:
     return True
 
   def _unregister_check(self, section, check_id):
+    self._execution_orders.clear()
     assert section == self._check_registry[check_id], 'Registered section must match'
     del self._check_registry[check_id]
     return True
@@ -1447,6 +1927,7 @@ class Profile:
         raise SetupError(f'A section with key {section} is already registered')
       return
     self._sections[key] = section
+    self._execution_orders.clear()
     section.on_add_check(self._register_check)
     section.on_remove_check(self._unregister_check)
 
@@ -7,9 +7,11 @@ import os
 import sys
 from collections import OrderedDict
 
+from fontbakery import __version__
 from fontbakery.checkrunner import (
               distribute_generator
             , CheckRunner
+            , ConditionCache
             , ValueValidationError
             , Profile
             , get_module_profile
@@ -36,12 +38,21 @@ log_levels =  OrderedDict((s.name,s) for s in sorted((
 
 DEFAULT_LOG_LEVEL = INFO
 
+from fontbakery.multiproc import MultiprocessingRunner
+from fontbakery.distributed import DistributedRunner
+from fontbakery.resultcache import ResultCache
+from fontbakery.baseline import Baseline
+from fontbakery.resultstore import ResultStore
+from fontbakery.timings import Timings, write_report
 from fontbakery.reporters.terminal import TerminalReporter
 from fontbakery.reporters.serialize import SerializeReporter
+from fontbakery.reporters.jsonl import JSONLReporter
 from fontbakery.reporters.ghmarkdown import GHMarkdownReporter
 from fontbakery.reporters.html import HTMLReporter
+from fontbakery.reporters.resultstore import ResultStoreReporter
+from fontbakery.reporters.baseline import BaselineDiffReporter
 
-def ArgumentParser(profile, profile_arg=True):
+def ArgumentParser(profile, profile_arg=True, coordinator=False):
   argument_parser = argparse.ArgumentParser(description="Check TTF files"
                                                " against a profile.",
                                   formatter_class=argparse.RawTextHelpFormatter)
@@ -50,6 +61,9 @@ def ArgumentParser(profile, profile_arg=True):
     argument_parser.add_argument('profile',
         help='File/Module name, must define a fontbakery "profile".')
 
+  if coordinator:
+    add_coordinator_arguments(argument_parser)
+
 
   values_keys = profile.setup_argparse(argument_parser)
 
@@ -131,6 +145,14 @@ def ArgumentParser(profile, profile_arg=True):
                       metavar= 'JSON_FILE',
                       help='Write a json formatted report to JSON_FILE.')
 
+  argument_parser.add_argument('--jsonl', default=False,
+                      type=argparse.FileType('w', encoding="utf-8"),
+                      metavar='JSONL_FILE',
+                      help='Write the results to JSONL_FILE while the checks run,\n'
+                           'one JSON object per line and check. Unlike --json\n'
+                           'this doesn\'t keep the report in memory.\n'
+                           '`fontbakery fold-jsonl` turns it into a JSON report.')
+
   argument_parser.add_argument('--ghmarkdown', default=False, type=argparse.FileType('w'),
                       metavar= 'MD_FILE',
                       help='Write a GitHub-Markdown formatted report to MD_FILE.')
@@ -140,6 +162,65 @@ def ArgumentParser(profile, profile_arg=True):
                       metavar= 'HTML_FILE',
                       help='Write a HTML report to HTML_FILE.')
 
+  argument_parser.add_argument('--result-store',
+                      default=os.environ.get('FONTBAKERY_RESULT_STORE', None),
+                      metavar='STORE_FILE',
+                      help='Append the results of this run to the SQLite\n'
+                           'database STORE_FILE, one row per check, to query\n'
+                           'the results of many runs with\n'
+                           '`fontbakery query-results`.\n'
+                           '(default: $FONTBAKERY_RESULT_STORE, if set)')
+
+  argument_parser.add_argument('-j', '--jobs', default=1, type=int,
+                      metavar='JOBS',
+                      help='Run the checks in JOBS parallel worker processes.\n'
+                           'All checks of one set of ITERATED_ARGS (e.g. one font)\n'
+                           'run in the same worker. Use 0 for one worker per CPU.\n'
+                           '(default: 1, no parallel execution)')
+
+  argument_parser.add_argument('--io-threads', default=4, type=int,
+                      metavar='THREADS',
+                      help='Run checks that mostly wait for subprocesses or the\n'
+                           'network concurrently in THREADS threads, while the\n'
+                           'other checks are executed. Use 0 to disable.\n'
+                           '(default: 4)')
+
+  argument_parser.add_argument('--cache-dir',
+                      default=os.environ.get('FONTBAKERY_CACHE_DIR', None),
+                      metavar='CACHE_DIR',
+                      help='Store the check results in CACHE_DIR and reuse\n'
+                           'them in later runs, as long as the checked files,\n'
+                           'the checks and Font Bakery did not change.\n'
+                           '(default: $FONTBAKERY_CACHE_DIR, if set)')
+
+  argument_parser.add_argument('--no-cache', action='store_true',
+                      help='Neither use nor update the result cache.')
+
+  argument_parser.add_argument('--baseline', default=None,
+                      type=argparse.FileType('r', encoding="utf-8"),
+                      metavar='JSON_FILE',
+                      help='Compare the results to the JSON report (--json) of a\n'
+                           'previous run. Checks whose inputs did not change\n'
+                           '(the checked files, the check and its conditions)\n'
+                           'are not executed again, their results are taken\n'
+                           'from JSON_FILE. The changed results are listed at\n'
+                           'the end.')
+
+  argument_parser.add_argument('--profile-report', default=None,
+                      type=argparse.FileType('w'), metavar='FILE',
+                      help='Write the time spent per check, per condition and\n'
+                           'per ITERATED_ARG (e.g. font) to FILE, as CSV if\n'
+                           'FILE ends with ".csv", otherwise as JSON. The JSON\n'
+                           'report (--json) will contain the timings as well.\n'
+                           'Memory peaks are recorded if tracemalloc is tracing\n'
+                           '(e.g. PYTHONTRACEMALLOC=1), on Python 3.9 and later.')
+
+  argument_parser.add_argument('--condition-cache-size', default=None,
+                      type=int, metavar='ENTRIES',
+                      help='Keep at most ENTRIES evaluated conditions (e.g.\n'
+                           'loaded fonts) in memory, dropping the least\n'
+                           'recently used ones. (default: unlimited)')
+
   iterargs = sorted(profile.iterargs.keys())
 
   gather_by_choices = iterargs + ['*check']
@@ -172,12 +253,76 @@ def ArgumentParser(profile, profile_arg=True):
                       'collection against a selection of checks picked with `--checkid`.'
                       ''.format(', '.join(iterargs))
                       )
+
+  argument_parser.add_argument('--order-major', default=None,
+                      metavar='ITERATED_ARG', choices=iterargs,
+                      help='Run all checks of the first ITERATED_ARG (e.g. font)\n'
+                      'before the checks of the next one, across all sections.\n'
+                      'Checks that don\'t use ITERATED_ARG (e.g. family checks)\n'
+                      'run at the end. The conditions (e.g. loaded fonts) of each\n'
+                      'ITERATED_ARG are dropped as soon as its checks are done,\n'
+                      'which saves memory when checking many files.\n'
+                      'One of: {}'.format(', '.join(iterargs))
+                      )
+
+  argument_parser.add_argument('--order-file', default=None, metavar='FILE',
+                      help='Load the execution order from FILE, if it was\n'
+                      'computed for the same checks and arguments. Otherwise\n'
+                      'compute it and save it to FILE. Saves time when\n'
+                      'running the same checks many times.')
   return argument_parser, values_keys
 
 
 class ArgumentParserError(Exception): pass
 
 
+def get_authkey(args):
+  if not args.authkey:
+    sys.exit('An authkey is required, use --authkey or set'
+             ' $FONTBAKERY_AUTHKEY.')
+  return args.authkey.encode('utf-8')
+
+
+def add_coordinator_arguments(argument_parser):
+  argument_parser.add_argument('--listen', required=True, metavar='ADDRESS',
+                      help='Hand out the checks to workers (`fontbakery worker`)\n'
+                           'connecting to ADDRESS, either HOST:PORT or the path\n'
+                           'of a unix domain socket.')
+  argument_parser.add_argument('--authkey',
+                      default=os.environ.get('FONTBAKERY_AUTHKEY', None),
+                      help='Shared secret of coordinator and workers.\n'
+                           '(default: $FONTBAKERY_AUTHKEY)')
+  argument_parser.add_argument('--font-dir', default=None, metavar='DIR',
+                      help='Workers get the font paths relative to DIR and\n'
+                           'look for them in their own --font-dir.\n'
+                           '(default: the common directory of all fonts)')
+
+
+def get_worker_setup(args, values):
+  """ The data the coordinator sends to each worker, see
+  `fontbakery.commands.worker`. """
+  values = dict(values)
+  fonts = [os.path.abspath(font) for font in values.get('fonts', [])]
+  font_dir = args.font_dir
+  if font_dir is None:
+    font_dir = os.path.commonpath([os.path.dirname(font) for font in fonts]) \
+                                                      if fonts else os.getcwd()
+  font_dir = os.path.abspath(font_dir)
+  values['fonts'] = [os.path.relpath(font, font_dir) for font in fonts]
+  return {'profile': args.profile
+        , 'values': values
+        , 'font_dir': font_dir}
+
+
+def load_or_dump_order(runner, filename):
+  if os.path.exists(filename):
+    with open(filename) as f:
+      if runner.load_order(f):
+        return
+  with open(filename, 'w') as f:
+    runner.dump_order(f)
+
+
 def get_module_from_file(filename):
   # filename = 'my/path/to/file.py'
   # module_name = 'file_module.file_py'
@@ -222,14 +367,17 @@ def get_profile():
 # CheckRunner.
 runner_factory = CheckRunner
 
-def main(profile=None, values=None):
+def main(profile=None, values=None, coordinator=False):
   # profile can be injected by e.g. check-googlefonts injects it's own profile
+  # coordinator: used by `fontbakery coordinator` to distribute the checks
   add_profile_arg = False
   if profile is None:
     profile = get_profile()
     add_profile_arg = True
 
-  argument_parser, values_keys = ArgumentParser(profile, profile_arg=add_profile_arg)
+  argument_parser, values_keys = ArgumentParser(profile
+                                              , profile_arg=add_profile_arg
+                                              , coordinator=coordinator)
   args = argument_parser.parse_args()
 
   # The default Windows Terminal just displays the escape codes. The argument
@@ -278,18 +426,60 @@ def main(profile=None, values=None):
       if hasattr(args, key):
         values_[key] = getattr(args, key)
 
+  runner_kwds = {'io_threads': args.io_threads
+               , 'condition_cache': ConditionCache(args.condition_cache_size)}
+  if args.cache_dir and not args.no_cache:
+    runner_kwds['result_cache'] = ResultCache(args.cache_dir
+                                            , salt=__version__)
+  if args.baseline:
+    import json
+    try:
+      baseline_doc = json.load(args.baseline)
+    except ValueError as e:
+      sys.exit(f"Can't read the baseline report '{args.baseline.name}': {e}")
+    cache_dir = runner_kwds['result_cache'].directory \
+                            if 'result_cache' in runner_kwds else None
+    # the values of the iterargs, like `runner.iterargs`
+    filenames = [value for plural in profile.iterargs.values()
+                       for value in values_.get(plural, ())]
+    runner_kwds['result_cache'] = Baseline(baseline_doc
+                                         , directory=cache_dir
+                                         , salt=__version__
+                                         , filenames=filenames)
+  elif 'result_cache' not in runner_kwds and (args.json or args.jsonl):
+    # Only to record the result keys in the report, which makes it
+    # usable as a --baseline.
+    runner_kwds['result_cache'] = ResultCache(None, salt=__version__)
+  if args.profile_report:
+    runner_kwds['timings'] = Timings()
+  if coordinator:
+    runner_class = DistributedRunner
+    runner_kwds.update(address=args.listen
+                     , authkey=get_authkey(args)
+                     , setup=get_worker_setup(args, values_))
+  elif args.jobs != 1:
+    runner_class = MultiprocessingRunner
+    runner_kwds['jobs'] = args.jobs
+  else:
+    runner_class = CheckRunner
+
   try:
-    runner = CheckRunner(profile
+    runner = runner_class(profile
                         , values=values_
                         , custom_order=args.order
+                        , major_iterarg=args.order_major
                         , explicit_checks=args.checkid
                         , exclude_checks=args.exclude_checkid
+                        , **runner_kwds
                         )
   except ValueValidationError as e:
     print(e)
     argument_parser.print_usage()
     sys.exit(1)
 
+  if args.order_file:
+    load_or_dump_order(runner, args.order_file)
+
   # the most verbose loglevel wins
   loglevel = min(args.loglevels) if args.loglevels else DEFAULT_LOG_LEVEL
   tr = TerminalReporter(runner=runner, is_async=False
@@ -309,19 +499,39 @@ def main(profile=None, values=None):
     sr = SerializeReporter(runner=runner, collect_results_by=args.gather_by)
     reporters.append(sr.receive)
 
+  if args.jsonl:
+    jr = JSONLReporter(args.jsonl, runner=runner,
+                       collect_results_by=args.gather_by)
+    reporters.append(jr.receive)
+
   if args.ghmarkdown:
     mdr = GHMarkdownReporter(loglevels=args.loglevels,
+                             file=args.ghmarkdown,
                              runner=runner,
                              collect_results_by=args.gather_by)
     reporters.append(mdr.receive)
 
   if args.html:
     hr = HTMLReporter(loglevels=args.loglevels,
+                      file=args.html,
                       runner=runner,
                       collect_results_by=args.gather_by)
     reporters.append(hr.receive)
 
-  distribute_generator(runner.run(), reporters)
+  if args.baseline:
+    dr = BaselineDiffReporter(runner_kwds['result_cache'], runner=runner)
+    reporters.append(dr.receive)
+
+  if args.result_store:
+    store = ResultStore(args.result_store)
+    rsr = ResultStoreReporter(store, version=__version__, runner=runner)
+    reporters.append(rsr.receive)
+
+  try:
+    distribute_generator(runner.run(), reporters)
+  finally:
+    if args.result_store:
+      store.close()
 
   if args.json:
     import json
@@ -329,16 +539,39 @@ def main(profile=None, values=None):
     print("A report in JSON format has been"
           " saved to '{}'".format(args.json.name))
 
+  if args.jsonl:
+    print("A report in JSON Lines format has been"
+          f" saved to '{args.jsonl.name}'")
+
   if args.ghmarkdown:
-    args.ghmarkdown.write(mdr.get_markdown())
     print("A report in GitHub Markdown format which can be useful\n"
           " for posting issues on a GitHub issue tracker has been\n"
           " saved to '{}'".format(args.ghmarkdown.name))
 
   if args.html:
-    args.html.write(hr.get_html())
     print(f"A report in HTML format has been saved to '{args.html.name}'")
 
+  if args.result_store:
+    print(f"The results have been added to '{args.result_store}'"
+          f" as run {rsr.run_id}")
+
+  if args.baseline:
+    print(f"{dr.reused} of {len(runner.order)} check results were reused"
+          f" from the baseline '{args.baseline.name}'.")
+    if dr.transitions:
+      print("Changed results:")
+      for check_id, filename, old, new in dr.transitions:
+        target = f" {filename}" if filename is not None else ""
+        print(f"  {check_id}{target}: {old or '(new)'} -> {new}")
+    else:
+      print("No results changed.")
+
+  if args.profile_report:
+    write_report(runner.timings.get_summary(runner.get_iterarg)
+               , args.profile_report)
+    print("A report of the timings has been"
+          f" saved to '{args.profile_report.name}'")
+
   # Fail and error let the command fail
   return 1 if tr.worst_check_status in (ERROR, FAIL) else 0
 
@@ -0,0 +1,16 @@
+#!/usr/bin/env python
+"""
+Run the checks of a profile distributed to workers (`fontbakery worker`),
+e.g. on other machines, and report the results like `fontbakery
+check-profile`, which takes the same arguments, plus --listen.
+"""
+import sys
+
+from functools import partial
+from fontbakery.commands.check_profile import main as super_main
+
+main = partial(super_main, coordinator=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+"""Fold a JSON Lines report (`--jsonl`) into a JSON report, the same
+document `--json` writes."""
+import argparse
+import json
+import sys
+
+from fontbakery.reporters.jsonl import fold
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('jsonl', type=argparse.FileType('r', encoding='utf-8'),
+                        metavar='JSONL_FILE',
+                        help='The report written by `--jsonl JSONL_FILE`.')
+    parser.add_argument('-o', '--output', default=sys.stdout,
+                        type=argparse.FileType('w'), metavar='JSON_FILE',
+                        help='Write the JSON report to JSON_FILE.'
+                             ' (default: stdout)')
+    args = parser.parse_args()
+
+    try:
+        doc = fold(args.jsonl)
+    except ValueError as e:
+        sys.exit(f'Can\'t fold {args.jsonl.name}: {e}')
+    json.dump(doc, args.output, sort_keys=True, indent=4)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
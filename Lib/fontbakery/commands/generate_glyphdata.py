@@ -1,7 +1,8 @@
-"""Generate FontBakery's desired_glyph_data.json file.
+"""Generate FontBakery's data/desired_glyph_data.json file.
 
 The desired_glyph_data.json file contains the 'recommended' countour count
-for encoded glyphs. The contour counts are derived from fonts which were
+for encoded glyphs, indexed by codepoint and by glyph name, as read by
+`fontbakery.glyphdata.get_desired_glyph_contours`. The contour counts are derived from fonts which were
 chosen for their quality and unique design decisions for particular glyphs.
 
 Why make this?
@@ -16,22 +17,13 @@ In the future, additional glyph data can be included. A good addition would
 be the 'recommended' anchor counts for each glyph.
 """
 import json
-import os
 import sys
 
+from fontbakery.glyphdata import GLYPHDATA_PATH
 from fontbakery.utils import download_file, get_font_glyph_data
 from fontTools.ttLib import TTFont
 
 
-class JsonSetEncoder(json.JSONEncoder):
-    """Serialise Set objects for json module."""
-
-    def default(self, obj):  # pylint: disable=arguments-differ,method-hidden
-        if isinstance(obj, set):
-            return list(obj)
-        return json.JSONEncoder.default(self, obj)
-
-
 def collate_fonts_data(fonts_data):
     """Collate individual fonts data into a single glyph data list."""
     glyphs = {}
@@ -48,6 +40,37 @@ def collate_fonts_data(fonts_data):
     return list(glyphs.values())
 
 
+def in_PUA_range(codepoint):
+    """
+      In Unicode, a Private Use Area (PUA) is a range of code points that,
+      by definition, will not be assigned characters by the Unicode Consortium.
+      Three private use areas are defined:
+        one in the Basic Multilingual Plane (U+E000–U+F8FF),
+        and one each in, and nearly covering, planes 15 and 16
+        (U+F0000–U+FFFFD, U+100000–U+10FFFD).
+    """
+    return (codepoint >= 0xE000 and codepoint <= 0xF8FF) or \
+           (codepoint >= 0xF0000 and codepoint <= 0xFFFFD) or \
+           (codepoint >= 0x100000 and codepoint <= 0x10FFFD)
+
+
+def index_glyph_data(glyph_data):
+    """Index a glyph data list by codepoint and by glyph name.
+
+    Since the glyphs in PUA ranges have unspecified meaning, it doesn't
+    make sense to have an expected contour count for their codepoints,
+    so these are only indexed by name.
+    """
+    by_codepoint = {}
+    by_name = {}
+    for glyph in glyph_data:
+        contours = sorted(glyph['contours'])
+        by_name[glyph['name']] = contours
+        if not in_PUA_range(glyph['unicode']):
+            by_codepoint[glyph['unicode']] = contours
+    return {'by_codepoint': by_codepoint, 'by_name': by_name}
+
+
 def main():
     git_ofl_prefix = 'http://github.com/google/fonts/raw/master/ofl/'
     git_ufl_prefix = 'http://github.com/google/fonts/raw/master/ufl/'
@@ -90,12 +113,10 @@ def main():
     print('Collating font data into glyph data file')
     glyph_data = collate_fonts_data(fonts_data)
 
-    script_path = os.path.dirname(__file__)
-    glyph_data_path = os.path.join(script_path, '..', 'desired_glyph_data.json')
-
-    print(f'Saving to {glyph_data_path}')
-    with open(glyph_data_path, 'w') as glyph_file:
-        json.dump(glyph_data, glyph_file, indent=4, cls=JsonSetEncoder)
+    print(f'Saving to {GLYPHDATA_PATH}')
+    with open(GLYPHDATA_PATH, 'w') as glyph_file:
+        json.dump(index_glyph_data(glyph_data), glyph_file,
+                  separators=(',', ':'), sort_keys=True)
     print('done')
 
 
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Query the check results stored with `--result-store`.
+
+  runs         list the stored runs and their results
+  trend        the results of each run, e.g. of one check and font:
+               query-results results.sqlite trend -c CHECK_ID -f Family-
+  regressions  the results that got worse from one run to another,
+               by default from the second latest to the latest run,
+               exits with status 1 if there are any
+"""
+import argparse
+import sys
+
+from fontbakery.resultstore import ResultStore
+
+STATUSES = ('ERROR', 'FAIL', 'WARN', 'INFO', 'SKIP', 'PASS', 'DEBUG')
+
+
+def format_counts(counter):
+    return '  '.join(f'{status} {counter[status]}'
+                     for status in STATUSES if counter[status])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                          formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('store', metavar='STORE_FILE',
+                        help='The SQLite file written by `--result-store`.')
+    subparsers = parser.add_subparsers(dest='query')
+    # not as argument of add_subparsers, which is new in Python 3.7
+    subparsers.required = True
+
+    subparsers.add_parser('runs', help='List the stored runs.')
+
+    def add_filters(subparser):
+        subparser.add_argument('-c', '--checkid', default=None,
+                               help='Only results of this check id.')
+        subparser.add_argument('-f', '--font', default=None,
+                               help='Only results of files whose name'
+                                    ' contains FONT.')
+
+    trend = subparsers.add_parser('trend',
+                                  help='The results of each run.')
+    add_filters(trend)
+
+    regressions = subparsers.add_parser('regressions',
+                        help='The results that got worse between two runs.')
+    add_filters(regressions)
+    regressions.add_argument('--old', type=int, default=None, metavar='RUN',
+                        help='The id of the run to compare with.'
+                             ' (default: the run before --new)')
+    regressions.add_argument('--new', type=int, default=None, metavar='RUN',
+                        help='The id of the run to check for regressions.'
+                             ' (default: the latest finished run)')
+    args = parser.parse_args()
+
+    store = ResultStore(args.store)
+    try:
+        if args.query == 'runs':
+            for run in store.get_runs():
+                state = '' if run['finished'] else ' (not finished)'
+                print(f"{run['id']:>5}  {run['started']}  {run['version']}"
+                      f"{state}  {format_counts(run['results'])}")
+        elif args.query == 'trend':
+            for run_id, started, counter in store.get_trend(args.checkid,
+                                                            args.font):
+                if counter:
+                    print(f'{run_id:>5}  {started}  {format_counts(counter)}')
+        else:
+            regressions = store.get_regressions(args.old, args.new,
+                                                args.checkid, args.font)
+            for check_id, filename, old, new, code in regressions:
+                code = f' [{code}]' if code else ''
+                print(f'{check_id}  {filename or "(family)"}'
+                      f'  {old} -> {new}{code}')
+            return 1 if regressions else 0
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
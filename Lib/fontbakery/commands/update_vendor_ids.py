@@ -0,0 +1,79 @@
+"""Update FontBakery's data/microsoft_vendor_ids.json file.
+
+The file maps the vendor IDs registered with Microsoft, padded with
+spaces to 4 characters, to the vendor names, as read by
+`fontbakery.vendorids.get_registered_vendor_ids`. It is parsed from
+Microsoft's vendor list web page, of which a copy is kept in
+data/fontbakery-microsoft-vendorlist.cache. Use --download to update
+that copy first.
+"""
+import argparse
+import json
+import sys
+
+from fontbakery.vendorids import VENDORLIST_CACHE_PATH, VENDOR_IDS_PATH
+
+VENDORLIST_URL = 'https://docs.microsoft.com/en-us/typography/vendors/'
+
+
+def parse_vendorlist(content):
+    """Returns a dict of space padded vendor ID to vendor name parsed from
+    the HTML of Microsoft's vendor list web page."""
+    from bs4 import BeautifulSoup
+
+    vendor_ids = {}
+    soup = BeautifulSoup(content, 'html.parser')
+
+    IDs = [chr(c + ord('a')) for c in range(ord('z') - ord('a') + 1)]
+    IDs.append("0-9-")
+
+    for section_id in IDs:
+        section = soup.find('h2', {'id': section_id})
+        table = section.find_next_sibling('table')
+        if not table:
+            continue
+
+        for row in table.find_all('tr'):
+            cells = row.find_all('td')
+            if not cells:
+                continue
+
+            labels = [label for label in cells[1].stripped_strings]
+
+            # pad the code to make sure it is a 4 char string,
+            # otherwise eg "CF  " will not be matched to "CF"
+            code = cells[0].string.strip()
+            code = code + (4 - len(code)) * ' '
+            vendor_ids[code] = labels[0]
+    return vendor_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                          formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--download', action='store_true',
+                        help=f'Update the copy of {VENDORLIST_URL} first.')
+    args = parser.parse_args()
+
+    if args.download:
+        import requests
+        print(f'Downloading {VENDORLIST_URL}')
+        response = requests.get(VENDORLIST_URL)
+        response.raise_for_status()
+        with open(VENDORLIST_CACHE_PATH, 'w', encoding='utf-8') as f:
+            f.write(response.text)
+
+    print(f'Parsing {VENDORLIST_CACHE_PATH}')
+    with open(VENDORLIST_CACHE_PATH, encoding='utf-8') as f:
+        vendor_ids = parse_vendorlist(f.read())
+
+    print(f'Saving {len(vendor_ids)} vendor IDs to {VENDOR_IDS_PATH}')
+    with open(VENDOR_IDS_PATH, 'w', encoding='utf-8') as f:
+        json.dump(vendor_ids, f, ensure_ascii=False, indent=0,
+                  sort_keys=True)
+        f.write('\n')
+    print('done')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""
+Run the checks handed out by a coordinator (`fontbakery coordinator`).
+"""
+import argparse
+import os
+import sys
+
+from fontbakery import __version__
+from fontbakery.checkrunner import CheckRunner, get_module_profile
+from fontbakery.commands.check_profile import get_module, get_authkey
+from fontbakery.distributed import run_worker
+from fontbakery.resultcache import ResultCache
+
+
+def get_runner_factory(args):
+  def runner_factory(setup):
+    profile = get_module_profile(get_module(setup['profile']))
+    font_dir = args.font_dir or setup['font_dir']
+    values = dict(setup['values'])
+    values['fonts'] = [os.path.join(font_dir, font) for font in values['fonts']]
+    result_cache = None
+    if args.cache_dir:
+      result_cache = ResultCache(args.cache_dir, salt=__version__)
+    return CheckRunner(profile, values=values, result_cache=result_cache)
+  return runner_factory
+
+
+def main():
+  argument_parser = argparse.ArgumentParser(description="Run the checks"
+                                   " handed out by `fontbakery coordinator`.",
+                                   formatter_class=argparse.RawTextHelpFormatter)
+  argument_parser.add_argument('address',
+                      help='Address of the coordinator, HOST:PORT or the path\n'
+                           'of a unix domain socket.')
+  argument_parser.add_argument('--authkey',
+                      default=os.environ.get('FONTBAKERY_AUTHKEY', None),
+                      help='Shared secret of coordinator and workers.\n'
+                           '(default: $FONTBAKERY_AUTHKEY)')
+  argument_parser.add_argument('--font-dir', default=None, metavar='DIR',
+                      help='Directory of the fonts, the coordinator sends\n'
+                           'their paths relative to its own --font-dir.\n'
+                           '(default: the font directory of the coordinator)')
+  argument_parser.add_argument('--timeout', default=60, type=float,
+                      metavar='SECONDS',
+                      help='Keep trying to connect for SECONDS. (default: 60)')
+  argument_parser.add_argument('--cache-dir',
+                      default=os.environ.get('FONTBAKERY_CACHE_DIR', None),
+                      metavar='CACHE_DIR',
+                      help='Use the result cache in CACHE_DIR, see\n'
+                           '`fontbakery check-profile --cache-dir`.')
+  args = argument_parser.parse_args()
+  run_worker(args.address, get_authkey(args), get_runner_factory(args)
+           , timeout=args.timeout)
+  return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
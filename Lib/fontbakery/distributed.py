@@ -0,0 +1,207 @@
+"""
+Font Bakery distributed runs the checks of a CheckRunner in worker
+processes that connect over a socket, e.g. from other machines.
+
+The coordinator (DistributedRunner) computes the execution order and
+hands out shards of it: all identities that run with the same iterargs,
+just like `fontbakery.multiproc`. A worker (`run_worker`) creates its own
+runner from the `setup` data it receives from the coordinator, runs the
+identities of each shard and streams the results back. The coordinator
+re-emits them in execution order, so reporters can't tell the difference
+to a serial run. If a worker disconnects, its unfinished identities are
+handed to the next worker. Workers are only dismissed when no shard is
+left, neither pending nor running on another worker.
+
+Messages are sent via `multiprocessing.connection`, authenticated with
+a shared `authkey`. Identities are transferred as
+`Profile.serialize_identity` strings, results like in multiproc.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+import time
+import logging
+import threading
+from queue import Queue, Empty
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+
+from fontbakery.checkrunner import CheckRunner
+from fontbakery.multiproc import (get_shards,
+                                  serialize_result,
+                                  deserialize_result)
+
+
+def parse_address(address):
+  """ "host:port" is a TCP address, anything else the path of a unix
+  domain socket. """
+  host, sep, port = address.rpartition(':')
+  if sep and port.isdigit():
+    return (host or 'localhost', int(port))
+  return address
+
+
+class DistributedRunner(CheckRunner):
+  def __init__(self, *args, address, authkey, setup=None, **kwds):
+    """
+    address: where workers connect, see `parse_address`
+    authkey: bytes, the shared secret of coordinator and workers
+    setup: picklable data sent to each worker, it is passed to the
+           `runner_factory` of `run_worker`.
+    """
+    super(DistributedRunner, self).__init__(*args, **kwds)
+    self._address = parse_address(address) if isinstance(address, str) \
+                                                                else address
+    self._authkey = authkey
+    self._setup = setup
+
+  def run(self, order=None):
+    if order is not None:
+      order = self.check_order(order)
+    else:
+      order = self.order
+
+    pending = Queue()
+    for shard in get_shards(order):
+      pending.put([(index, self._profile.serialize_identity(order[index]))
+                                                          for index in shard])
+    results = {}
+    # notified when results arrive and when shards are done or returned
+    arrived = threading.Condition()
+    # the number of shards handed to workers that are not done yet
+    in_flight = 0
+
+    def get_shard():
+      """ The next shard or None when all are done. While other workers
+      are still running shards, wait: they may return them unfinished. """
+      nonlocal in_flight
+      with arrived:
+        while True:
+          try:
+            shard = pending.get_nowait()
+          except Empty:
+            if not in_flight:
+              return None
+            arrived.wait()
+            continue
+          in_flight += 1
+          return shard
+
+    def serve(connection):
+      nonlocal in_flight
+      shard = []
+      # the indexes of the current shard whose results arrived
+      received = set()
+      try:
+        connection.send(('setup', self._setup))
+        while True:
+          connection.recv() # ready
+          shard = get_shard()
+          if shard is None:
+            connection.send(('done', None))
+            return
+          connection.send(('work', shard))
+          received = set()
+          for _ in shard:
+            _, index, events, duration, key = connection.recv()
+            with arrived:
+              results[index] = events, duration, key
+              received.add(index)
+              arrived.notify_all()
+          with arrived:
+            shard = []
+            in_flight -= 1
+            arrived.notify_all()
+      except (EOFError, OSError) as error:
+        logging.warning(f'Lost a worker: {error!r}')
+        with arrived:
+          if shard:
+            unfinished = [item for item in shard if item[0] not in received]
+            if unfinished:
+              pending.put(unfinished)
+              logging.warning(f'{len(unfinished)} checks of the lost worker'
+                              ' will be run by the next available worker.')
+            in_flight -= 1
+            arrived.notify_all()
+      finally:
+        connection.close()
+
+    listener = Listener(self._address, authkey=self._authkey)
+    finished = threading.Event()
+    def accept():
+      while True:
+        try:
+          connection = listener.accept()
+        except (OSError, EOFError, AuthenticationError) as error:
+          # closed or authentication failed
+          if finished.is_set():
+            return
+          logging.warning(f'Refused a worker: {error!r}')
+          continue
+        threading.Thread(target=serve, args=(connection, ), daemon=True).start()
+    threading.Thread(target=accept, daemon=True).start()
+    logging.info(f'Waiting for workers at {listener.address}.')
+
+    indexes = {(check.id, iterargs): index
+                    for index, (_, check, iterargs) in enumerate(order)}
+    def run_check(check, iterargs):
+      index = indexes[(check.id, iterargs)]
+      with arrived:
+        while index not in results:
+          arrived.wait()
+        events, duration, key = results.pop(index)
+      self._set_check_duration(check, iterargs, duration)
+      self._set_result_key(check, iterargs, key)
+      return map(deserialize_result, events)
+
+    try:
+      for event in self._run_order(order, run_check):
+        yield event
+    finally:
+      finished.set()
+      listener.close()
+
+
+def run_worker(address, authkey, runner_factory, timeout=60):
+  """ Connect to a DistributedRunner at `address` and run the checks it
+  hands out until it's done.
+
+  runner_factory: a function, called with the `setup` of the coordinator,
+                  returning the CheckRunner to run the checks with.
+  timeout: seconds to retry connecting, e.g. when the worker starts
+           before the coordinator.
+  """
+  address = parse_address(address) if isinstance(address, str) else address
+  started = time.time()
+  while True:
+    try:
+      connection = Client(address, authkey=authkey)
+      break
+    except (ConnectionRefusedError, FileNotFoundError):
+      if time.time() - started > timeout:
+        raise
+      time.sleep(1)
+
+  with connection:
+    _, setup = connection.recv()
+    runner = runner_factory(setup)
+    profile = runner.profile
+    while True:
+      connection.send(('ready', None))
+      message, shard = connection.recv()
+      if message == 'done':
+        return
+      for index, identity in shard:
+        (_, check, iterargs), = profile.deserialize_order([identity])
+        events = [serialize_result(status, message)
+                          for status, message in runner._run_check(check, iterargs)]
+        connection.send(('result', index, events,
+                         runner.get_check_duration(check, iterargs),
+                         runner.get_result_key(check, iterargs)))
+      # The shard is done, no other shard uses the same iterargs.
+      runner._cache['conditions'].clear()
@@ -46,7 +46,22 @@ class FontsProfile(Profile):
         action=MergeAction,
         help='font file path(s) to check. Wildcards like *.ttf are allowed.')
 
-    return ('fonts', )
+    if 'ttx_roundtrip_tables' not in self.expected_values:
+      return ('fonts', )
+
+    import os
+    def get_tags(tags):
+      return [tag.strip() for tag in tags.split(',') if tag.strip()] or None
+
+    argument_parser.add_argument(
+        '--ttx-roundtrip-tables',
+        metavar='TAGS',
+        type=get_tags,
+        default=get_tags(os.environ.get('FONTBAKERY_TTX_ROUNDTRIP_TABLES', '')),
+        help='Comma separated table tags, e.g. "name,OS/2,post", the\n'
+             'ttx-roundtrip check round-trips only these tables instead\n'
+             'of the whole font. (default: $FONTBAKERY_TTX_ROUNDTRIP_TABLES)')
+    return ('fonts', 'ttx_roundtrip_tables')
 
   def get_family_checks(self):
     family_checks = self.get_checks_by_dependencies('ttFonts')
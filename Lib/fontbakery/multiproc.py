@@ -0,0 +1,170 @@
+"""
+Font Bakery multiproc runs the checks of a CheckRunner in a pool of
+worker processes.
+
+The execution order is sharded by iterargs, i.e. all checks that run
+with the same iterargs (e.g. the same font) are executed by the same
+worker, so the conditions cache of each shard lives in one worker only.
+The results are collected in the main process and re-emitted in the
+original order, so the events keep the check runner protocol and
+reporters can't tell the difference to a serial run.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+import os
+import logging
+import multiprocessing
+from collections import OrderedDict
+
+from fontbakery.checkrunner import CheckRunner, Status
+from fontbakery.message import Message
+
+
+class RemoteMessage:
+  """ Stand-in for a check message that can't be transferred as it is,
+  e.g. an exception with a traceback. It keeps what reporters use:
+  the string representation and, if present, `code` and `traceback`.
+  """
+  def __init__(self, text, code=None, traceback=None):
+    self._text = text
+    if code is not None:
+      self.code = code
+    if traceback is not None:
+      self.traceback = traceback
+
+  def __str__(self):
+    return self._text
+
+  __repr__ = __str__
+
+
+def serialize_message(message):
+  """ Return a JSON compatible representation of a check log message. """
+  if isinstance(message, Status):
+    return {'status': [message.name, message.weight]}
+  if isinstance(message, Message):
+    return {'message': message.getData()}
+  if message is None or isinstance(message, str):
+    return {'text': message}
+  data = {'remote': str(message)}
+  for attribute in ('code', 'traceback'):
+    if getattr(message, attribute, None) is not None:
+      data[attribute] = getattr(message, attribute)
+  return data
+
+
+def deserialize_message(data):
+  if 'status' in data:
+    return Status(*data['status'])
+  if 'message' in data:
+    return Message(data['message']['code'], data['message']['message'])
+  if 'text' in data:
+    return data['text']
+  return RemoteMessage(data['remote']
+                     , code=data.get('code', None)
+                     , traceback=data.get('traceback', None))
+
+
+def serialize_result(status, message):
+  return (status.name, status.weight, serialize_message(message))
+
+
+def deserialize_result(result):
+  name, weight, message = result
+  return Status(name, weight), deserialize_message(message)
+
+
+# These are set in the parent process right before the worker pool is
+# created and are inherited by the forked workers. That way neither the
+# profile nor the values have to be pickled.
+_worker_runner = None
+_worker_order = None
+
+
+def _run_shard(shard):
+  """ Executed in a worker: run the checks of `shard`, a list of indexes
+  into the execution order, and return their serialized results with
+  the check durations and result keys and the timings data, if the runner records timings.
+  """
+  runner = _worker_runner
+  results = []
+  for index in shard:
+    _, check, iterargs = _worker_order[index]
+    events = [serialize_result(status, message)
+                    for status, message in runner._run_check(check, iterargs)]
+    results.append((index, (events,
+                            runner.get_check_duration(check, iterargs),
+                            runner.get_result_key(check, iterargs))))
+  # The shard is done, no other shard uses the same iterargs.
+  runner._cache['conditions'].clear()
+  timings = None
+  if runner.timings is not None:
+    timings = runner.timings.get_data()
+    runner.timings.clear()
+  return results, timings
+
+
+def get_shards(order):
+  """ Group the indexes of `order` by iterargs, in order of appearance. """
+  shards = OrderedDict()
+  for index, (_, _, iterargs) in enumerate(order):
+    shards.setdefault(iterargs, []).append(index)
+  return list(shards.values())
+
+
+class MultiprocessingRunner(CheckRunner):
+  def __init__(self, *args, jobs=None, **kwds):
+    """ jobs: the number of worker processes, if None or 0 use all CPUs """
+    super(MultiprocessingRunner, self).__init__(*args, **kwds)
+    self._jobs = jobs or os.cpu_count() or 1
+
+  @property
+  def jobs(self):
+    return self._jobs
+
+  def run(self, order=None):
+    if self._jobs < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+      if self._jobs > 1:
+        logging.warning('Parallel execution requires the "fork" start method,'
+                        ' which is not available. Running checks serially.')
+      for event in super(MultiprocessingRunner, self).run(order):
+        yield event
+      return
+
+    if order is not None:
+      order = self.check_order(order)
+    else:
+      order = self.order
+
+    global _worker_runner, _worker_order
+    _worker_runner, _worker_order = self, order
+    context = multiprocessing.get_context('fork')
+    try:
+      with context.Pool(self._jobs) as pool:
+        finished = pool.imap_unordered(_run_shard, get_shards(order))
+        indexes = {(check.id, iterargs): index
+                    for index, (_, check, iterargs) in enumerate(order)}
+        results = {}
+
+        def run_check(check, iterargs):
+          index = indexes[(check.id, iterargs)]
+          while index not in results:
+            shard_results, timings = next(finished)
+            results.update(shard_results)
+            if timings is not None:
+              self.timings.merge(timings)
+          events, duration, key = results.pop(index)
+          self._set_check_duration(check, iterargs, duration)
+          self._set_result_key(check, iterargs, key)
+          return map(deserialize_result, events)
+
+        for event in self._run_order(order, run_check):
+          yield event
+    finally:
+      _worker_runner, _worker_order = None, None
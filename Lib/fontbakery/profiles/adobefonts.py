@@ -46,33 +46,6 @@ def com_adobe_fonts_check_family_consistent_upm(ttFonts):
         yield PASS, "Fonts have consistent units per em."
 
 
-def _quick_and_dirty_glyph_is_empty(font, glyph_name):
-    """
-    This is meant to be a quick-and-dirty test to see if a glyph is empty.
-    Ideally we'd use the glyph_has_ink() method for this, but for a family of
-    large CJK CFF fonts with tens of thousands of glyphs each, it's too slow.
-
-    Caveat Utilitor:
-    If this method returns True, the glyph is definitely empty.
-    If this method returns False, the glyph *might* still be empty.
-    """
-    if 'glyf' in font:
-        glyph = font['glyf'][glyph_name]
-        if not glyph.isComposite():
-            if glyph.numberOfContours == 0:
-                return True
-        return False
-    elif 'CFF2' in font:
-        top_dict = font['CFF2'].cff.topDictIndex[0]
-    else:
-        top_dict = font['CFF '].cff.topDictIndex[0]
-    char_strings = top_dict.CharStrings
-    char_string = char_strings[glyph_name]
-    if len(char_string.bytecode) <= 1:
-        return True
-    return False
-
-
 @check(
   id = 'com.adobe.fonts/check/find_empty_letters',
   rationale = """
@@ -81,7 +54,7 @@ def _quick_and_dirty_glyph_is_empty(font, glyph_name):
     This check is intended to identify fonts in which such letters have been mapped to empty glyphs (typically done as a form of subsetting). Letters with empty glyphs should have their entries removed from the 'cmap' table, even if the empty glyphs are left in place (e.g. for CID consistency).
   """
 )
-def com_adobe_fonts_check_find_empty_letters(ttFont):
+def com_adobe_fonts_check_find_empty_letters(ttFont, glyph_ink_map):
     """Letters in font have glyphs that are not empty?"""
     cmap = ttFont.getBestCmap()
     passed = True
@@ -95,9 +68,9 @@ def com_adobe_fonts_check_find_empty_letters(ttFont):
     }
     for unicode_val, glyph_name in cmap.items():
         category = unicodedata.category(chr(unicode_val))
-        if (_quick_and_dirty_glyph_is_empty(ttFont, glyph_name)) \
-                and (category in letter_categories) \
-                and (unicode_val not in invisible_letters):
+        if (category in letter_categories) \
+                and (unicode_val not in invisible_letters) \
+                and (not glyph_ink_map[glyph_name]):
             yield FAIL, \
                 ("U+%04X should be visible, but its glyph ('%s') is empty."
                  % (unicode_val, glyph_name))
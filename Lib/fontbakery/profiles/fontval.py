@@ -8,8 +8,22 @@ from .shared_conditions import is_variable_font
 profile_imports = ['.shared_conditions']
 profile = profile_factory(default_section=Section("Checks inherited from Microsoft Font Validator"))
 
+def fontvalidator_version():
+  """ FontValidator has no version option, the installed executable
+  identifies the version. """
+  import shutil
+  path = shutil.which("FontValidator")
+  if path is None:
+    return None
+  path = os.path.realpath(path)
+  stat = os.stat(path)
+  return (path, stat.st_size, stat.st_mtime_ns)
+
+
 @check(
-  id = 'com.google.fonts/check/fontvalidator'
+  id = 'com.google.fonts/check/fontvalidator',
+  io_bound = True,
+  tool_version = fontvalidator_version
 )
 def com_google_fonts_check_fontvalidator(font):
   """Checking with Microsoft Font Validator."""
@@ -88,8 +102,8 @@ def com_google_fonts_check_fontvalidator(font):
     "The device table's DeltaFormat value is invalid"
   ]
 
-  from fontTools.ttLib import TTFont
-  if is_variable_font(TTFont(font)):
+  from fontbakery.utils import load_font
+  if is_variable_font(load_font(font)):
     disabled_fval_checks.extend(VARFONT_disabled_fval_checks)
 
   try:
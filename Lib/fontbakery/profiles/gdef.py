@@ -5,6 +5,8 @@ from fontbakery.message import Message
 # used to inform get_module_profile whether and how to create a profile
 from fontbakery.fonts_profile import profile_factory # NOQA pylint: disable=unused-import
 
+profile_imports = [('.shared_conditions', ('layout_index', ))]
+
 
 def _is_non_mark_char(charcode):
   from fontTools import unicodedata
@@ -16,13 +18,6 @@ def _is_non_mark_char(charcode):
     return not category.startswith("M")
 
 
-def _get_mark_class_glyphnames(ttFont):
-  from fontbakery.constants import GlyphClass
-  class_defs = ttFont["GDEF"].table.GlyphClassDef.classDefs.items()
-  return {name for (name, value) in class_defs
-          if value == GlyphClass.MARK}
-
-
 @check(
   id = 'com.google.fonts/check/gdef_spacing_marks',
   rationale = """
@@ -33,7 +28,7 @@ def _get_mark_class_glyphnames(ttFont):
     'request': 'https://github.com/googlefonts/fontbakery/issues/2877'
   }
 )
-def com_google_fonts_check_gdef_spacing_marks(ttFont):
+def com_google_fonts_check_gdef_spacing_marks(ttFont, layout_index):
   """Check mark characters are in GDEF mark glyph class)"""
   from fontbakery.utils import pretty_print_list
 
@@ -41,7 +36,7 @@ def com_google_fonts_check_gdef_spacing_marks(ttFont):
     spacing_glyphnames = {name
                           for (name, (width, lsb)) in ttFont["hmtx"].metrics.items()
                           if width > 0}
-    mark_class_glyphnames = _get_mark_class_glyphnames(ttFont)
+    mark_class_glyphnames = layout_index.mark_glyphs
     spacing_glyphnames_in_mark_glyph_class = spacing_glyphnames & mark_class_glyphnames
     if spacing_glyphnames_in_mark_glyph_class :
       formatted_list = "\t " +\
@@ -70,13 +65,13 @@ def com_google_fonts_check_gdef_spacing_marks(ttFont):
     'request': 'https://github.com/googlefonts/fontbakery/issues/2877'
   }
 )
-def com_google_fonts_check_gdef_mark_chars(ttFont):
+def com_google_fonts_check_gdef_mark_chars(ttFont, layout_index):
   """Check mark characters are in GDEF mark glyph class"""
   from fontbakery.utils import pretty_print_list
 
   if "GDEF" in ttFont and ttFont["GDEF"].table.GlyphClassDef:
     cmap = ttFont.getBestCmap()
-    mark_class_glyphnames = _get_mark_class_glyphnames(ttFont)
+    mark_class_glyphnames = layout_index.mark_glyphs
     mark_chars_not_in_mark_class = {
       charcode for charcode in cmap
       if _is_non_mark_char(charcode) is False and
@@ -112,7 +107,7 @@ def com_google_fonts_check_gdef_mark_chars(ttFont):
     'request': 'https://github.com/googlefonts/fontbakery/issues/2877'
   }
 )
-def com_google_fonts_check_gdef_non_mark_chars(ttFont):
+def com_google_fonts_check_gdef_non_mark_chars(ttFont, layout_index):
   """Check GDEF mark glyph class doesn't have characters that are not marks)"""
   from fontbakery.utils import pretty_print_list
 
@@ -129,7 +124,7 @@ def com_google_fonts_check_gdef_non_mark_chars(ttFont):
         glyphname_to_char_mapping[v].add(k)
       else:
         glyphname_to_char_mapping[v] = {k}
-    mark_class_glyphnames = _get_mark_class_glyphnames(ttFont)
+    mark_class_glyphnames = layout_index.mark_glyphs
     nonmark_char_glyphnames_in_mark_class = nonmark_char_glyphnames & mark_class_glyphnames
     if nonmark_char_glyphnames_in_mark_class:
       nonmark_chars_in_mark_class = set()
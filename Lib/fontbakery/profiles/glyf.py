@@ -49,22 +49,24 @@ def com_google_fonts_check_glyf_unused_data(ttFont):
   misc_metadata = {
     'request': 'https://github.com/googlefonts/fontbakery/issues/735'
   })
-def com_google_fonts_check_points_out_of_bounds(ttFont):
+def com_google_fonts_check_points_out_of_bounds(glyph_geometry):
   """Check for points out of bounds."""
+  import numpy as np
   from fontbakery.utils import pretty_print_list
-  failed = False
+  points = glyph_geometry.points
+  point_glyphs = glyph_geometry.point_glyphs
+  bounds = glyph_geometry.bounds[point_glyphs]
+  # like round(), numpy rounds half to even
+  rounded = np.rint(points)
+  out_of_bounds_mask = (rounded < bounds[:, :2]).any(axis=1) \
+                     | (rounded > bounds[:, 2:]).any(axis=1) \
+                     | (np.abs(points) > 32766).any(axis=1)
   out_of_bounds = []
-  for glyphName in ttFont['glyf'].keys():
-    glyph = ttFont['glyf'][glyphName]
-    coords = glyph.getCoordinates(ttFont['glyf'])[0]
-    for x, y in coords:
-      if round(x) < glyph.xMin or round(x) > glyph.xMax or \
-         round(y) < glyph.yMin or round(y) > glyph.yMax or \
-         abs(x) > 32766 or abs(y) > 32766:
-        failed = True
-        out_of_bounds.append((glyphName, x, y))
+  for index in np.flatnonzero(out_of_bounds_mask):
+    glyph_name = glyph_geometry.glyph_names[point_glyphs[index]]
+    out_of_bounds.append((glyph_name, *glyph_geometry.get_point(index)))
 
-  if failed:
+  if out_of_bounds:
     formatted_list = "\t* " + pretty_print_list(out_of_bounds,
                                                 shorten=10,
                                                 sep="\n\t* ")
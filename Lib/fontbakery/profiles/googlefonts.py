@@ -178,10 +178,9 @@ GOOGLEFONTS_PROFILE_CHECKS = \
 )
 def com_google_fonts_check_canonical_filename(font):
   """Checking file is named canonically."""
-  from fontTools.ttLib import TTFont
   from .shared_conditions import is_variable_font
   from .googlefonts_conditions import canonical_stylename
-  from fontbakery.utils import suffix
+  from fontbakery.utils import suffix, load_font
   from fontbakery.constants import (STATIC_STYLE_NAMES,
                                     MacStyle)
 
@@ -209,7 +208,7 @@ def com_google_fonts_check_canonical_filename(font):
                   f' It must not contain underscore characters!')
     return
 
-  ttFont = TTFont(font)
+  ttFont = load_font(font)
   if is_variable_font(ttFont):
     if suffix(font) in STATIC_STYLE_NAMES:
       failed = True
@@ -246,6 +245,8 @@ def com_google_fonts_check_canonical_filename(font):
 @check(
   id = 'com.google.fonts/check/description/broken_links',
   conditions = ['description'],
+  io_bound = True,
+  volatile = True,
   rationale = """
     The snippet of HTML in the DESCRIPTION.en_us.html file is added to the font family webpage on the Google Fonts website. For that reason, all hyperlinks in it must be properly working. 
   """
@@ -479,7 +480,9 @@ def com_google_fonts_check_metadata_designer_values(family_metadata):
 
 @check(
   id = 'com.google.fonts/check/metadata/broken_links',
-  conditions = ['family_metadata']
+  conditions = ['family_metadata'],
+  io_bound = True,
+  volatile = True
 )
 def com_google_fonts_check_metadata_broken_links(family_metadata):
   """Does METADATA.pb copyright field contain broken links?"""
@@ -1572,7 +1575,9 @@ def com_google_fonts_check_metadata_listed_on_gfonts(listed_on_gfonts_api):
 @disable
 @check(
   id = 'com.google.fonts/check/metadata/profiles_csv',
-  conditions = ['family_metadata']
+  conditions = ['family_metadata'],
+  io_bound = True,
+  volatile = True
 )
 def com_google_fonts_check_metadata_profiles_csv(family_metadata):
   """METADATA.pb: Designer exists in Google Fonts profiles.csv?"""
@@ -2844,52 +2849,29 @@ def com_google_fonts_check_mac_style(ttFont, style):
     This check currently does not cover variable fonts because there's plenty of alternative ways of constructing glyphs with multiple outlines for each feature in a VarFont. The expected contour count data for this check is currently optimized for the typical construction of glyphs in static fonts.
   """
 )
-def com_google_fonts_check_contour_count(ttFont):
+def com_google_fonts_check_contour_count(ttFont, contour_counts):
   """Check if each glyph has the recommended amount of contours.
 
   This check is useful to assure glyphs aren't incorrectly constructed.
 
-  The desired_glyph_data module contains the 'recommended' countour count
-  for encoded glyphs. The contour counts are derived from fonts which were
+  The desired glyph data of fontbakery.glyphdata contains the 'recommended'
+  countour count for encoded glyphs. The contour counts are derived from fonts which were
   chosen for their quality and unique design decisions for particular glyphs.
 
   In the future, additional glyph data can be included. A good addition would
   be the 'recommended' anchor counts for each glyph.
   """
-  from fontbakery.glyphdata import desired_glyph_data as glyph_data
+  from fontbakery.glyphdata import get_desired_glyph_contours
   from fontbakery.utils import (get_font_glyph_data,
                                 pretty_print_list)
 
-  def in_PUA_range(codepoint):
-    """
-      In Unicode, a Private Use Area (PUA) is a range of code points that,
-      by definition, will not be assigned characters by the Unicode Consortium.
-      Three private use areas are defined:
-        one in the Basic Multilingual Plane (U+E000–U+F8FF),
-        and one each in, and nearly covering, planes 15 and 16
-        (U+F0000–U+FFFFD, U+100000–U+10FFFD).
-    """
-    return (codepoint >= 0xE000 and codepoint <= 0xF8FF) or \
-           (codepoint >= 0xF0000 and codepoint <= 0xFFFFD) or \
-           (codepoint >= 0x100000 and codepoint <= 0x10FFFD)
-
-  # rearrange data structure:
-  desired_glyph_data_by_codepoint = {}
-  desired_glyph_data_by_glyphname = {}
-  for glyph in glyph_data:
-    desired_glyph_data_by_glyphname[glyph['name']] = glyph
-    # since the glyph in PUA ranges have unspecified meaning,
-    # it doesnt make sense for us to have an expected contour cont for them
-    if not in_PUA_range(glyph['unicode']):
-      desired_glyph_data_by_codepoint[glyph['unicode']] = glyph
+  # Glyphs in PUA ranges are only indexed by name, since their codepoints
+  # have unspecified meaning.
+  (desired_glyph_contours_by_codepoint,
+   desired_glyph_contours_by_glyphname) = get_desired_glyph_contours()
 
   bad_glyphs = []
-  desired_glyph_contours_by_codepoint = {f: desired_glyph_data_by_codepoint[f]['contours']
-                                         for f in desired_glyph_data_by_codepoint}
-  desired_glyph_contours_by_glyphname = {f: desired_glyph_data_by_glyphname[f]['contours']
-                                         for f in desired_glyph_data_by_glyphname}
-
-  font_glyph_data = get_font_glyph_data(ttFont)
+  font_glyph_data = get_font_glyph_data(ttFont, contour_counts)
 
   if font_glyph_data is None:
     yield FAIL,\
@@ -3366,6 +3348,8 @@ def com_google_fonts_check_name_copyright_length(ttFont):
     We need to check names are not already used, and today the best place to check that is http://namecheck.fontdata.com
   """,
   conditions = ["familyname"],
+  io_bound = True,
+  volatile = True,
   misc_metadata = {
     'request': 'https://github.com/googlefonts/fontbakery/issues/494'
   })
@@ -3807,19 +3791,22 @@ def com_google_fonts_check_varfont_weight_instances(ttFont):
     'request': 'https://github.com/googlefonts/fontbakery/issues/2278'
   }
 )
-def com_google_fonts_check_family_tnum_horizontal_metrics(RIBBI_ttFonts):
+def com_google_fonts_check_family_tnum_horizontal_metrics(RIBBI_glyph_metrics):
   """All tabular figures must have the same width across the RIBBI-family."""
   tnum_widths = {}
-  for ttFont in RIBBI_ttFonts:
-    glyphs = ttFont.getGlyphSet()
-    tnum_glyphs = [(glyph_id, glyphs[glyph_id])
-                   for glyph_id in glyphs.keys()
+  for metrics in RIBBI_glyph_metrics:
+    if metrics is None:
+      # no hmtx table
+      continue
+    tnum_glyphs = [(index, glyph_id)
+                   for index, glyph_id in enumerate(metrics.glyph_names)
                    if glyph_id.endswith(".tnum")]
-    for glyph_id, glyph in tnum_glyphs:
-      if glyph.width not in tnum_widths:
-        tnum_widths[glyph.width] = [glyph_id]
-      else:
-        tnum_widths[glyph.width].append(glyph_id)
+    if not tnum_glyphs:
+      continue
+    indexes, glyph_ids = zip(*tnum_glyphs)
+    widths = metrics.advance_widths[list(indexes)].tolist()
+    for glyph_id, width in zip(glyph_ids, widths):
+      tnum_widths.setdefault(width, []).append(glyph_id)
 
   if len(tnum_widths.keys()) > 1:
     max_num = 0
@@ -3943,19 +3930,9 @@ def com_google_fonts_check_ligature_carets(ttFont, ligature_glyphs):
   misc_metadata = {
     'request': 'https://github.com/googlefonts/fontbakery/issues/1145'
   })
-def com_google_fonts_check_kerning_for_non_ligated_sequences(ttFont, ligatures, has_kerning_info):
+def com_google_fonts_check_kerning_for_non_ligated_sequences(ligatures, layout_index, has_kerning_info):
   """Is there kerning info for non-ligated sequences?"""
 
-  def look_for_nonligated_kern_info(table):
-    for pairpos in table.SubTable:
-      for i, glyph in enumerate(pairpos.Coverage.glyphs):
-        if not hasattr(pairpos, 'PairSet'):
-          continue
-        for pairvalue in pairpos.PairSet[i].PairValueRecord:
-          kern_pair = (glyph, pairvalue.SecondGlyph)
-          if kern_pair in ligature_pairs:
-            ligature_pairs.remove(kern_pair)
-
   def ligatures_str(pairs):
     result = [f"\t- {first} + {second}" for first, second in pairs]
     return "\n".join(result)
@@ -3968,21 +3945,17 @@ def com_google_fonts_check_kerning_for_non_ligated_sequences(ttFont, ligatures,
                   " For more info, read:"
                   " https://github.com/googlefonts/fontbakery/issues/1596")
   else:
-    ligature_pairs = []
+    ligature_pairs = {}
     for first, comp in ligatures.items():
       for components in comp:
-        while components:
-          pair = (first, components[0])
-          if pair not in ligature_pairs:
-            ligature_pairs.append(pair)
-          first = components[0]
-          components.pop(0)
-
-    for record in ttFont["GSUB"].table.FeatureList.FeatureRecord:
-      if record.FeatureTag == 'kern':
-        for index in record.Feature.LookupListIndex:
-          lookup = ttFont["GSUB"].table.LookupList.Lookup[index]
-          look_for_nonligated_kern_info(lookup)
+        previous = first
+        for component in components:
+          ligature_pairs[(previous, component)] = None
+          previous = component
+
+    kerning_pairs = layout_index.kerning_pairs
+    ligature_pairs = [pair for pair in ligature_pairs
+                           if pair not in kerning_pairs]
 
     if ligature_pairs:
       yield WARN,\
@@ -4182,10 +4155,10 @@ def com_google_fonts_check_repo_dirname_match_nameid_1(fonts,
                                                        gfonts_repo_structure):
   """Directory name in GFonts repo structure must
      match NameID 1 of the regular."""
-  from fontTools.ttLib import TTFont
   from fontbakery.utils import (get_name_entry_strings,
                                 get_absolute_path,
-                                get_regular)
+                                get_regular,
+                                load_font)
   regular = get_regular(fonts)
   if not regular:
     yield FAIL,\
@@ -4193,7 +4166,7 @@ def com_google_fonts_check_repo_dirname_match_nameid_1(fonts,
                   "The font seems to lack a regular.")
     return
 
-  entry = get_name_entry_strings(TTFont(regular), NameID.FONT_FAMILY_NAME)[0]
+  entry = get_name_entry_strings(load_font(regular), NameID.FONT_FAMILY_NAME)[0]
   expected = entry.lower()
   expected = "".join(expected.split(' '))
   expected = "".join(expected.split('-'))
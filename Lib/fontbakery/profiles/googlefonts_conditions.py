@@ -20,13 +20,22 @@ def style(font):
 
 @condition
 def RIBBI_ttFonts(fonts):
-  from fontTools.ttLib import TTFont
+  from fontbakery.utils import load_font
   from fontbakery.constants import RIBBI_STYLE_NAMES
-  return [TTFont(f)
+  return [load_font(f)
           for f in fonts
           if style(f) in RIBBI_STYLE_NAMES]
 
 
+@condition
+def RIBBI_glyph_metrics(RIBBI_ttFonts):
+  """The `glyph_metrics` of each of the RIBBI_ttFonts, None for fonts
+  without a hmtx table."""
+  from fontbakery.utils import GlyphMetrics
+  return [GlyphMetrics(ttFont) if 'hmtx' in ttFont else None
+          for ttFont in RIBBI_ttFonts]
+
+
 @condition
 def style_with_spaces(font):
   """Stylename with spaces (derived from a canonical filename)."""
@@ -103,7 +112,7 @@ def canonical_stylename(font):
   from fontbakery.constants import (STATIC_STYLE_NAMES,
                                     VARFONT_SUFFIXES)
   from .shared_conditions import is_variable_font
-  from fontTools.ttLib import TTFont
+  from fontbakery.utils import load_font
 
   # remove spaces in style names
   valid_style_suffixes = [name.replace(' ', '') for name in STATIC_STYLE_NAMES]
@@ -111,14 +120,15 @@ def canonical_stylename(font):
   filename = os.path.basename(font)
   basename = os.path.splitext(filename)[0]
   s = suffix(font)
-  varfont = os.path.exists(font) and is_variable_font(TTFont(font))
+  varfont = os.path.exists(font) and is_variable_font(load_font(font))
   if ('-' in basename and
       (s in VARFONT_SUFFIXES and varfont)
       or (s in valid_style_suffixes and not varfont)):
     return s
 
 
-@condition
+# The DESCRIPTION file can change while the font files stay the same.
+@condition(volatile=True)
 def descfile(font):
   """Get the path of the DESCRIPTION file of a given font project."""
   if font:
@@ -154,45 +164,8 @@ def family_metadata(family_directory):
 @condition
 def registered_vendor_ids():
   """Get a list of vendor IDs from Microsoft's website."""
-  from bs4 import BeautifulSoup
-  from pkg_resources import resource_filename
-
-  registered_vendor_ids = {}
-  CACHED = resource_filename('fontbakery',
-                             'data/fontbakery-microsoft-vendorlist.cache')
-  content = open(CACHED, encoding='utf-8').read()
-  soup = BeautifulSoup(content, 'html.parser')
-
-  IDs = [chr(c + ord('a')) for c in range(ord('z') - ord('a') + 1)]
-  IDs.append("0-9-")
-
-  for section_id in IDs:
-    section = soup.find('h2', {'id': section_id})
-    table = section.find_next_sibling('table')
-    if not table: continue
-
-    #print ("table: '{}'".format(table))
-    for row in table.findAll('tr'):
-      #print("ROW: '{}'".format(row))
-      cells = row.findAll('td')
-      if not cells:
-        continue
-
-      labels = [label for label in cells[1].stripped_strings]
-
-      # pad the code to make sure it is a 4 char string,
-      # otherwise eg "CF  " will not be matched to "CF"
-      code = cells[0].string.strip()
-      code = code + (4 - len(code)) * ' '
-      registered_vendor_ids[code] = labels[0]
-
-      # Do the same with NULL-padding:
-      code = cells[0].string.strip()
-      code = code + (4 - len(code)) * chr(0)
-      registered_vendor_ids[code] = labels[0]
-
-
-  return registered_vendor_ids
+  from fontbakery.vendorids import get_registered_vendor_ids
+  return get_registered_vendor_ids()
 
 
 def git_rootdir(family_dir):
@@ -269,60 +242,79 @@ def familyname(font):
     return filename_base
 
 
-@condition
-def hinting_stats(font):
+def ttfautohint_version():
+  """ The version of the installed ttfautohint library, None if it's
+  not installed. """
+  try:
+    from ttfautohint import libttfautohint
+  except ImportError:
+    return None
+  return libttfautohint.version_string
+
+
+@condition(persistent=True, tool_version=ttfautohint_version)
+def hinting_stats(font, ttFont):
   """
   Return file size differences for a hinted font compared to an dehinted version of same file
+
+  The font is dehinted in memory. With a result cache (`--cache-dir`)
+  the stats are stored, keyed by the contents of the font file and the
+  version of ttfautohint.
   """
   from ttfautohint import ttfautohint, libttfautohint
   from io import BytesIO
-  from fontTools.ttLib import TTFont
-  from fontTools.subset import main as pyftsubset
+  from fontTools import subset
   from fontbakery.profiles.shared_conditions import (is_ttf,
                                                      is_cff,
                                                      is_cff2)
 
-  if is_ttf(TTFont(font)):
-    original_buffer = BytesIO()
-    TTFont(font).save(original_buffer)
-    dehinted_buffer = ttfautohint(in_buffer=original_buffer.getvalue(),
-                                  dehint=True)
+  if ttFont.reader is not None:
+    # The file ttFont was loaded from, e.g. memory-mapped by `load_font`.
+    ttFont.reader.file.seek(0)
+    data = ttFont.reader.file.read()
+  else:
+    with open(font, 'rb') as f:
+      data = f.read()
+
+  if is_ttf(ttFont):
+    dehinted_buffer = ttfautohint(in_buffer=data, dehint=True)
     dehinted_size = len(dehinted_buffer)
     version = libttfautohint.version_string
 
-  elif is_cff(TTFont(font)) or is_cff2(TTFont(font)):
-    ext = os.path.splitext(font)[1]
-    tmp = font.replace(ext, "-tmp-dehinted%s" % ext)
-    args = [font,
-            "--no-hinting",
-            "--glyphs=*",
-            "--ignore-missing-glyphs",
-            "--no-notdef-glyph",
-            "--no-recommended-glyphs",
-            "--no-layout-closure",
-            "--layout-features=*",
-            "--no-desubroutinize",
-            "--name-languages=*",
-            "--glyph-names",
-            "--no-prune-unicode-ranges",
-            "--output-file=%s" % tmp]
-    pyftsubset(args)
-
-    dehinted_size = os.stat(tmp).st_size
+  elif is_cff(ttFont) or is_cff2(ttFont):
+    # The same as `pyftsubset --glyphs=* --no-hinting ...`: keep everything
+    # but the hints. Subsetting modifies the font, so it works on a copy.
+    options = subset.Options(hinting=False,
+                             ignore_missing_glyphs=True,
+                             notdef_glyph=False,
+                             recommended_glyphs=False,
+                             layout_closure=False,
+                             layout_features=['*'],
+                             desubroutinize=False,
+                             name_languages=['*'],
+                             glyph_names=True,
+                             prune_unicode_ranges=False)
+    dehinted = subset.load_font(BytesIO(data), options)
+    options.flavor = dehinted.flavor
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(glyphs=dehinted.getGlyphOrder())
+    subsetter.subset(dehinted)
+    dehinted_buffer = BytesIO()
+    subset.save_font(dehinted, dehinted_buffer, options)
+    dehinted_size = len(dehinted_buffer.getvalue())
     version = "" # TODO If there is a way, extract the psautohint version used?
-    os.remove(tmp)
-  
+
   else:
     return None
 
   return {
     "dehinted_size": dehinted_size,
-    "hinted_size": os.stat(font).st_size,
+    "hinted_size": len(data),
     "version": version
   }
 
 
-@condition
+@condition(volatile=True)
 def listed_on_gfonts_api(familyname):
   from fontbakery.utils import split_camel_case
   if not familyname:
@@ -402,7 +394,8 @@ def whitelist_camelcased_familyname(font):
       return True
 
 
-@condition
+# volatile: listed_on_gfonts_api is called directly, it's not a dependency
+@condition(volatile=True)
 def remote_styles(familyname_with_spaces):
   """Get a dictionary of TTFont objects of all font files of
      a given family as currently hosted at Google Fonts.
@@ -452,7 +445,7 @@ def api_gfonts_ttFont(style, remote_styles):
     return remote_styles[style]
 
 
-@condition
+@condition(volatile=True)
 def github_gfonts_ttFont(ttFont, license):
   """Get a TTFont object of a font downloaded
      from Google Fonts git repository.
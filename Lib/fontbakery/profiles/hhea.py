@@ -5,7 +5,7 @@ from fontbakery.message import Message
 from fontbakery.fonts_profile import profile_factory # NOQA pylint: disable=unused-import
 
 profile_imports = [
-    ('.shared_conditions', ('glyph_metrics_stats', 'is_ttf'))
+    ('.shared_conditions', ('glyph_metrics', 'glyph_metrics_stats', 'is_ttf'))
 ]
 
 @check(
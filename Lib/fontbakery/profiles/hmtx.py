@@ -4,22 +4,21 @@ from fontbakery.message import Message
 # used to inform get_module_profile whether and how to create a profile
 from fontbakery.fonts_profile import profile_factory  # NOQA pylint: disable=unused-import
 
-profile_imports = [('.shared_conditions', ('missing_whitespace_chars',))]
+profile_imports = [('.shared_conditions', ('missing_whitespace_chars',
+                                           'glyph_metrics'))]
 
 
 @check(
   id = 'com.google.fonts/check/whitespace_widths',
   conditions = ['not missing_whitespace_chars']
 )
-def com_google_fonts_check_whitespace_widths(ttFont):
+def com_google_fonts_check_whitespace_widths(glyph_metrics):
   """Space and non-breaking space have the same width?"""
-  from fontbakery.utils import get_glyph_name
+  space_name = glyph_metrics.get_glyph_name(0x0020)
+  nbsp_name = glyph_metrics.get_glyph_name(0x00A0)
 
-  space_name = get_glyph_name(ttFont, 0x0020)
-  nbsp_name = get_glyph_name(ttFont, 0x00A0)
-
-  space_width = ttFont['hmtx'][space_name][0]
-  nbsp_width = ttFont['hmtx'][nbsp_name][0]
+  space_width = glyph_metrics.advance_width(space_name)
+  nbsp_width = glyph_metrics.advance_width(nbsp_name)
 
   if space_width > 0 and space_width == nbsp_width:
     yield PASS, "Space and non-breaking space have the same width."
@@ -10,7 +10,7 @@ from fontbakery.constants import (PriorityLevel,
 from fontbakery.fonts_profile import profile_factory # NOQA pylint: disable=unused-import
 
 profile_imports = [
-    ('.shared_conditions', ('glyph_metrics_stats', ))
+    ('.shared_conditions', ('glyph_metrics', 'glyph_metrics_stats'))
 ]
 
 
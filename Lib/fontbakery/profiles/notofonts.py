@@ -101,7 +101,8 @@ def com_google_fonts_check_unicode_range_bits(ttFont, unicoderange, preferred_cm
   from fontbakery.utils import (compute_unicoderange_bits,
                                 unicoderange_bit_name,
                                 chars_in_range)
-  expected_unicoderange = compute_unicoderange_bits(ttFont)
+  codepoints = sorted(preferred_cmap)
+  expected_unicoderange = compute_unicoderange_bits(ttFont, codepoints)
   difference = unicoderange ^ expected_unicoderange
   if not difference:
     yield PASS, "Looks good!"
@@ -109,7 +110,7 @@ def com_google_fonts_check_unicode_range_bits(ttFont, unicoderange, preferred_cm
     for bit in range(128):
       if difference & (1 << bit):
         range_name = unicoderange_bit_name(bit)
-        num_chars = len(chars_in_range(ttFont, bit))
+        num_chars = len(chars_in_range(ttFont, bit, codepoints))
         range_size = sum(entry[3] - entry[2] + 1 for entry in UNICODERANGE_DATA[bit])
         set_unset = "1"
         if num_chars == 0:
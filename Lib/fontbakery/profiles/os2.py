@@ -5,7 +5,7 @@ from fontbakery.message import Message
 from fontbakery.fonts_profile import profile_factory # NOQA pylint: disable=unused-import
 
 profile_imports = [
-    ('.shared_conditions', ('vmetrics', )),
+    ('.shared_conditions', ('vmetrics', 'glyph_metrics')),
     ('.googlefonts_conditions', ('RIBBI_ttFonts', ))
 ]
 
@@ -82,8 +82,9 @@ def com_google_fonts_check_family_panose_familytype(ttFonts):
   id = 'com.google.fonts/check/xavgcharwidth',
   conditions = ['is_ttf']
 )
-def com_google_fonts_check_xavgcharwidth(ttFont):
+def com_google_fonts_check_xavgcharwidth(ttFont, glyph_metrics):
   """Check if OS/2 xAvgCharWidth is correct."""
+  import numpy as np
 
   if "OS/2" not in ttFont:
     yield FAIL,\
@@ -97,21 +98,18 @@ def com_google_fonts_check_xavgcharwidth(ttFont):
   # Since version 3, the average is computed using _all_ glyphs in a font.
   if ttFont['OS/2'].version >= 3:
     calculation_rule = "the average of the widths of all glyphs in the font"
-    if not ttFont['hmtx'].metrics:  # May contain just '.notdef', which is valid.
+    if not glyph_metrics.glyph_names:  # May contain just '.notdef', which is valid.
       yield FAIL,\
             Message("missing-glyphs",
                     "CRITICAL: Found no glyph width data in the hmtx table!")
       return
 
-    width_sum = 0
-    count = 0
-    for glyph_id in ttFont['glyf'].glyphs:  # At least .notdef must be present.
-      width = ttFont['hmtx'].metrics[glyph_id][0]
-      # The OpenType spec doesn't exclude negative widths, but only positive
-      # widths seems to be the assumption in the wild?
-      if width > 0:
-        count += 1
-        width_sum += width
+    # The OpenType spec doesn't exclude negative widths, but only positive
+    # widths seems to be the assumption in the wild?
+    widths = glyph_metrics.advance_widths
+    widths = widths[widths > 0]
+    width_sum = int(widths.sum())
+    count = len(widths)
 
     expected_value = int(round(width_sum / count))
   else:  # Version 2 and below only consider lowercase latin glyphs and space.
@@ -146,18 +144,16 @@ def com_google_fonts_check_xavgcharwidth(ttFont):
         'z': 2,
         'space': 166
     }
-    glyph_order = ttFont.getGlyphOrder()
-    if not all(character in glyph_order for character in weightFactors):
+    indexes = [glyph_metrics.glyph_index(name) for name in weightFactors]
+    if None in indexes:
       yield FAIL,\
             Message("missing-glyphs",
                     "Font is missing the required"
                     " latin lowercase letters and/or space.")
       return
 
-    width_sum = 0
-    for glyph_id in weightFactors:
-      width = ttFont['hmtx'].metrics[glyph_id][0]
-      width_sum += (width * weightFactors[glyph_id])
+    width_sum = int(np.dot(glyph_metrics.advance_widths[indexes],
+                           list(weightFactors.values())))
 
     expected_value = int(width_sum / 1000.0 + 0.5)  # round to closest int
 
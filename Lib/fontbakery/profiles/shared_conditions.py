@@ -1,6 +1,5 @@
 import os
 from typing import List
-from collections import Counter
 
 from fontbakery.callable import condition
 # used to inform get_module_profile whether and how to create a profile
@@ -9,8 +8,8 @@ from fontbakery.fonts_profile import profile_factory # NOQA pylint: disable=unus
 
 @condition
 def ttFont(font):
-  from fontTools.ttLib import TTFont
-  return TTFont(font)
+  from fontbakery.utils import load_font
+  return load_font(font)
 
 
 @condition
@@ -36,7 +35,9 @@ def is_cff2(ttFont):
   return 'CFF2' in ttFont
 
 
-@condition
+# The directory is scanned for further files by many checks,
+# which can change while the font files stay the same.
+@condition(volatile=True)
 def family_directory(font):
   """Get the path of font project directory."""
   if font:
@@ -100,70 +101,70 @@ def superfamily(sibling_directories):
 
 @condition
 def superfamily_ttFonts(superfamily):
-  from fontTools.ttLib import TTFont
+  from fontbakery.utils import load_font
   result = []
   for family in superfamily:
-    result.append([TTFont(f) for f in family])
+    result.append([load_font(f) for f in family])
   return result
 
 
 @condition
-def ligatures(ttFont):
-  all_ligatures = {}
+def layout_index(ttFont):
+  """The ligatures, kerning pairs, mark glyphs, etc. of the layout
+  tables, each collected once on first use,
+  see `fontbakery.utils.LayoutIndex`."""
+  from fontbakery.utils import LayoutIndex
+  return LayoutIndex(ttFont)
+
+
+@condition
+def ligatures(layout_index):
   try:
-    if "GSUB" in ttFont and ttFont["GSUB"].table.LookupList:
-      for record in ttFont["GSUB"].table.FeatureList.FeatureRecord:
-        if record.FeatureTag == 'liga':
-          for index in record.Feature.LookupListIndex:
-            lookup = ttFont["GSUB"].table.LookupList.Lookup[index]
-            for subtable in lookup.SubTable:
-              for firstGlyph in subtable.ligatures.keys():
-                all_ligatures[firstGlyph] = []
-                for lig in subtable.ligatures[firstGlyph]:
-                  if lig.Component not in all_ligatures[firstGlyph]:
-                    all_ligatures[firstGlyph].append(lig.Component)
-    return all_ligatures
+    return layout_index.ligatures
   except:
     return -1 # Indicate fontTools-related crash...
 
 
 @condition
-def ligature_glyphs(ttFont):
-  all_ligature_glyphs = []
+def ligature_glyphs(layout_index):
   try:
-    if "GSUB" in ttFont and ttFont["GSUB"].table.LookupList:
-      for record in ttFont["GSUB"].table.FeatureList.FeatureRecord:
-        if record.FeatureTag == 'liga':
-          for index in record.Feature.LookupListIndex:
-            lookup = ttFont["GSUB"].table.LookupList.Lookup[index]
-            for subtable in lookup.SubTable:
-              for firstGlyph in subtable.ligatures.keys():
-                for lig in subtable.ligatures[firstGlyph]:
-                  if lig.LigGlyph not in all_ligature_glyphs:
-                    all_ligature_glyphs.append(lig.LigGlyph)
-    return all_ligature_glyphs
+    return layout_index.ligature_glyphs
   except:
     return -1  # Indicate fontTools-related crash...
 
 
 @condition
-def glyph_metrics_stats(ttFont):
+def glyph_metrics(ttFont):
+  """The horizontal metrics of all glyphs and the best cmap as NumPy
+  arrays, see `fontbakery.utils.GlyphMetrics`. None if the font has
+  no hmtx table."""
+  from fontbakery.utils import GlyphMetrics
+  if 'hmtx' not in ttFont:
+    return None
+  return GlyphMetrics(ttFont)
+
+
+@condition
+def glyph_metrics_stats(glyph_metrics):
   """Returns a dict containing whether the font seems_monospaced,
   what's the maximum glyph width and what's the most common width.
 
   For a font to be considered monospaced, at least 80% of
   the ascii glyphs must have the same width."""
-  glyph_metrics = ttFont['hmtx'].metrics
-  ascii_glyph_names = [ttFont.getBestCmap()[c] for c in range(32, 128)
-                       if c in ttFont.getBestCmap()]
-  ascii_widths = [adv for name, (adv, lsb) in glyph_metrics.items()
-                  if name in ascii_glyph_names]
-  ascii_width_count = Counter(ascii_widths)
-  ascii_most_common_width = ascii_width_count.most_common(1)[0][1]
-  seems_monospaced = ascii_most_common_width >= len(ascii_widths) * 0.8
-
-  width_max = max([adv for k, (adv, lsb) in glyph_metrics.items()])
-  most_common_width = Counter(glyph_metrics.values()).most_common(1)[0][0][0]
+  import numpy as np
+  widths = glyph_metrics.advance_widths
+  ascii_widths = widths[glyph_metrics.get_glyph_indexes(32, 127)]
+  _, ascii_width_counts = np.unique(ascii_widths, return_counts=True)
+  ascii_most_common_width = ascii_width_counts.max()
+  seems_monospaced = bool(ascii_most_common_width >= len(ascii_widths) * 0.8)
+
+  width_max = int(widths.max())
+  # The advance width of the most common (advance width, lsb) pair,
+  # on ties that of the pair that comes first.
+  pairs = np.stack([widths, glyph_metrics.lsbs], axis=1)
+  _, first, counts = np.unique(pairs, axis=0,
+                               return_index=True, return_counts=True)
+  most_common_width = int(widths[first[counts == counts.max()].min()])
   return {
       "seems_monospaced": seems_monospaced,
       "width_max": width_max,
@@ -171,6 +172,37 @@ def glyph_metrics_stats(ttFont):
   }
 
 
+@condition
+def glyph_geometry(ttFont):
+  """The outlines of all glyphs, decoded once into NumPy arrays,
+  see `fontbakery.utils.GlyphGeometry`. None if the font has no
+  glyf table."""
+  from fontbakery.utils import GlyphGeometry
+  if 'glyf' not in ttFont:
+    return None
+  return GlyphGeometry(ttFont)
+
+
+@condition
+def glyph_ink_map(ttFont):
+  """Whether each glyph has ink, a dict of glyph names to booleans
+  that looks at each glyph once, on first access.
+  See `fontbakery.utils.glyph_has_ink`."""
+  from fontbakery.utils import GlyphInkMap
+  return GlyphInkMap(ttFont)
+
+
+@condition
+def contour_counts(ttFont):
+  """Contour count of each glyph, indexed by glyph ID, including the
+  contours of components. See `fontbakery.utils.get_contour_counts`.
+  None if the font has no glyf table."""
+  from fontbakery.utils import get_contour_counts
+  if 'glyf' not in ttFont:
+    return None
+  return get_contour_counts(ttFont)
+
+
 @condition
 def missing_whitespace_chars(ttFont):
   from fontbakery.utils import get_glyph_name
@@ -310,6 +342,7 @@ def is_cjk_font(ttFont):
   from fontbakery.constants import (CJK_CODEPAGE_BITS,
                                     CJK_UNICODE_RANGE_BITS,
                                     CJK_UNICODE_RANGES)
+  from fontbakery.utils import has_codepoints_in_range
   os2 = ttFont["OS/2"]
 
   # OS/2 code page checks
@@ -332,11 +365,10 @@ def is_cjk_font(ttFont):
         return True
 
   # defined CJK Unicode code point in cmap table checks
-  cmap = ttFont.getBestCmap()
+  codepoints = sorted(ttFont.getBestCmap())
   for unicode_range in CJK_UNICODE_RANGES:
-    for x in range(unicode_range[0], unicode_range[1]+1):
-      if int(x) in cmap:
-        return True
+    if has_codepoints_in_range(codepoints, *unicode_range):
+      return True
 
   # default, return False if the above checks did not identify a CJK font
   return False
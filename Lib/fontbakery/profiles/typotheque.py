@@ -39,6 +39,7 @@ from fontbakery.profiles.universal import UNIVERSAL_PROFILE_CHECKS
 
 # also needed to import universal checks?
 # profile_imports = ('fontbakery.profiles.universal',)
+profile_imports = (('.shared_conditions', ('glyph_geometry', )), )
 
 # seems to be needed to mark this as a profile?
 profile = profile_factory(default_section=Section("Typotheque"))
@@ -56,39 +57,49 @@ EXPECTED_CHECK_IDS = \
 
 @check(id='com.typotheque/check/short-segments--otf_ttf')
 
-def short_segments_otf_ttf(ttFont):
+def short_segments_otf_ttf(ttFont, glyph_geometry):
   """Report short segments in an OTF or TTF."""
 
   # TODO: print results in a more-readable way
   # TODO: decompose components and remove overlap before checking
 
-  from fontTools.pens.basePen import BasePen
-  from fontbakery.utils import ShortSegmentPen
-  import pprint
-
-  pp = pprint.PrettyPrinter(indent=4)
+  from fontbakery.utils import ShortSegmentPen, point_tuple
+  import numpy as np
 
   results= {}
 
-  glyphset = ttFont.getGlyphSet()
-
   # set for minimum segment length, in units out of 1000 UPM
   tooSmall = 2
   # derive minSize for segment
   minSize = ttFont['head'].unitsPerEm * (tooSmall / 1000)
 
-  for glyphName in glyphset.keys():
-    try:
-      glyph = glyphset[glyphName]
-      pen = ShortSegmentPen(glyph, minSize)
-      glyph.draw(pen)
-      result = pen.shortSegments
-      if len(result) > 0:
-        results[glyphName] = result
-
-    # TODO: find why some glyphs have a TypeError: '_TTGlyphGlyf' object is not subscriptable (it is probably due to non-decomposed components)
-    except TypeError:
-      continue
+  if glyph_geometry is not None:
+    # TTF: measure all segments at once
+    points, implied, glyphs, starts, ends = glyph_geometry.get_segments()
+    deltas = points[ends] - points[starts]
+    lengths = np.sqrt(deltas[:, 0] ** 2 + deltas[:, 1] ** 2)
+    short = lengths < minSize
+    # glyphs with components are skipped, like by the pen below
+    short &= ~glyph_geometry.is_composite[glyphs[ends]]
+    for start, end in zip(starts[short], ends[short]):
+      glyphName = glyph_geometry.glyph_names[glyphs[end]]
+      results.setdefault(glyphName, []).append(
+                                (point_tuple(points[start], implied[start]),
+                                 point_tuple(points[end], implied[end])))
+  else:
+    glyphset = ttFont.getGlyphSet()
+    for glyphName in glyphset.keys():
+      try:
+        glyph = glyphset[glyphName]
+        pen = ShortSegmentPen(glyph, minSize)
+        glyph.draw(pen)
+        result = pen.shortSegments
+        if len(result) > 0:
+          results[glyphName] = result
+
+      # TODO: find why some glyphs have a TypeError: '_TTGlyphGlyf' object is not subscriptable (it is probably due to non-decomposed components)
+      except TypeError:
+        continue
 
   if len(results.keys()) > 0:
       yield WARN, f"Font has glyphs with segments shorter than {minSize}"
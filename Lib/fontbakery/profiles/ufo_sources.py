@@ -84,6 +84,7 @@ def ufo_font(font):
 @register_check(section=basic_checks)
 @check(
   id = 'com.daltonmaag/check/ufolint',
+  io_bound = True,
   misc_metadata = {
     'priority': PriorityLevel.CRITICAL
   }
@@ -2,6 +2,7 @@ import os
 
 from fontbakery.checkrunner import Section, PASS, FAIL, WARN, ERROR, INFO, SKIP
 from fontbakery.callable import condition, check, disable
+from fontbakery.callable import FontBakeryExpectedValue as ExpectedValue
 from fontbakery.constants import PriorityLevel
 from fontbakery.message import Message
 from fontbakery.fonts_profile import profile_factory
@@ -206,7 +207,7 @@ def com_google_fonts_check_family_single_directory(fonts):
                  " {}".format(directories))
 
 
-@condition
+@condition(volatile=True)
 def ftxvalidator_cmd():
   """ Test if `ftxvalidator` is a command; i.e. an executable with a path."""
   import shutil
@@ -237,7 +238,8 @@ def com_google_fonts_check_ftxvalidator_is_available(ftxvalidator_cmd):
 
 @check(
   id = 'com.google.fonts/check/ftxvalidator',
-  conditions = ['ftxvalidator_cmd']
+  conditions = ['ftxvalidator_cmd'],
+  io_bound = True
 )
 def com_google_fonts_check_ftxvalidator(font, ftxvalidator_cmd):
   """Checking with ftxvalidator."""
@@ -284,8 +286,15 @@ def com_google_fonts_check_ftxvalidator(font, ftxvalidator_cmd):
                  "\n\n{}\n").format(e.output.decode('utf-8'))
 
 
+def ots_version():
+  import ots
+  return ots.__version__
+
+
 @check(
-  id = 'com.google.fonts/check/ots'
+  id = 'com.google.fonts/check/ots',
+  io_bound = True,
+  tool_version = ots_version
 )
 def com_google_fonts_check_ots(font):
   """Checking with ots-sanitize."""
@@ -330,7 +339,9 @@ def is_up_to_date(installed, latest):
 
 
 @check(
-  id = 'com.google.fonts/check/fontbakery_version'
+  id = 'com.google.fonts/check/fontbakery_version',
+  io_bound = True,
+  volatile = True
 )
 def com_google_fonts_check_fontbakery_version():
   """Do we have the latest version of FontBakery installed?"""
@@ -379,14 +390,12 @@ def com_google_fonts_check_fontbakery_version():
     Pre-v1.8, it was recommended that a font should also contain a .null, CR and space glyph. This might have been relevant for applications on MacOS 9.
   """
 )
-def com_google_fonts_check_mandatory_glyphs(ttFont):
+def com_google_fonts_check_mandatory_glyphs(ttFont, glyph_ink_map):
   """Font contains .notdef as first glyph?"""
-  from fontbakery.utils import glyph_has_ink
-
   if (
     ttFont.getGlyphOrder()[0] == ".notdef"
     and ".notdef" not in ttFont.getBestCmap().values()
-    and glyph_has_ink(ttFont, ".notdef")
+    and glyph_ink_map[".notdef"]
   ):
     yield PASS, (
       "Font contains the .notdef glyph as the first glyph, it does "
@@ -465,9 +474,9 @@ def com_google_fonts_check_whitespace_glyphnames(ttFont):
 @check(
   id = 'com.google.fonts/check/whitespace_ink'
 )
-def com_google_fonts_check_whitespace_ink(ttFont):
+def com_google_fonts_check_whitespace_ink(ttFont, glyph_ink_map):
   """Whitespace glyphs have ink?"""
-  from fontbakery.utils import get_glyph_name, glyph_has_ink
+  from fontbakery.utils import get_glyph_name
 
   # code-points for all "whitespace" chars:
   WHITESPACE_CHARACTERS = [
@@ -479,7 +488,7 @@ def com_google_fonts_check_whitespace_ink(ttFont):
   failed = False
   for codepoint in WHITESPACE_CHARACTERS:
     g = get_glyph_name(ttFont, codepoint)
-    if g is not None and glyph_has_ink(ttFont, g):
+    if g is not None and glyph_ink_map[g]:
       failed = True
       yield FAIL, ("Glyph \"{}\" has ink."
                    " It needs to be replaced by"
@@ -754,40 +763,30 @@ def com_google_fonts_check_glyphnames_max_length(ttFont):
       yield PASS, "No glyph names exceed max allowed length."
 
 
+ttx_roundtrip_tables = ExpectedValue(
+      'ttx_roundtrip_tables'
+    , default=None
+    , description='The tags of the tables com.google.fonts/check/ttx-roundtrip'
+                  ' round-trips, None for the whole font.'
+    , validator=lambda tables: (True, None) if tables is None or \
+                               all(isinstance(tag, str) for tag in tables) \
+                          else (False, 'Value must be None or a list of tags.')
+)
+
+
 @check(
   id = 'com.google.fonts/check/ttx-roundtrip',
   conditions = ["not vtt_talk_sources"]
 )
-def com_google_fonts_check_ttx_roundtrip(font):
+def com_google_fonts_check_ttx_roundtrip(font, ttx_roundtrip_tables):
   """Checking with fontTools.ttx"""
-  from fontTools import ttx
-  import sys
-  ttFont = ttx.TTFont(font)
-  failed = False
-
-  class TTXLogger:
-    msgs = []
-
-    def __init__(self):
-      self.original_stderr = sys.stderr
-      self.original_stdout = sys.stdout
-      sys.stderr = self
-      sys.stdout = self
-
-    def write(self, data):
-      if data not in self.msgs:
-        self.msgs.append(data)
-
-    def restore(self):
-      sys.stderr = self.original_stderr
-      sys.stdout = self.original_stdout
-
   from xml.parsers.expat import ExpatError
+  from fontbakery.utils import ttx_roundtrip
+
+  tables = ttx_roundtrip_tables or None
+  failed = False
   try:
-    logger = TTXLogger()
-    xml_file = font + ".xml"
-    ttFont.saveXML(xml_file)
-    export_error_msgs = logger.msgs
+    export_error_msgs, import_error_msgs = ttx_roundtrip(font, tables)
 
     if len(export_error_msgs):
       failed = True
@@ -796,10 +795,6 @@ def com_google_fonts_check_ttx_roundtrip(font):
       for msg in export_error_msgs:
         yield FAIL, msg.strip()
 
-    f = ttx.TTFont()
-    f.importXML(font + ".xml")
-    import_error_msgs = [msg for msg in logger.msgs if msg not in export_error_msgs]
-
     if len(import_error_msgs):
       failed = True
       yield INFO, ("While importing an XML file and converting"
@@ -807,27 +802,26 @@ def com_google_fonts_check_ttx_roundtrip(font):
                    " listed below.")
       for msg in import_error_msgs:
         yield FAIL, msg.strip()
-    logger.restore()
   except ExpatError as e:
     failed = True
     yield FAIL, ("TTX had some problem parsing the generated XML file."
                  " This most likely mean there's some problem in the font."
-		 " Please inspect the output of ttx in order to find more"
-		 " on what went wrong. A common problem is the presence of"
+                 " Please inspect the output of ttx in order to find more"
+                 " on what went wrong. A common problem is the presence of"
                  " control characteres outside the accepted character range"
                  " as defined in the XML spec. FontTools has got a bug which"
                  " causes TTX to generate corrupt XML files in those cases."
                  " So, check the entries of the name table and remove any"
                  " control chars that you find there."
-		 " The full ttx error message was:\n"
-		 "======\n{}\n======".format(e))
+                 " The full ttx error message was:\n"
+                 "======\n{}\n======".format(e))
 
   if not failed:
-    yield PASS, "Hey! It all looks good!"
-
-  # and then we need to cleanup our mess...
-  if os.path.exists(xml_file):
-    os.remove(xml_file)
+    if tables:
+      yield PASS, ("Hey! It all looks good! Round-tripped only these"
+                   " tables: {}".format(", ".join(tables)))
+    else:
+      yield PASS, "Hey! It all looks good!"
 
 
 @check(
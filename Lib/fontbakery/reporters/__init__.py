@@ -7,6 +7,7 @@ domains as well.
 Domain specific knowledge should be encoded only in the Profile (Checks,
 Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 """
+import tempfile
 from collections import Counter
 
 from fontbakery.checkrunner import (
@@ -27,11 +28,15 @@ from fontbakery.checkrunner import (
             )
 
 class FontbakeryReporter:
-  def __init__(self, is_async=False, runner=None):
+  def __init__(self, is_async=False, runner=None, keep_results=True):
     self._started = None
     self._ended = None
     self._order = None
-    self._results = [] # ENDCHECK events in order of appearance
+    # ENDCHECK events in order of appearance, empty if not keep_results,
+    # e.g. when the memory use shouldn't grow with the number of checks
+    self._results = []
+    self._keep_results = keep_results
+    self._finished = 0
     self._indexes = {}
     self._tick = 0
     self._counter = Counter()
@@ -71,7 +76,7 @@ class FontbakeryReporter:
   def _set_order(self, order):
     self._order = tuple(order)
     length = len(self._order)
-    self._counter['(not finished)'] = length - len(self._results)
+    self._counter['(not finished)'] = length - self._finished
     self._indexes = dict(zip(map(self._get_key, self._order), range(length)))
 
   def _cleanup(self, event):
@@ -91,7 +96,9 @@ class FontbakeryReporter:
       self._ended = event
 
     if status == ENDCHECK:
-      self._results.append(event)
+      if self._keep_results:
+        self._results.append(event)
+      self._finished += 1
       self._counter[message.name] += 1
       self._counter['(not finished)'] -= 1
 
@@ -120,3 +127,46 @@ class FontbakeryReporter:
     self._register(event)
     self._cleanup(event)
     self._output(event)
+
+
+class FragmentSpool:
+  """ Collects the rendered fragments of a report in groups (e.g. one
+  group per section) until all items of a group are done, so reporters
+  can write a group as soon as it is complete, rather than keeping the
+  whole document until the end. The fragments are kept in a temporary
+  file, which stays in memory only up to `max_size` bytes.
+
+  expected: an iterable of the group of each item that will be added,
+            e.g. one entry per identity of the execution order.
+  """
+  def __init__(self, expected, max_size=1 << 22):
+    self._remaining = Counter(expected)
+    # group: [(sort_key, offset, length)]
+    self._fragments = {}
+    self._file = tempfile.SpooledTemporaryFile(max_size=max_size)
+
+  def add(self, group, fragment=None, sort_key=0):
+    """ Mark one item of `group` as done. Its fragment, if not None, is
+    stored. Returns True if the group is complete. """
+    if fragment is not None:
+      data = fragment.encode('utf-8')
+      self._file.seek(0, 2)
+      self._fragments.setdefault(group, []).append(
+                                    (sort_key, self._file.tell(), len(data)))
+      self._file.write(data)
+    self._remaining[group] -= 1
+    return self.is_complete(group)
+
+  def is_complete(self, group):
+    return self._remaining[group] <= 0
+
+  def pop(self, group):
+    """ Yields the (sort_key, fragment) tuples of `group`, sorted stable by
+    `sort_key`, and forgets them. """
+    for sort_key, offset, length in sorted(self._fragments.pop(group, []),
+                                           key=lambda item: item[0]):
+      self._file.seek(offset)
+      yield sort_key, self._file.read(length).decode('utf-8')
+
+  def close(self):
+    self._file.close()
@@ -0,0 +1,61 @@
+"""
+Font Bakery reporters/baseline compares the results of the Font Bakery
+CheckRunner Protocol to the results of a `fontbakery.baseline.Baseline`.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+from fontbakery.baseline import get_results, get_relative_names
+from fontbakery.checkrunner import ENDCHECK
+from fontbakery.reporters import FontbakeryReporter
+
+
+class BaselineDiffReporter(FontbakeryReporter):
+  """
+  usage:
+  >> dr = BaselineDiffReporter(baseline, runner=runner)
+  >> dr.run()
+  >> dr.transitions
+  """
+  def __init__(self, baseline, **kwd):
+    super(BaselineDiffReporter, self).__init__(**kwd)
+    self._baseline = baseline
+    self._baseline_results = get_results(baseline.doc)
+    # {filename: name} like in `get_results`
+    self._names = None
+    self._transitions = []
+    self._reused = 0
+
+  @property
+  def transitions(self):
+    """ A list of (check id, filename, baseline status, status) tuples of
+    the check executions of this run whose result changed, in execution
+    order. The baseline status is None for new check executions. """
+    return self._transitions
+
+  @property
+  def reused(self):
+    """ The number of check results that were reused from the baseline. """
+    return self._reused
+
+  def _output(self, event):
+    status, message, (_, check, iterargs) = event
+    if status != ENDCHECK:
+      return
+    filename = self.runner.get_iterarg(*iterargs[0]) if iterargs else None
+    if self._baseline.has_result(self.runner.get_result_key(check, iterargs),
+                                 filename):
+      self._reused += 1
+    if self._names is None:
+      self._names = get_relative_names(value
+                      for values in self.runner.iterargs.values()
+                      for value in values)
+    old = self._baseline_results.get((check.id, self._names.get(filename)),
+                                     None)
+    if old != message.name:
+      self._transitions.append((check.id, filename, old, message.name))
@@ -1,16 +1,26 @@
+import io
 import os
+from fontbakery.reporters import FragmentSpool
 from fontbakery.reporters.serialize import SerializeReporter
-from fontbakery.checkrunner import Status
+from fontbakery.checkrunner import Status, START, ENDCHECK, END
 from fontbakery import __version__ as version
 
 LOGLEVELS=["ERROR","FAIL","WARN","SKIP","INFO","PASS","DEBUG"]
 
 
 class GHMarkdownReporter(SerializeReporter):
+  """
+  Writes the report to `file` while the checks run, the checks of each
+  font file (and the family checks) as soon as they are all done. Without
+  a `file` the report is returned by `get_markdown`.
+  """
 
-  def __init__(self, loglevels, **kwd):
+  def __init__(self, loglevels, file=None, **kwd):
     super(GHMarkdownReporter, self).__init__(**kwd)
     self.loglevels = loglevels
+    self._file = file if file is not None else io.StringIO()
+    self._spool = None
+    self._num_checks = 0
 
 
   def emoticon(self, name):
@@ -88,52 +98,63 @@ class GHMarkdownReporter(SerializeReporter):
     return section
 
 
-  def get_markdown(self):
-    checks = {}
-    family_checks = []
-    data = self.getdoc()
-    num_checks = 0
-    for section in data["sections"]:
-      for cluster in section["checks"]:
-        if not isinstance(cluster, list):
-          cluster = [cluster]
-        num_checks += len(cluster)
-        for check in cluster:
-          if self.omit_loglevel(check["result"]):
-            continue
-
-          check['profile'] = self.deduce_profile_from_section_name(section["key"][0])
-          if "filename" not in check.keys():
-            # That's a family check!
-            family_checks.append(check)
-          else:
-            key = os.path.basename(check["filename"])
-            if key not in checks:
-              checks[key] = []
-            checks[key].append(check)
-
-    md = "## Fontbakery report\n\n"
-    md += f"Fontbakery version: {version}\n\n"
-
-    if family_checks:
-      family_checks.sort(key=lambda c: c["result"])
-      md += self.html5_collapsible("<b>[{}] Family checks</b>".format(len(family_checks)),
-                                   "".join(map(self.check_md, family_checks)) + "<br>")
-
-    for filename in checks.keys():
-      checks[filename].sort(key=lambda c: LOGLEVELS.index(c["result"]))
-      md += self.html5_collapsible("<b>[{}] {}</b>".format(len(checks[filename]),
-                                                           filename),
-                                   "".join(map(self.check_md, checks[filename])) + "<br>")
-
-    if num_checks != 0:
+  def _get_group(self, identity):
+    """ The basename of the checked file, None for family checks. """
+    _, _, iterargs = identity
+    if not iterargs:
+      return None
+    return os.path.basename(self.runner.get_iterarg(*iterargs[0]))
+
+
+  def _output(self, event):
+    status, message, identity = event
+    if status == START:
+      self._spool = FragmentSpool(map(self._get_group, self._order))
+      self._file.write("## Fontbakery report\n\n")
+      self._file.write(f"Fontbakery version: {version}\n\n")
+      self._file.flush()
+    elif status == ENDCHECK:
+      self._num_checks += 1
+      # The check is rendered, its item isn't needed anymore.
+      check = self._items.pop(self._get_key(identity))
+      group = self._get_group(identity)
+      fragment = None
+      if not self.omit_loglevel(check["result"]):
+        check['profile'] = self.deduce_profile_from_section_name(check["key"][0])
+        fragment = self.check_md(check)
+      if group is None:
+        sort_key = check["result"]
+      else:
+        sort_key = LOGLEVELS.index(check["result"])
+      if self._spool.add(group, fragment, sort_key):
+        self._write_group(group)
+    elif status == END:
+      self._write_summary(message)
+      self._file.flush()
+      self._spool.close()
+
+
+  def _write_group(self, group):
+    fragments = [fragment for _, fragment in self._spool.pop(group)]
+    if not fragments:
+      return
+    title = "Family checks" if group is None else group
+    self._file.write(self.html5_collapsible("<b>[{}] {}</b>".format(len(fragments),
+                                                                    title),
+                                            "".join(fragments) + "<br>"))
+    self._file.flush()
+
+
+  def _write_summary(self, results):
+    md = ""
+    if self._num_checks != 0:
       summary_table = "### Summary\n\n" + \
                       ("| {} " + " | {} ".join(LOGLEVELS) + " |\n").format(*[self.emoticon(k) for k in LOGLEVELS]) + \
                       ("|:-----:|:----:|:----:|:----:|:----:|:----:|:----:|\n"
                        "| {} | {} | {} | {} | {} | {} | {} |\n"
-                       "").format(*[data["result"][k] for k in LOGLEVELS]) +\
+                       "").format(*[results[k] for k in LOGLEVELS]) +\
                       ("| {:.0f}% | {:.0f}% | {:.0f}% | {:.0f}% | {:.0f}% | {:.0f}% | {:.0f}% |\n"
-                       "").format(*[100*data["result"][k]/num_checks for k in LOGLEVELS])
+                       "").format(*[100*results[k]/self._num_checks for k in LOGLEVELS])
       md += "\n" + summary_table
 
     omitted = [l for l in LOGLEVELS if self.omit_loglevel(l)]
@@ -141,5 +162,8 @@ class GHMarkdownReporter(SerializeReporter):
       md += "\n" + \
             "**Note:** The following loglevels were omitted in this report:\n" + \
             "".join(map("* **{}**\n".format, omitted))
+    self._file.write(md)
+
 
-    return md
+  def get_markdown(self):
+    return self._file.getvalue()
@@ -1,11 +1,11 @@
 """Reporter class that renders report as a HTML document."""
 
-import collections
 import html
-from typing import List, Dict
+import io
 
 import fontbakery.checkrunner
 import fontbakery.reporters.serialize
+from fontbakery.reporters import FragmentSpool
 
 LOGLEVELS = ["ERROR", "FAIL", "WARN", "SKIP", "INFO", "PASS", "DEBUG"]
 EMOTICON = {
@@ -21,80 +21,134 @@ ISSUE_URL = "https://github.com/googlefonts/fontbakery/issues"
 
 
 class HTMLReporter(fontbakery.reporters.serialize.SerializeReporter):
-    """Renders a report as a HTML document."""
+    """Renders a report as a HTML document.
 
-    def __init__(self, loglevels, **kwd):
+    The document is written to `file` while the checks run: each section
+    as soon as all of its checks are done and the summary table, in the
+    space reserved for it at the top, at the end. Without a `file` the
+    document is returned by `get_html`.
+    """
+
+    def __init__(self, loglevels, file=None, **kwd):
         super(HTMLReporter, self).__init__(**kwd)
         self.loglevels = loglevels
+        self._file = file if file is not None else io.StringIO()
+        self._spool = None
+        self._num_checks = 0
+        # {section key: {check name: (index, description)}}
+        self._section_checks = {}
+        self._summary_position = None
+        self._summary_space = ""
 
     def get_html(self) -> str:
         """Return complete report as a HTML string."""
-        data = self.getdoc()
-        num_checks = 0
-        body_elements = []
-
-        # Order by section first...
-        for section in data["sections"]:
-            section_name = html.escape(section["key"][0])
-            section_stati_of_note = (
-                e for e in section["result"].elements() if e != "PASS"
-            )
-            section_stati = "".join(
-                EMOTICON[s] for s in sorted(section_stati_of_note, key=LOGLEVELS.index)
+        return self._file.getvalue()
+
+    def _output(self, event):
+        status, message, identity = event
+        section, _, _ = identity
+        if status == fontbakery.checkrunner.START:
+            self._spool = FragmentSpool(
+                self._get_key((section, None, None)) for section, _, _ in self._order
             )
-            body_elements.append(f"<h2>{section_name} {section_stati}</h2>")
-
-            checks_by_id: Dict[str, List[Dict[str, str]]] = collections.defaultdict(
-                list
+            self._write_top()
+        elif status == fontbakery.checkrunner.ENDCHECK:
+            self._num_checks += 1
+            # The check is rendered, its item isn't needed anymore.
+            check = self._items.pop(self._get_key(identity))
+            section_key = self._get_key((section, None, None))
+            checks = self._section_checks.setdefault(section_key, {})
+            check_name = check["key"][1]
+            if check_name not in checks:
+                checks[check_name] = (len(checks), check["description"])
+            self._spool.add(
+                section_key, self.html_for_result(check), checks[check_name][0]
             )
-            # ...and check second.
-            for cluster in section["checks"]:
-                if not isinstance(cluster, list):
-                    cluster = [cluster]
-                num_checks += len(cluster)
-                for check in cluster:
-                    checks_by_id[check["key"][1]].append(check)
-            for check, results in checks_by_id.items():
-                check_name = html.escape(check)
-                body_elements.append(f"<h3>{results[0]['description']}</h3>")
-                body_elements.append(f"<div>Check ID: {check_name}</div>")
-                for result in results:
-                    if "filename" in result:
-                        body_elements.append(
-                            html5_collapsible(
-                                f"{EMOTICON[result['result']]} <strong>{result['filename']}</strong>",
-                                self.html_for_check(result),
-                            )
-                        )
-                    else:
-                        body_elements.append(
-                            html5_collapsible(
-                                f"{EMOTICON[result['result']]} <strong>Family check</strong>",
-                                self.html_for_check(result),
-                            )
-                        )
-
+        elif status == fontbakery.checkrunner.ENDSECTION:
+            section_key = self._get_key(identity)
+            if self._spool.is_complete(section_key):
+                self._write_section(section_key)
+        elif status == fontbakery.checkrunner.END:
+            self._write_summary(message)
+            self._file.write(html5_document_end())
+            self._file.flush()
+            self._spool.close()
+
+    def _write_top(self):
+        self._file.write(html5_document_start())
         body_top = [
             "<h1>Fontbakery Technical Report</h1>",
             "<div>If you think a check is flawed or have an idea for a check, please "
             f" file an issue at <a href='{ISSUE_URL}'>{ISSUE_URL}</a> and remember "
             "to include a pointer to the repo and branch you're checking.</div>",
         ]
-
-        if num_checks:
-            results_summary = [data["result"][k] for k in LOGLEVELS]
-            body_top.append(summary_table(*results_summary, num_checks))
+        for element in body_top:
+            self._file.write(element + "\n")
+
+        # Reserve the space of the largest possible summary table, it is
+        # filled in at the end.
+        total = len(self._order)
+        if total and self._file.seekable():
+            self._summary_space = blank(
+                summary_table(*[total] * len(LOGLEVELS), total),
+                getattr(self._file, "encoding", None),
+            )
+            self._summary_position = self._file.tell()
+            self._file.write(self._summary_space + "\n")
 
         omitted = [l for l in LOGLEVELS if self.omit_loglevel(l)]
         if omitted:
-            body_top.append(
+            self._file.write(
                 "<p><strong>Note:</strong>"
                 " The following loglevels were omitted in this report:"
-                f" {', '.join(omitted)}</p>"
+                f" {', '.join(omitted)}</p>\n"
             )
+        self._file.flush()
 
-        body_elements[0:0] = body_top
-        return html5_document(body_elements)
+    def _write_section(self, section_key):
+        section = self._items.pop(section_key)
+        section_name = html.escape(section_key[0])
+        section_stati_of_note = (
+            e for e in section["result"].elements() if e != "PASS"
+        )
+        section_stati = "".join(
+            EMOTICON[s] for s in sorted(section_stati_of_note, key=LOGLEVELS.index)
+        )
+        self._file.write(f"<h2>{section_name} {section_stati}</h2>\n")
+
+        # The results are grouped by check.
+        checks = {
+            index: (check_name, description)
+            for check_name, (index, description)
+            in self._section_checks.pop(section_key).items()
+        }
+        current = None
+        for index, fragment in self._spool.pop(section_key):
+            if index != current:
+                current = index
+                check_name, description = checks[index]
+                self._file.write(f"<h3>{description}</h3>\n")
+                self._file.write(f"<div>Check ID: {html.escape(check_name)}</div>\n")
+            self._file.write(fragment + "\n")
+        self._file.flush()
+
+    def _write_summary(self, results):
+        if not self._num_checks:
+            return
+        summary = summary_table(
+            *[results[k] for k in LOGLEVELS], self._num_checks
+        )
+        encoding = getattr(self._file, "encoding", None)
+        padding = encoded_length(self._summary_space, encoding) - encoded_length(
+            summary, encoding
+        )
+        if self._summary_position is None or padding < 0:
+            self._file.write(summary + "\n")
+            return
+        end = self._file.tell()
+        self._file.seek(self._summary_position)
+        self._file.write(summary + " " * padding)
+        self._file.seek(end)
 
     def omit_loglevel(self, msg) -> bool:
         """Determine if message is below log level."""
@@ -102,6 +156,17 @@ class HTMLReporter(fontbakery.reporters.serialize.SerializeReporter):
             self.loglevels[0] > fontbakery.checkrunner.Status(msg)
         )
 
+    def html_for_result(self, check) -> str:
+        """Return HTML string for the collapsible result of a check."""
+        if "filename" in check:
+            target = check["filename"]
+        else:
+            target = "Family check"
+        return html5_collapsible(
+            f"{EMOTICON[check['result']]} <strong>{target}</strong>",
+            self.html_for_check(check),
+        )
+
     def html_for_check(self, check) -> str:
         """Return HTML string for complete single check."""
         check["logs"].sort(key=lambda c: LOGLEVELS.index(c["status"]))
@@ -126,6 +191,12 @@ class HTMLReporter(fontbakery.reporters.serialize.SerializeReporter):
 
 def html5_document(body_elements) -> str:
     """Return complete HTML5 document string."""
+    body = "\n".join(body_elements)
+    return f"{html5_document_start()}{body}{html5_document_end()}"
+
+
+def html5_document_start() -> str:
+    """Return the HTML5 document up to the contents of the body."""
 
     style = """
             html {
@@ -179,7 +250,6 @@ def html5_document(body_elements) -> str:
                 flex: 1 0;
             }
             """
-    body = "\n".join(body_elements)
     return f"""<!DOCTYPE html>
                 <html lang="en">
                     <head>
@@ -190,11 +260,31 @@ def html5_document(body_elements) -> str:
                         </style>
                     </head>
                     <body>
-                    {body}
+                    """
+
+
+def html5_document_end() -> str:
+    """Return the end of the HTML5 document, after the body contents."""
+    return """
                     </body>
                 </html>"""
 
 
+def encoded_length(text, encoding) -> int:
+    """Return the length of text in a file with encoding, in characters if
+    encoding is None (e.g. io.StringIO)."""
+    if encoding is None:
+        return len(text)
+    return len(text.encode(encoding))
+
+
+def blank(text, encoding) -> str:
+    """Return whitespace that takes up as much space in a file as text."""
+    return "".join(
+        "\n" if c == "\n" else " " * encoded_length(c, encoding) for c in text
+    )
+
+
 def html5_collapsible(summary, details) -> str:
     """Return nestable, collapsible <detail> tag for check grouping and sub-
     results."""
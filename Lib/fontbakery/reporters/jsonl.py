@@ -0,0 +1,132 @@
+"""
+Font Bakery reporters/jsonl writes the results of the Font Bakery
+CheckRunner Protocol as a stream of JSON Lines, one line per record:
+
+  {"start": {...}}   the header of the document, at START
+  {"check": {...}}   the result of a check, at each ENDCHECK
+  {"end": {...}}     the result, the sections and the timings, at END
+
+Each record is written and flushed as soon as it is complete and only
+the counts of the results are kept, so the memory use doesn't grow with
+the number of check results and the report can be followed while the
+checks run. `fold` turns the records back into the
+document of `SerializeReporter.getdoc`.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+import json
+from collections import OrderedDict
+
+from fontbakery.checkrunner import (
+              ENDCHECK
+            , START
+            , END
+            )
+from fontbakery.reporters import FontbakeryReporter
+from fontbakery.reporters.serialize import SerializeReporter
+
+class JSONLReporter(FontbakeryReporter):
+  """
+  usage:
+  >> with open('report.jsonl', 'w') as f:
+  >>   JSONLReporter(f, runner=runner, collect_results_by='font').run()
+
+  The items are collected like by a SerializeReporter, but the item of
+  a check is dropped once it is written, hence there's no `getdoc`, use
+  `fold` on the written records.
+  """
+  def __init__(self, file, collect_results_by=None, **kwd):
+    super(JSONLReporter, self).__init__(keep_results=False, **kwd)
+    self._file = file
+    self._serializer = SerializeReporter(runner=self.runner,
+                                    collect_results_by=collect_results_by,
+                                    keep_results=False)
+
+  def _write(self, record):
+    self._file.write(json.dumps(record, sort_keys=True) + '\n')
+    self._file.flush()
+
+  def _register(self, event):
+    super(JSONLReporter, self)._register(event)
+    self._serializer.receive(event)
+
+  def _output(self, event):
+    status, _, identity = event
+    if status == START:
+      doc = dict(self._serializer.get_item(identity))
+      del doc['sections']
+      self._write({'start': doc})
+    elif status == ENDCHECK:
+      # The check is done, its item isn't needed anymore.
+      self._write({'check': self._serializer.pop_item(identity)})
+    elif status == END:
+      doc = dict(self._serializer.get_item(identity))
+      sections = OrderedDict()
+      for section, _, _ in self._order:
+        identity = (section, None, None)
+        key = self._get_key(identity)
+        if key not in sections:
+          sections[key] = dict(self._serializer.get_item(identity))
+          del sections[key]['checks']
+      doc['sections'] = list(sections.values())
+      timings = getattr(self.runner, 'timings', None)
+      if timings is not None:
+        doc['timings'] = timings.get_summary(self.runner.get_iterarg)
+      self._write({'end': doc})
+
+
+def fold(lines):
+  """ Returns the document `SerializeReporter.getdoc` would create (after
+  a JSON round trip) from the lines written by a JSONLReporter, e.g. an
+  opened file.
+  """
+  doc = end = None
+  checks = []
+  for line in lines:
+    if not line.strip():
+      continue
+    record = json.loads(line)
+    if 'start' in record:
+      doc = record['start']
+    elif 'check' in record:
+      checks.append(record['check'])
+    elif 'end' in record:
+      end = record['end']
+  if doc is None or end is None:
+    raise ValueError('Incomplete report, the START or END record is missing.')
+
+  sections = OrderedDict((section['key'][0], dict(section, checks=[]))
+                                            for section in end.pop('sections'))
+  doc.update(end, sections=[])
+  results_by = doc.get('clusteredBy', None)
+  if results_by:
+    indexes = [check['clustered']['index'] for check in checks
+                                  if check['clustered']['index'] is not None]
+    clusterlen = max(indexes, default=-1) + 1
+    if results_by != '*check':
+      # + 1 for rests bucket
+      clusterlen += 1
+  seen = set()
+  for check in checks:
+    section_name = check['key'][0]
+    section = sections[section_name]
+    if results_by:
+      if not section['checks']:
+        section['checks'] = [[] for _ in range(clusterlen)]
+      index = check['clustered']['index']
+      if index is None:
+        # last element collects unclustered
+        index = -1
+      section['checks'][index].append(check)
+    else:
+      section['checks'].append(check)
+    if section_name not in seen:
+      seen.add(section_name)
+      doc['sections'].append(section)
+  return doc
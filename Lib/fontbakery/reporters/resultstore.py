@@ -0,0 +1,89 @@
+"""
+Font Bakery reporters/resultstore appends the results of the Font Bakery
+CheckRunner Protocol to a `fontbakery.resultstore.ResultStore`, one row
+per check, while the checks run.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+import os
+
+from fontbakery.checkrunner import (
+              DEBUG
+            , STARTCHECK
+            , ENDCHECK
+            , START
+            , END
+            )
+from fontbakery.reporters import FontbakeryReporter
+from fontbakery.resultcache import get_file_digest
+
+class ResultStoreReporter(FontbakeryReporter):
+  """
+  usage:
+  >> store = ResultStore('results.sqlite')
+  >> ResultStoreReporter(store, runner=runner).run()
+  >> store.close()
+  """
+  def __init__(self, store, version=None, commit_every=1000, **kwd):
+    """
+    store: a ResultStore
+    version: stored with the run, e.g. the Font Bakery version
+    commit_every: commit the added results after this many checks
+    """
+    super(ResultStoreReporter, self).__init__(**kwd)
+    self._store = store
+    self._version = version
+    self._commit_every = commit_every
+    self._run_id = None
+    self._uncommitted = 0
+    # {key: [(status name, message code)]}
+    self._running = {}
+    self._digests = {}
+
+  @property
+  def run_id(self):
+    return self._run_id
+
+  def _get_digest(self, value):
+    if not isinstance(value, str) or not os.path.isfile(value):
+      return None
+    if value not in self._digests:
+      self._digests[value] = get_file_digest(value)
+    return self._digests[value]
+
+  def _output(self, event):
+    status, message, identity = event
+    _, check, iterargs = identity
+    if status == START:
+      self._run_id = self._store.start_run(self._version)
+    elif status == STARTCHECK:
+      self._running[self._get_key(identity)] = []
+    elif status == ENDCHECK:
+      logs = self._running.pop(self._get_key(identity))
+      codes = [str(code) for name, code in logs
+                           if name == message.name and code is not None]
+      filename = font_hash = None
+      if iterargs:
+        filename = self.runner.get_iterarg(*iterargs[0])
+        font_hash = self._get_digest(filename)
+        filename = str(filename)
+      self._store.add_result(self._run_id, check.id, message.name,
+                             code=','.join(codes) or None,
+                             filename=filename, font_hash=font_hash,
+                             duration=self.runner.get_check_duration(check,
+                                                                     iterargs))
+      self._uncommitted += 1
+      if self._uncommitted >= self._commit_every:
+        self._store.commit()
+        self._uncommitted = 0
+    elif status == END:
+      self._store.finish_run(self._run_id)
+    elif check and status >= DEBUG:
+      self._running[self._get_key(identity)].append(
+                              (status.name, getattr(message, 'code', None)))
@@ -10,6 +10,8 @@ domains as well.
 Domain specific knowledge should be encoded only in the Profile (Checks,
 Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 """
+from collections import Counter
+
 from fontbakery.checkrunner import (
               DEBUG
             , STARTSECTION
@@ -70,6 +72,11 @@ class SerializeReporter(FontbakeryReporter):
         item.update(dict(key=key, result=None, checks=[]))
       if check:
         item.update(dict(key=key, result=None, logs=[]))
+        if self.runner:
+          # identifies the check execution, e.g. for `--baseline`
+          result_key = self.runner.get_result_key(check, iterargs)
+          if result_key is not None:
+            item['resultKey'] = result_key
         if self._results_by:
           if self._results_by == '*check':
             if check.id not in self._observed_checks:
@@ -103,18 +110,36 @@ class SerializeReporter(FontbakeryReporter):
       if item["key"][2] != ():
         item['filename'] = self.runner.get_iterarg(*item["key"][2][0])
 
-    if status in (END, ENDSECTION):
+    if status == END:
       item['result'] = message # is a Counter
+    if status == ENDSECTION:
+      # is a Counter
+      # A section can end more than once, e.g. with a font major order.
+      if item['result'] is None:
+        item['result'] = Counter(message)
+      else:
+        item['result'].update(message)
     if status == ENDCHECK:
       item['result'] = message.name # is a Status
     if status >= DEBUG:
       item['logs'].append(dict(
                           status= status.name
                         , message= f'{message}'
+                        , code= getattr(message, 'code', None)
                         , traceback= getattr(message, 'traceback', None)
                         )
                       )
 
+  def get_item(self, identity):
+    """ Returns the item of the document, the check, section or main
+    item, of `identity`. """
+    return self._items[self._get_key(identity)]
+
+  def pop_item(self, identity):
+    """ Like `get_item`, but the item is not kept, e.g. when it was
+    written already. `getdoc` can't be used anymore. """
+    return self._items.pop(self._get_key(identity))
+
   def getdoc(self):
     if not self._ended:
       raise Exception('Can\'t create doc before END status was recevived.')
@@ -148,5 +173,8 @@ class SerializeReporter(FontbakeryReporter):
       if sectionKey not in seen:
         seen.add(sectionKey)
         doc['sections'].append(sectionDoc)
+    timings = getattr(self.runner, 'timings', None)
+    if timings is not None:
+      doc['timings'] = timings.get_summary(self.runner.get_iterarg)
     self._doc = doc
     return doc
@@ -14,7 +14,7 @@ Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 """
 import sys
 import os
-import subprocess
+import shutil
 from collections import Counter
 from functools import partial
 import builtins # using this to override print function somewhere
@@ -133,8 +133,8 @@ class ThrottledOut:
       progressbar, reset_progressbar = self._draw_progressbar()
       self._buffer.append(progressbar)
 
-    for line in self._buffer:
-      self._outFile.write(line)
+    # one write per flush
+    self._outFile.write(''.join(self._buffer))
     #self._outFile.flush() needed?
     self._buffer = []
     if reset_progressbar:
@@ -170,6 +170,8 @@ class TerminalProgress(FontbakeryReporter):
       self.stdout = stdout
 
     self._progressbar = []
+    # {(status name, text): the text formatted with the theme}
+    self._formatted_statuses = {}
     self._cupcake = cupcake
     self._skip_status_report = skip_status_report or tuple()
     if structure_threshold:
@@ -231,12 +233,20 @@ class TerminalProgress(FontbakeryReporter):
       for event in self._results:
         self._set_progress_event(event)
 
+  def _format_status(self, status, text=None):
+    """ Like formatStatus with self.theme, but each status and text is
+    formatted only once. """
+    key = (getattr(status, 'name', status), text)
+    formatted = self._formatted_statuses.get(key, None)
+    if formatted is None:
+      formatted = self._formatted_statuses[key] = \
+                                        formatStatus(self.theme, status, text)
+    return formatted
+
   def _set_progress_event(self, event):
       _, status, identity = event
       index = self._get_index(identity)
-      self._progressbar[index] = formatStatus(self.theme,
-                                              status,
-                                              status.name[0])
+      self._progressbar[index] = self._format_status(status, status.name[0])
 
   def _get_index(self, identity):
     index = super(TerminalProgress, self)._get_index(identity)
@@ -285,8 +295,20 @@ class TerminalProgress(FontbakeryReporter):
 
     append('', len_prefix)
     append('[')
-    for item in self._progressbar:
-      append(item)
+    items = self._progressbar
+    start = 0
+    while start < len(items):
+      if columns and status.count >= columns:
+        # this item may need a line break
+        append(items[start])
+        start += 1
+        continue
+      # all items that still fit into the current line
+      end = start + columns - status.count if columns else len(items)
+      chunk = items[start:end]
+      progressbar.extend(chunk)
+      status.count += len(chunk)
+      start += len(chunk)
     append(']')
     percentstring = f'{percent:3d}%'
     append(percentstring, len(percentstring), ' ')
@@ -294,14 +316,8 @@ class TerminalProgress(FontbakeryReporter):
 
 
   def draw_progressbar(self):
-    # tty size
-    if sys.platform == "win32":
-      mode = subprocess.Popen(
-          "mode", shell=True, stdout=subprocess.PIPE).stdout.readlines()
-      columns_entry = [s for s in mode if b"Columns" in s]
-      columns = int(columns_entry[0].split()[1])
-    else:
-      columns = int(os.popen('stty size').read().split()[1])
+    # tty size, without starting a subprocess on each redraw
+    columns = shutil.get_terminal_size().columns
     # this is the amout of space the spinner takes when rendered in the tty
     # NOTE: the color codes are not taking space in the tty, so we can't
     # just take the length of `spinner`.
@@ -347,6 +363,8 @@ class TerminalReporter(TerminalProgress):
     self.results_by = collect_results_by
     self._collected_results = {}
     self._event_buffers = {}
+    # {check id: rendered rationale}, a check runs once per font
+    self._rationales = {}
 
     # logs can occur at any point in the logging protocol
     # especially DEBUG, INFO, WARNING and ERROR
@@ -383,6 +401,21 @@ class TerminalReporter(TerminalProgress):
         self._collected_results[key] = Counter()
       self._collected_results[key][message.name] += 1
 
+  def _render_rationale(self, check):
+    rationale = self._rationales.get(check.id, None)
+    if rationale is None:
+      from fontbakery.utils import text_flow, unindent_rationale
+      content = unindent_rationale(check.rationale).strip()
+      rationale = self._rationales[check.id] = \
+          '    ' + self.theme["rationale-title"]("  Rationale:" + " " * 64) + '\n' \
+          + text_flow(content,
+                      width=76,
+                      indent=4,
+                      left_margin=2,
+                      space_padding=True,
+                      text_color=self.theme["rationale-text"])
+    return rationale
+
   def _render_event_sync(self, print, event):
     status, message, (section, check, iterargs) = event
 
@@ -436,21 +469,12 @@ class TerminalReporter(TerminalProgress):
           with_string))
 
         if check.rationale:
-          from fontbakery.utils import text_flow, unindent_rationale
-          content = unindent_rationale(check.rationale).strip()
-          print('    ' + self.theme["rationale-title"]("  Rationale:" + " " * 64) + '\n'
-                + text_flow(content,
-                            width=76,
-                            indent=4,
-                            left_margin=2,
-                            space_padding=True,
-                            text_color=self.theme["rationale-text"]))
+          print(self._render_rationale(check))
 
     # Log statuses have weights >= 0
     # log_statuses = (INFO, WARN, PASS, SKIP, FAIL, ERROR, DEBUG)
     if status.weight >= self._log_threshold:
-      print('    * {}: {}'.format(formatStatus(self.theme, status),
-                                    message))
+      print('    * {}: {}'.format(self._format_status(status), message))
       if hasattr(message, 'traceback'):
         print('        ','\n         '.join(message.traceback.split('\n')))
 
@@ -458,7 +482,7 @@ class TerminalReporter(TerminalProgress):
     if status == ENDCHECK:
       if not self.succinct:
         print('\n')
-      print('    Result: {}\n'.format(formatStatus(self.theme, message)))
+      print('    Result: {}\n'.format(self._format_status(message)))
 
     if status == ENDSECTION:
       print('')
@@ -0,0 +1,231 @@
+"""
+Font Bakery resultcache stores the results of check executions on disk.
+
+A stored result is reused when neither the checked files, nor the check
+(and the conditions it depends on), nor the values it consumes changed.
+Keys are sha256 hashes of:
+  * a salt, usually the Font Bakery version,
+  * the check id,
+  * the source code of the check and of all conditions it depends on,
+  * the versions of the external tools they use (`tool_version`),
+  * the contents of the consumed values, where values that are paths of
+    existing files or directories are represented by their absolute path
+    and their contents. Checks may read the name or the directory of a
+    file, so a renamed or moved file is checked again.
+
+Besides check results, the values of conditions flagged as `persistent`
+are stored, e.g. expensive measurements of a font that several checks,
+or later runs with changed checks, can reuse.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+import os
+import json
+import types
+import hashlib
+import inspect
+import tempfile
+
+from fontbakery.checkrunner import ERROR
+from fontbakery.multiproc import serialize_result, deserialize_result
+
+# closure values of these types have a stable repr and are part of
+# a check version, e.g. the overrides of `check_log_override`.
+_SIMPLE_TYPES = (str, int, float, bool, tuple, list, dict, type(None))
+
+
+def _sha256(data):
+  return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def get_file_digest(path):
+  """ The sha256 hex digest of the contents of the file at `path`. """
+  sha = hashlib.sha256()
+  with open(path, 'rb') as f:
+    for chunk in iter(lambda: f.read(1 << 20), b''):
+      sha.update(chunk)
+  return sha.hexdigest()
+
+
+def get_callable_version(item):
+  """ Return a hash of the source code of `item` and of everything it
+  wraps, i.e. the whole chain of `__wrapped__` attributes.
+  """
+  parts = []
+  seen = set()
+  while item is not None and id(item) not in seen:
+    seen.add(id(item))
+    if isinstance(item, types.FunctionType):
+      try:
+        parts.append(inspect.getsource(item))
+      except (OSError, TypeError):
+        parts.append(repr((item.__code__.co_code, item.__code__.co_consts)))
+      for cell in item.__closure__ or ():
+        try:
+          contents = cell.cell_contents
+        except ValueError: # empty cell
+          continue
+        if isinstance(contents, _SIMPLE_TYPES):
+          parts.append(repr(contents))
+    item = getattr(item, '__wrapped__', None)
+  return _sha256('\n'.join(parts))
+
+
+class ResultCache:
+  def __init__(self, directory, salt=''):
+    """
+    directory: where the results are stored. If None, nothing is stored,
+               the keys are still computed, e.g. to record them in reports.
+    salt: part of all keys, usually the Font Bakery version.
+    """
+    self._directory = directory
+    self._salt = salt
+    # caches for this process, a font is hashed once, not once per check
+    self._digests = {}
+    self._versions = {}
+
+  @property
+  def directory(self):
+    return self._directory
+
+  def _get_path_digest(self, path):
+    stat = os.stat(path)
+    cache_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    digest = self._digests.get(cache_key, None)
+    if digest is not None:
+      return digest
+    if os.path.isdir(path):
+      entries = []
+      for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+          filename = os.path.join(root, name)
+          entries.append((os.path.relpath(filename, path),
+                          self._get_path_digest(filename)))
+      digest = _sha256(json.dumps(entries))
+    else:
+      digest = get_file_digest(path)
+    self._digests[cache_key] = digest
+    return digest
+
+  def get_digest(self, value):
+    """ A hash of value. Paths are represented by the absolute path and
+    the file contents. """
+    if isinstance(value, str) and os.path.exists(value):
+      return _sha256(json.dumps([os.path.abspath(value),
+                                 self._get_path_digest(value)]))
+    if isinstance(value, (list, tuple)):
+      return _sha256(json.dumps([self.get_digest(item) for item in value]))
+    if isinstance(value, dict):
+      return _sha256(json.dumps(sorted((repr(key), self.get_digest(item))
+                                            for key, item in value.items())))
+    return _sha256(repr(value))
+
+  def get_version(self, item):
+    version = self._versions.get(item, None)
+    if version is None:
+      version = get_callable_version(item)
+      tool_version = getattr(item, 'tool_version', None)
+      if tool_version is not None:
+        version = _sha256(json.dumps([version, repr(tool_version())]))
+      self._versions[item] = version
+    return version
+
+  def get_key(self, check, conditions, inputs, filename=None):
+    """
+    check: the FontBakeryCheck
+    conditions: all conditions the check depends on
+    inputs: a dict of all values the check consumes, directly or via
+            its conditions, including the iterarg values.
+    filename: the checked file, i.e. the first iterarg value, not part
+              of the key, but see `fontbakery.baseline.Baseline`.
+    """
+    return self._get_key(check.id, check, conditions, inputs)
+
+  def get_condition_key(self, condition, conditions, inputs):
+    """ Like `get_key`, the key of the value of a persistent condition.
+    `conditions` are the conditions `condition` depends on.
+    """
+    return self._get_key(f'condition:{condition.name}', condition,
+                         conditions, inputs)
+
+  def _get_key(self, name, item, conditions, inputs):
+    data = json.dumps([
+        self._salt
+      , name
+      , self.get_version(item)
+      , sorted((condition.name, self.get_version(condition))
+                                            for condition in conditions)
+      , sorted((name, self.get_digest(value))
+                                            for name, value in inputs.items())
+    ])
+    return _sha256(data)
+
+  def _get_path(self, key):
+    return os.path.join(self._directory, key[:2], f'{key[2:]}.json')
+
+  def has(self, key):
+    return self._directory is not None and os.path.exists(self._get_path(key))
+
+  def get(self, key):
+    """ Return the list of stored (status, message) tuples or None. """
+    data = self._read(key)
+    if data is None or 'results' not in data:
+      return None
+    return [deserialize_result(result) for result in data['results']]
+
+  def _read(self, key):
+    if self._directory is None:
+      return None
+    try:
+      with open(self._get_path(key), encoding='utf-8') as f:
+        return json.load(f)
+    except (OSError, ValueError):
+      return None
+
+  def _write(self, key, data):
+    if self._directory is None:
+      return False
+    path = self._get_path(key)
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    # Write to a temporary file first: never leave a half written entry,
+    # e.g. when multiple processes share the same cache.
+    handle, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+      with os.fdopen(handle, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+      os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+      # TypeError, ValueError: data is not JSON compatible
+      if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+      return False
+    return True
+
+  def set(self, key, results):
+    """ Store `results` unless one of them is an ERROR, because these are
+    usually caused by the environment (missing tools, etc.) rather than
+    by the checked files.
+    """
+    if any(status == ERROR for status, _ in results):
+      return False
+    return self._write(key, {'results': [serialize_result(status, message)
+                                            for status, message in results]})
+
+  def get_value(self, key):
+    """ Return a tuple (found, value) of a stored condition value. """
+    data = self._read(key)
+    if data is None or 'value' not in data:
+      return False, None
+    return True, data['value']
+
+  def set_value(self, key, value):
+    """ Store `value`, which must be JSON compatible. """
+    return self._write(key, {'value': value})
@@ -0,0 +1,188 @@
+"""
+Font Bakery resultstore keeps the check results of many runs in a SQLite
+database, e.g. of nightly runs, to find out when the result of a check
+changed.
+
+Each run adds one row to the `runs` table and one row per executed check
+to the `results` table:
+  * run_id: the id of the run,
+  * font_hash: the sha256 of the checked file, if the first iterarg value
+    is the path of a file, otherwise NULL,
+  * filename: the first iterarg value, NULL e.g. for family checks,
+  * check_id,
+  * status: the result of the check,
+  * code: the codes of the messages that have the status of the result,
+    comma separated,
+  * duration: the seconds the check took to run, NULL if it was not
+    executed, e.g. skipped or replayed from a result cache.
+The results are indexed by check id, font hash and filename.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+import sqlite3
+from collections import Counter, OrderedDict
+from datetime import datetime
+
+from fontbakery.baseline import get_relative_names
+from fontbakery.checkrunner import (
+              DEBUG
+            , PASS
+            , SKIP
+            , INFO
+            , WARN
+            , FAIL
+            , ERROR
+            )
+
+_STATUS_WEIGHTS = {status.name: status.weight
+                   for status in (DEBUG, PASS, SKIP, INFO, WARN, FAIL, ERROR)}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+  id INTEGER PRIMARY KEY,
+  started TEXT NOT NULL,
+  finished TEXT,
+  version TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+  run_id INTEGER NOT NULL REFERENCES runs (id),
+  font_hash TEXT,
+  filename TEXT,
+  check_id TEXT NOT NULL,
+  status TEXT NOT NULL,
+  code TEXT,
+  duration REAL
+);
+CREATE INDEX IF NOT EXISTS results_run_id ON results (run_id);
+CREATE INDEX IF NOT EXISTS results_check_id ON results (check_id);
+CREATE INDEX IF NOT EXISTS results_font_hash ON results (font_hash);
+CREATE INDEX IF NOT EXISTS results_filename ON results (filename);
+"""
+
+
+def _now():
+  return datetime.now().isoformat(timespec='seconds')
+
+
+class ResultStore:
+  def __init__(self, path):
+    self._connection = sqlite3.connect(path)
+    self._connection.executescript(_SCHEMA)
+
+  def close(self):
+    self._connection.commit()
+    self._connection.close()
+
+  def commit(self):
+    self._connection.commit()
+
+  def start_run(self, version=None):
+    """ Returns the id of the new run. """
+    cursor = self._connection.execute(
+              'INSERT INTO runs (started, version) VALUES (?, ?)',
+              (_now(), version))
+    self._connection.commit()
+    return cursor.lastrowid
+
+  def finish_run(self, run_id):
+    self._connection.execute('UPDATE runs SET finished = ? WHERE id = ?',
+                             (_now(), run_id))
+    self._connection.commit()
+
+  def add_result(self, run_id, check_id, status, code=None, filename=None,
+                 font_hash=None, duration=None):
+    """ Add a row to the results. Call `commit` to store it. """
+    self._connection.execute(
+              'INSERT INTO results (run_id, font_hash, filename, check_id,'
+              ' status, code, duration) VALUES (?, ?, ?, ?, ?, ?, ?)',
+              (run_id, font_hash, filename, check_id, status, code, duration))
+
+  def _filter(self, check_id=None, filename=None):
+    """ The WHERE clause and its parameters, `filename` matches any
+    part of the filename. """
+    clauses, parameters = [], []
+    if check_id is not None:
+      clauses.append('check_id = ?')
+      parameters.append(check_id)
+    if filename is not None:
+      clauses.append('filename LIKE ?')
+      parameters.append(f'%{filename}%')
+    return ' AND '.join(clauses) or '1', parameters
+
+  def get_runs(self):
+    """ Returns a list of dicts with the id, start and finish times,
+    version and result Counter of each run, oldest first. """
+    runs = OrderedDict()
+    for run_id, started, finished, version in self._connection.execute(
+            'SELECT id, started, finished, version FROM runs ORDER BY id'):
+      runs[run_id] = dict(id=run_id, started=started, finished=finished,
+                          version=version, results=Counter())
+    for run_id, status, count in self._connection.execute(
+            'SELECT run_id, status, COUNT(*) FROM results'
+            ' GROUP BY run_id, status'):
+      if run_id in runs:
+        runs[run_id]['results'][status] = count
+    return list(runs.values())
+
+  def get_trend(self, check_id=None, filename=None):
+    """ Returns a list of (run_id, started, Counter of statuses) tuples of
+    the matching results of all runs, oldest first. """
+    where, parameters = self._filter(check_id, filename)
+    trend = OrderedDict((run_id, (run_id, started, Counter()))
+                      for run_id, started in self._connection.execute(
+                                    'SELECT id, started FROM runs ORDER BY id'))
+    for run_id, status, count in self._connection.execute(
+            f'SELECT run_id, status, COUNT(*) FROM results WHERE {where}'
+            ' GROUP BY run_id, status', parameters):
+      trend[run_id][2][status] = count
+    return list(trend.values())
+
+  def get_results(self, run_id, check_id=None, filename=None):
+    """ Returns a dict {(check_id, name): (status, code)} of a run, name
+    is the filename relative to the common directory of all files of the
+    run, see `fontbakery.baseline.get_relative_names`. """
+    where, parameters = self._filter(check_id, filename)
+    rows = self._connection.execute(
+            'SELECT check_id, filename, status, code FROM results'
+            f' WHERE run_id = ? AND {where}', [run_id] + parameters).fetchall()
+    names = get_relative_names(path for _, path, _, _ in rows)
+    return {(check, names.get(path, None)): (status, code)
+                                      for check, path, status, code in rows}
+
+  def get_regressions(self, old_run=None, new_run=None, check_id=None,
+                      filename=None):
+    """ Returns a sorted list of (check_id, filename, old_status, new_status,
+    new_code) of the results that got worse from `old_run` to `new_run`.
+    Results are matched by check id and the filename relative to the
+    common directory of all files of the run.
+
+    By default the latest two finished runs are compared.
+    """
+    if old_run is None or new_run is None:
+      finished = [run_id for run_id, in self._connection.execute(
+              'SELECT id FROM runs WHERE finished IS NOT NULL ORDER BY id')]
+      if new_run is None:
+        if not finished:
+          return []
+        new_run = finished[-1]
+      if old_run is None:
+        older = [run_id for run_id in finished if run_id < new_run]
+        if not older:
+          return []
+        old_run = older[-1]
+    old = self.get_results(old_run, check_id, filename)
+    new = self.get_results(new_run, check_id, filename)
+    regressions = []
+    for key, (status, code) in new.items():
+      if key not in old:
+        continue
+      old_status, _ = old[key]
+      if _STATUS_WEIGHTS.get(status, 0) > _STATUS_WEIGHTS.get(old_status, 0):
+        regressions.append(key + (old_status, status, code))
+    return sorted(regressions, key=lambda item: (item[0], item[1] or ''))
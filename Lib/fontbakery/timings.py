@@ -0,0 +1,149 @@
+"""
+Font Bakery timings records how long the CheckRunner spends in each check
+and condition, to find out which of them dominate the run time.
+
+For each execution of a check or evaluation of a condition the wall time
+and the CPU time (of the whole process) are recorded. If tracemalloc is
+tracing (e.g. `python -X tracemalloc` or `PYTHONTRACEMALLOC=1`) also the
+peak of the memory allocated during the execution, on Python 3.9 and
+later. Condition times are
+inclusive, i.e. they contain the time of the conditions they depend on.
+Check times contain the evaluation of conditions that were not cached yet.
+Hits and misses of the condition and result caches are counted as well.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+import csv
+import json
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+CHECK = 'check'
+CONDITION = 'condition'
+
+_FIELDS = ('type', 'name', 'count', 'wall', 'cpu', 'peak', 'hits', 'misses')
+
+
+class Timings:
+  def __init__(self):
+    # (type, name, iterargs, wall, cpu, peak)
+    self._records = []
+    # {(type, name): Counter(hits=n, misses=m)}
+    self._cache_counts = {}
+    # peaks of the measurements that are currently running
+    self._peaks = []
+
+  @contextmanager
+  def measure(self, type, name, iterargs=()):
+    """ Records the execution of the with-block. """
+    # tracemalloc.reset_peak is new in Python 3.9, without it no peak
+    # is recorded
+    tracing = tracemalloc.is_tracing() and hasattr(tracemalloc, 'reset_peak')
+    if tracing:
+      current, peak = tracemalloc.get_traced_memory()
+      if self._peaks:
+        # the peak is reset below, keep it for the outer measurement
+        self._peaks[-1] = max(self._peaks[-1], peak)
+      tracemalloc.reset_peak()
+      self._peaks.append(0)
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+      yield
+    finally:
+      wall = time.perf_counter() - wall
+      cpu = time.process_time() - cpu
+      peak = None
+      if tracing:
+        peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+        if self._peaks:
+          self._peaks[-1] = max(self._peaks[-1], peak)
+        peak -= current
+      self._records.append((type, name, iterargs, wall, cpu, peak))
+
+  def count_cache(self, type, name, hit):
+    counter = self._cache_counts.setdefault((type, name), Counter())
+    counter['hits' if hit else 'misses'] += 1
+
+  def get_data(self):
+    """ Returns the recorded data in a picklable format, for `merge`. """
+    return self._records, self._cache_counts
+
+  def clear(self):
+    self._records = []
+    self._cache_counts = {}
+
+  def merge(self, data):
+    """ Add the data of another Timings instance, e.g. of a worker. """
+    records, cache_counts = data
+    self._records += records
+    for key, counter in cache_counts.items():
+      self._cache_counts.setdefault(key, Counter()).update(counter)
+
+  def get_summary(self, get_iterarg=None):
+    """ Returns a JSON compatible dictionary with lists of the totals
+    per check, per condition and per iterarg (e.g. per font), sorted by
+    wall time, slowest first.
+
+    get_iterarg: optional, a function (name, index) -> value, like
+    `CheckRunner.get_iterarg`, to report the iterarg values instead of
+    their indexes.
+    """
+    items = {}
+    def add(key, wall, cpu, peak):
+      item = items.get(key, None)
+      if item is None:
+        item = items[key] = dict(count=0, wall=0, cpu=0, peak=None)
+      item['count'] += 1
+      item['wall'] += wall
+      item['cpu'] += cpu
+      if peak is not None:
+        item['peak'] = max(item['peak'] or 0, peak)
+
+    for type, name, iterargs, wall, cpu, peak in self._records:
+      add((type, name), wall, cpu, peak)
+      if type == CHECK:
+        for iterarg in iterargs:
+          add(('iterarg', iterarg), wall, cpu, peak)
+    for key in self._cache_counts:
+      if key not in items:
+        items[key] = dict(count=0, wall=0, cpu=0, peak=None)
+
+    summary = {'checks': [], 'conditions': [], 'iterargs': []}
+    for (type, name), item in items.items():
+      if type == 'iterarg':
+        iterarg_name, index = name
+        item.update(name=iterarg_name, index=index)
+        if get_iterarg is not None:
+          item['value'] = get_iterarg(iterarg_name, index)
+        summary['iterargs'].append(item)
+        continue
+      item['name'] = name
+      item.update(self._cache_counts.get((type, name), {}))
+      summary['checks' if type == CHECK else 'conditions'].append(item)
+    for items in summary.values():
+      items.sort(key=lambda item: item['wall'], reverse=True)
+    return summary
+
+
+def write_report(summary, file):
+  """ Writes the result of `Timings.get_summary` to `file`, an opened
+  text file, as CSV if its name ends with ".csv", otherwise as JSON.
+  """
+  if not getattr(file, 'name', '').lower().endswith('.csv'):
+    json.dump(summary, file, indent=2)
+    return
+  writer = csv.DictWriter(file, fieldnames=_FIELDS + ('index', 'value'),
+                          extrasaction='ignore')
+  writer.writeheader()
+  for key, type in (('checks', CHECK), ('conditions', CONDITION),
+                    ('iterargs', 'iterarg')):
+    for item in summary[key]:
+      writer.writerow(dict(item, type=type))
@@ -14,10 +14,54 @@
 # limitations under the License.
 #
 import os
+import mmap
+import logging
+import weakref
+import threading
 
 from fontTools.ttLib import TTFont
 from typing import Text, Optional
 
+
+class MappedFile(mmap.mmap):
+  """ A read only memory map of a file that can be used like a file
+  object opened in 'rb' mode, including the `name` attribute, which is
+  used e.g. via `ttFont.reader.file.name`.
+  """
+  def __new__(cls, path):
+    with open(path, 'rb') as f:
+      # The map keeps its own handle, the file can be closed.
+      instance = super(MappedFile, cls).__new__(cls, f.fileno(), 0,
+                                                access=mmap.ACCESS_READ)
+    instance.name = path
+    return instance
+
+
+# {(path, size, mtime): TTFont}, fonts are shared as long as they are alive
+_loaded_fonts = weakref.WeakValueDictionary()
+
+def load_font(path):
+  """ Return a TTFont of the font file at `path`.
+
+  The file is memory mapped and loaded lazily, i.e. tables are only
+  read and decompiled when accessed. As long as the returned TTFont is
+  alive, all callers loading the same, unchanged, file get the same
+  instance. Hence, the returned TTFont must not be modified, use
+  `TTFont(path)` to get a private copy for that.
+  """
+  stat = os.stat(path)
+  key = (path, stat.st_size, stat.st_mtime_ns)
+  font = _loaded_fonts.get(key, None)
+  if font is None:
+    try:
+      font = TTFont(MappedFile(path), lazy=True)
+    except ValueError:
+      # Empty files can't be mapped, let TTFont report the problem.
+      font = TTFont(path)
+    _loaded_fonts[key] = font
+  return font
+
+
 def text_flow(content, width=80, indent=0, left_margin=0,
               space_padding=False, text_color="{}".format):
   result = ""
@@ -202,22 +246,36 @@ def glyph_contour_count(font, name):
     This implementation will also return contour count for
     composite glyphs.
     """
-    contour_count = 0
-    items = [font['glyf'][name]]
-
-    while items:
-        g = items.pop(0)
-        if g.isComposite():
-            for comp in g.components:
-                if comp.glyphName != ".ttfautohint":
-                    items.append(font['glyf'][comp.glyphName])
-        if g.numberOfContours != -1:
-            contour_count += g.numberOfContours
-    return contour_count
-
-
-def get_font_glyph_data(font):
-    """Return information for each glyph in a font"""
+    counts = {}
+    _resolve_glyf_components(font['glyf'], name, counts,
+                             _simple_glyph_contour_count, sum,
+                             ignored_components=('.ttfautohint', ))
+    return counts[name]
+
+
+def get_contour_counts(font):
+    """Contour counts of all glyphs, as an array('H') indexed by glyph ID.
+    Like `glyph_contour_count`, the contours of the components of
+    composite glyphs are counted, each time a component is used.
+    Counts above 65535 are clamped.
+    """
+    from array import array
+    glyf = font['glyf']
+    counts = {}
+    contour_counts = array('H')
+    for name in font.getGlyphOrder():
+      _resolve_glyf_components(glyf, name, counts,
+                               _simple_glyph_contour_count, sum,
+                               ignored_components=('.ttfautohint', ))
+      contour_counts.append(min(counts[name], 0xFFFF))
+    return contour_counts
+
+
+def get_font_glyph_data(font, contour_counts=None):
+    """Return information for each glyph in a font
+
+    contour_counts: optional, the result of `get_contour_counts`
+    """
     from fontbakery.constants import (PlatformID,
                                       WindowsEncodingID)
     font_data = []
@@ -235,11 +293,14 @@ def get_font_glyph_data(font):
         return None
 
     cmap_reversed = dict(zip(cmap.values(), cmap.keys()))
+    if contour_counts is None:
+        contour_counts = get_contour_counts(font)
+    glyph_ids = font.getReverseGlyphMap()
 
     for glyph_name in font.getGlyphSet().keys():
         if glyph_name in cmap_reversed:
             uni_glyph = cmap_reversed[glyph_name]
-            contours = glyph_contour_count(font, glyph_name)
+            contours = contour_counts[glyph_ids[glyph_name]]
             font_data.append({
                 'unicode': uni_glyph,
                 'name': glyph_name,
@@ -293,37 +354,214 @@ def download_file(url):
             " to install the certificates.")
 
 
-def cff_glyph_has_ink(font: TTFont, glyph_name: Text) -> bool:
-  if 'CFF2' in font:
-    top_dict = font['CFF2'].cff.topDictIndex[0]
-  else:
-    top_dict = font['CFF '].cff.topDictIndex[0]
-  char_strings = top_dict.CharStrings
-  char_string = char_strings[glyph_name]
-  bounds = char_string.calcBounds(char_strings)
-  if bounds is not None:
-    return True
-
-  return False
-
+def _number_of_contours(glyph):
+  """ numberOfContours of a glyf table glyph, read from the glyph header
+  if the glyph was not decompiled yet. -1 for composite glyphs. """
+  import struct
+  data = getattr(glyph, 'data', None)
+  if data is None:
+    return glyph.numberOfContours
+  if not data:
+    # an empty glyph
+    return 0
+  return struct.unpack('>h', data[:2])[0]
+
+
+def _simple_glyph_point_count(glyph):
+  """ The number of points of a simple glyph, read from the glyph header
+  (the last contour end point) if the glyph was not decompiled yet. """
+  import struct
+  number_of_contours = _number_of_contours(glyph)
+  if number_of_contours <= 0:
+    return 0
+  data = getattr(glyph, 'data', None)
+  if data is None:
+    return len(glyph.coordinates)
+  offset = 10 + 2 * (number_of_contours - 1)
+  return struct.unpack('>H', data[offset:offset + 2])[0] + 1
+
+
+def _simple_glyph_has_ink(glyph):
+  # you need at least 3 points to draw
+  return _simple_glyph_point_count(glyph) > 2
+
+
+def _simple_glyph_contour_count(glyph):
+  return max(0, _number_of_contours(glyph))
+
+
+def _resolve_glyf_components(glyf, glyph_name, results, simple_value,
+                             combine, ignored_components=()):
+  """ Compute a value for `glyph_name` and for all glyphs it uses as
+  components, depth-first over the component graph, so that each glyph
+  is looked at once, no matter how many composites use it.
+
+  results: dict of glyph name -> value, memoizes across calls.
+  simple_value: function(glyph) -> the value of a simple glyph, which
+                may not be decompiled yet.
+  combine: function(values) -> the value of a composite glyph from the
+           values of its components, repeated as often as they are used.
+           Cyclic references are left out.
+  ignored_components: names of components that don't contribute.
+  """
+  pending = [glyph_name]
+  visiting = set()
+  while pending:
+    name = pending[-1]
+    if name in results:
+      pending.pop()
+      continue
+    glyph = glyf.glyphs[name]
+    if not glyph.isComposite():
+      results[name] = simple_value(glyph)
+      pending.pop()
+      continue
+    glyph.expand(glyf)
+    visiting.add(name)
+    components = [component.glyphName for component in glyph.components
+                          if component.glyphName not in ignored_components]
+    unresolved = [component for component in components
+                    if component not in results and component not in visiting]
+    if unresolved:
+      pending.extend(unresolved)
+      continue
+    results[name] = combine(results[component] for component in components
+                                                  if component in results)
+    visiting.discard(name)
+    pending.pop()
+
+
+# Type 2 charstring operators that add points to the outline
+_T2_DRAWING_OPERATORS = frozenset(('rlineto', 'hlineto', 'vlineto',
+                                   'rrcurveto', 'hhcurveto', 'hvcurveto',
+                                   'vhcurveto', 'vvcurveto', 'rcurveline',
+                                   'rlinecurve', 'flex', 'hflex', 'hflex1',
+                                   'flex1'))
+_T2_CLEARING_OPERATORS = frozenset(('rmoveto', 'hmoveto', 'vmoveto',
+                                    'dotsection'))
+_T2_STEM_OPERATORS = frozenset(('hstem', 'vstem', 'hstemhm', 'vstemhm'))
+# the maximum nesting of subroutine calls
+_T2_MAX_CALL_DEPTH = 10
+
+
+def _subr_bias(subrs):
+  count = len(subrs)
+  return 107 if count < 1240 else 1131 if count < 33900 else 32768
+
+
+def _char_string_has_ink(char_string):
+  """ A quick look at a Type 2 charstring, without drawing it: True or
+  False if its operators tell whether the glyph has ink, None if they
+  don't, e.g. for accented glyphs (seac) or computed subroutine indexes.
+  Subroutines are followed until the first drawing operator.
+  """
+  local_subrs = getattr(char_string.private, 'Subrs', [])
+  global_subrs = char_string.globalSubrs
+  private = char_string.private
+  stack = []
+  stems = 0
+  vsindex = None
+
+  def scan(program, depth):
+    """ True: drawing, False: endchar or end of the charstring,
+    'return': end of a subroutine, None: not conclusive """
+    nonlocal stems, vsindex
+    index = 0
+    while True:
+      token, is_operator, index = program.getToken(index)
+      if token is None:
+        # CFF2 has neither endchar nor return
+        return 'return' if depth else False
+      if not is_operator:
+        stack.append(token)
+      elif token in _T2_DRAWING_OPERATORS:
+        return True
+      elif token in _T2_STEM_OPERATORS:
+        stems += len(stack) // 2
+        del stack[:]
+      elif token in ('hintmask', 'cntrmask'):
+        # the operands are an implicit vstem
+        stems += len(stack) // 2
+        del stack[:]
+        if program.bytecode is None:
+          # decompiled, the mask is the next item of the program
+          index += 1
+        else:
+          index += (stems + 7) // 8
+      elif token in _T2_CLEARING_OPERATORS:
+        del stack[:]
+      elif token in ('callsubr', 'callgsubr'):
+        subrs = local_subrs if token == 'callsubr' else global_subrs
+        if not stack or depth >= _T2_MAX_CALL_DEPTH:
+          return None
+        subr_index = stack.pop() + _subr_bias(subrs)
+        if not isinstance(subr_index, int) or \
+           not 0 <= subr_index < len(subrs):
+          return None
+        result = scan(subrs[subr_index], depth + 1)
+        if result != 'return':
+          return result
+      elif token == 'vsindex' and stack:
+        vsindex = stack.pop()
+        del stack[:]
+      elif token == 'blend' and stack:
+        # n values and their deltas for each region become n values
+        count = stack.pop()
+        deltas = count * private.getNumRegions(vsindex)
+        if not isinstance(count, int) or len(stack) < count + deltas:
+          return None
+        del stack[len(stack) - deltas:]
+      elif token == 'return':
+        return 'return'
+      elif token == 'endchar':
+        # with 4 operands (and a width) it's a seac, an accented glyph
+        # made of two other glyphs
+        return None if len(stack) >= 4 else False
+      else:
+        # e.g. arithmetic or blend operators
+        return None
 
-def ttf_glyph_has_ink(font: TTFont, name: Text) -> bool:
-  glyph = font['glyf'].glyphs[name]
-  glyph.expand(font['glyf'])
+  result = scan(char_string, 0)
+  return None if result == 'return' else result
 
-  if not glyph.isComposite():
-    if glyph.numberOfContours == 0:
-      return False
-    (coords, _, _) = glyph.getCoordinates(font['glyf'])
-    # you need at least 3 points to draw
-    return len(coords) > 2
 
-  # Check for ink in each sub-component.
-  for glyph_name in glyph.getComponentNames(glyph.components):
-    if glyph_has_ink(font, glyph_name):
-      return True
+class GlyphInkMap(dict):
+  """ A dict of glyph name -> whether the glyph has any ink, see
+  `glyph_has_ink`. Each glyph is looked at once, on first access.
 
-  return False
+  For TrueType fonts, the ink of a composite glyph is resolved via its
+  components, each of which is looked at once as well, no matter how
+  many composites use it. CFF charstrings are only executed when their
+  own program doesn't tell, see `_char_string_has_ink`.
+  """
+  def __init__(self, font: TTFont):
+    super().__init__()
+    if 'glyf' in font:
+      self._glyf = font['glyf']
+      self._char_strings = None
+    elif ('CFF ' in font) or ('CFF2' in font):
+      self._glyf = None
+      cff = font['CFF2' if 'CFF2' in font else 'CFF '].cff
+      self._char_strings = cff.topDictIndex[0].CharStrings
+    else:
+      raise Exception("Could not find 'glyf', 'CFF ', or 'CFF2' table.")
+
+  def __missing__(self, glyph_name):
+    if self._glyf is None:
+      char_string = self._char_strings[glyph_name]
+      has_ink = _char_string_has_ink(char_string)
+      if has_ink is None:
+        try:
+          has_ink = char_string.calcBounds(self._char_strings) is not None
+        except RecursionError:
+          # e.g. subroutines calling themselves, the glyph is considered
+          # inked, it's certainly not an empty glyph.
+          has_ink = True
+      self[glyph_name] = has_ink
+    else:
+      _resolve_glyf_components(self._glyf, glyph_name, self,
+                               _simple_glyph_has_ink, any)
+    return self[glyph_name]
 
 
 def unicoderange_bit_name(bit):
@@ -346,27 +584,50 @@ def get_preferred_cmap(ttFont):
     return None
 
 
-def chars_in_range(ttFont, bit):
+def codepoints_in_range(codepoints, start, end):
+  """ The codepoints from `start` to `end` (inclusive) of `codepoints`,
+  a sorted list, found by bisection. """
+  from bisect import bisect_left, bisect_right
+  return codepoints[bisect_left(codepoints, start):
+                    bisect_right(codepoints, end)]
+
+
+def has_codepoints_in_range(codepoints, start, end):
+  """ Whether `codepoints`, a sorted list, contains any codepoint from
+  `start` to `end` (inclusive). """
+  from bisect import bisect_left
+  index = bisect_left(codepoints, start)
+  return index < len(codepoints) and codepoints[index] <= end
+
+
+def chars_in_range(ttFont, bit, codepoints=None):
+  """ The codepoints of the preferred cmap in the ranges of UnicodeRange
+  `bit`. codepoints: optional, the sorted codepoints of the preferred cmap,
+  to not sort them again when called for many bits. """
   from fontbakery.constants import UNICODERANGE_DATA
-  cmap = get_preferred_cmap(ttFont)
+  if codepoints is None:
+    codepoints = sorted(get_preferred_cmap(ttFont))
   chars = []
-  for c in sorted(cmap):
-    for entry in UNICODERANGE_DATA[bit]:
-      if c >= entry[2] and c <= entry[3]:
-        chars.append(c)
-  return chars
+  for entry in UNICODERANGE_DATA[bit]:
+    chars.extend(codepoints_in_range(codepoints, entry[2], entry[3]))
+  return sorted(chars)
+
 
+def compute_unicoderange_bits(ttFont, codepoints=None):
+  """ The UnicodeRange bits of the ranges the preferred cmap has
+  codepoints in. codepoints: optional, see `chars_in_range`.
 
-def compute_unicoderange_bits(ttFont):
+  Instead of looking up each codepoint, each range is looked up in the
+  sorted codepoints, i.e. O(ranges * log(codepoints)).
+  """
   from fontbakery.constants import UNICODERANGE_DATA
-  cmap = get_preferred_cmap(ttFont)
+  if codepoints is None:
+    codepoints = sorted(get_preferred_cmap(ttFont))
   result = 0
-  for c in sorted(cmap):
-    for bit in range(len(UNICODERANGE_DATA)):
-      for entry in UNICODERANGE_DATA[bit]:
-        bit = entry[0]
-        if c >= entry[2] and c <= entry[3]:
-          result |= (1 << bit)
+  for entries in UNICODERANGE_DATA:
+    for bit, _, start, end in entries:
+      if has_codepoints_in_range(codepoints, start, end):
+        result |= (1 << bit)
   return result
 
 
@@ -380,13 +641,11 @@ def glyph_has_ink(font: TTFont, name: Text) -> bool:
       glyph_name: The name of the glyph to check for ink.
   Returns:
       True if the font has at least one contour associated with it.
+
+  To look at many glyphs of the same font, use a `GlyphInkMap`,
+  like the `glyph_ink_map` condition, instead.
   """
-  if 'glyf' in font:
-    return ttf_glyph_has_ink(font, name)
-  elif ('CFF ' in font) or ('CFF2' in font):
-    return cff_glyph_has_ink(font, name)
-  else:
-    raise Exception("Could not find 'glyf', 'CFF ', or 'CFF2' table.")
+  return GlyphInkMap(font)[name]
 
 
 def assert_results_contain(check_results, expected_status, expected_msgcode=None):
@@ -480,3 +739,389 @@ class ShortSegmentPen(BasePen):
 
   def _qCurveToOne(self, bcp, pt):
     self._measureSegment(pt)
+
+
+def point_tuple(coordinates, implied=False):
+  """ A point of a `GlyphGeometry` array as a tuple, with the types
+  a pen receives: integral coordinates of stored points as int, others
+  and those of implied points, which fontTools calculates, as float.
+  """
+  return tuple(int(value) if value.is_integer() and not implied
+               else float(value) for value in coordinates)
+
+
+class GlyphGeometry:
+  """ The outlines of all glyphs of a TrueType font, decoded once into
+  NumPy arrays, so that checks can inspect them with batched array
+  operations instead of drawing each glyph with a pen.
+
+  The components of composite glyphs are resolved, i.e. a composite
+  glyph has the (transformed) points and contours of its components.
+
+  glyph_names: the names of the glyphs, in the order of the glyf table.
+  points: float array (points, 2), the coordinates of all points.
+  on_curve: bool array (points, ), the on-curve flags of the points.
+  end_points: int array (contours, ), the index into `points` of the
+              last point of each contour.
+  point_offsets: int array (glyphs + 1, ), the points of the glyph at
+                 index i are `points[point_offsets[i]:point_offsets[i+1]]`.
+  contour_offsets: int array (glyphs + 1, ), likewise the contours of
+                   the glyph at index i, as indexes into `end_points`.
+  bounds: int array (glyphs, 4), xMin, yMin, xMax and yMax as stored
+          in the glyph headers, zeros for empty glyphs.
+  is_composite: bool array (glyphs, ).
+  point_glyphs: int array (points, ), the glyph index of each point.
+  """
+  def __init__(self, ttFont):
+    import numpy as np
+    glyf = ttFont['glyf']
+    self.glyph_names = list(glyf.keys())
+    points = [np.zeros((0, 2))]
+    flags = [np.zeros(0, dtype=np.uint8)]
+    end_points = [np.zeros(0, dtype=np.int64)]
+    point_counts = []
+    contour_counts = []
+    bounds = []
+    is_composite = []
+    offset = 0
+    for name in self.glyph_names:
+      glyph = glyf[name]
+      coords, ends, glyph_flags = glyph.getCoordinates(glyf)
+      points.append(np.array(coords.array, dtype=np.float64).reshape(-1, 2))
+      flags.append(np.array(glyph_flags, dtype=np.uint8))
+      end_points.append(np.array(ends, dtype=np.int64) + offset)
+      offset += len(coords)
+      point_counts.append(len(coords))
+      contour_counts.append(len(ends))
+      bounds.append([getattr(glyph, attr, 0)
+                     for attr in ('xMin', 'yMin', 'xMax', 'yMax')])
+      is_composite.append(glyph.isComposite())
+
+    self.points = np.concatenate(points)
+    self.on_curve = (np.concatenate(flags) & 1).astype(bool)
+    self.end_points = np.concatenate(end_points)
+    self.point_offsets = np.concatenate([[0], np.cumsum(point_counts,
+                                                       dtype=np.int64)])
+    self.contour_offsets = np.concatenate([[0], np.cumsum(contour_counts,
+                                                         dtype=np.int64)])
+    self.bounds = np.array(bounds, dtype=np.int64).reshape(-1, 4)
+    self.is_composite = np.array(is_composite, dtype=bool)
+    self.point_glyphs = np.repeat(np.arange(len(self.glyph_names)),
+                                  point_counts)
+
+  def get_point(self, index):
+    """ The point at `index` as a tuple, like fontTools returns it:
+    integral coordinates as int, others as float. """
+    return point_tuple(self.points[index])
+
+  def get_segments(self):
+    """ The segments of all contours, in the order a pen draws them.
+
+    Returns (points, implied, glyphs, starts, ends): the segment end
+    points, a float array (n, 2), a bool array marking the ones that are
+    implied on-curve points between two off-curve points, the glyph
+    index of each end point and the index arrays of the start and end
+    points of each segment, in drawing order.
+
+    As with `fontTools.pens.basePen.BasePen`: a contour starts at its
+    first on-curve point (or at the implied point between its last and
+    first point, if it has no on-curve points), and a closing straight
+    line back to the start is implied by closePath, i.e. not a segment.
+    """
+    import numpy as np
+    count = len(self.points)
+    contour_starts = np.concatenate([[0], self.end_points[:-1] + 1]
+                                    )[:len(self.end_points)]
+    contour_lengths = self.end_points - contour_starts + 1
+    contours = np.repeat(np.arange(len(self.end_points)), contour_lengths)
+    indexes = np.arange(count)
+    following = indexes + 1
+    following[self.end_points] = contour_starts
+    preceding = indexes - 1
+    preceding[contour_starts] = self.end_points
+
+    on_curve = self.on_curve
+    implied_between = ~on_curve & ~on_curve[following]
+    # Each point i has up to two end points at position 2*i: the point
+    # itself if it is on-curve and at 2*i + 1 the implied point after it.
+    point_indexes = np.concatenate([indexes[on_curve],
+                                    indexes[implied_between]])
+    implied = np.concatenate([np.zeros(on_curve.sum(), dtype=bool),
+                              np.ones(implied_between.sum(), dtype=bool)])
+    event_contours = contours[point_indexes]
+    positions = 2 * (point_indexes - contour_starts[event_contours]) + implied
+
+    # The end point each contour starts (and ends) at.
+    first_on_curve = np.full(len(self.end_points), count, dtype=np.int64)
+    np.minimum.at(first_on_curve, contours[on_curve], indexes[on_curve])
+    has_on_curve = first_on_curve < count
+    start_positions = np.where(has_on_curve,
+                               2 * (first_on_curve - contour_starts),
+                               2 * (contour_lengths - 1) + 1)
+    periods = 2 * contour_lengths[event_contours]
+    keys = (positions - start_positions[event_contours] - 1) % periods
+    order = np.lexsort((keys, event_contours))
+    point_indexes = point_indexes[order]
+    implied = implied[order]
+    event_contours = event_contours[order]
+
+    points = self.points[point_indexes]
+    implied_following = following[point_indexes[implied]]
+    points[implied] = 0.5 * (points[implied]
+                             + self.points[implied_following])
+
+    ends = np.arange(len(point_indexes))
+    starts = ends - 1
+    firsts = np.flatnonzero(np.diff(event_contours, prepend=-1))
+    lasts = np.concatenate([firsts[1:], [len(ends)]]) - 1
+    starts[firsts] = lasts
+    # The segment back to the start is a closing line if both its
+    # points are on-curve.
+    closing = has_on_curve & on_curve[preceding[np.minimum(first_on_curve,
+                                                          count - 1)]]
+    keep = np.ones(len(ends), dtype=bool)
+    keep[lasts[closing[event_contours[lasts]]]] = False
+    glyphs = self.point_glyphs[point_indexes]
+    return points, implied, glyphs, starts[keep], ends[keep]
+
+
+class GlyphMetrics:
+  """ The horizontal metrics of all glyphs of a font as NumPy arrays and
+  the best cmap as sorted arrays, so that checks can compute their
+  statistics with array operations instead of dict lookups per glyph.
+
+  glyph_names: the names of the glyphs, in the order of the hmtx table
+               (the glyph order, unless the table was modified).
+  advance_widths: int array (glyphs, ).
+  lsbs: int array (glyphs, ), the left side bearings.
+  codepoints: int array, the sorted codepoints of the best cmap.
+  codepoint_glyphs: int array, the index into `glyph_names` of the glyph
+                    of each codepoint, -1 if the glyph has no metrics.
+  """
+  def __init__(self, ttFont):
+    import numpy as np
+    metrics = ttFont['hmtx'].metrics
+    self.glyph_names = list(metrics.keys())
+    self._indexes = {name: index for index, name
+                                 in enumerate(self.glyph_names)}
+    values = np.array(list(metrics.values()), dtype=np.int64).reshape(-1, 2)
+    self.advance_widths = values[:, 0]
+    self.lsbs = values[:, 1]
+
+    cmap = (ttFont.getBestCmap() if 'cmap' in ttFont else None) or {}
+    self.codepoints = np.array(sorted(cmap), dtype=np.int64)
+    self.codepoint_glyphs = np.array([self._indexes.get(cmap[codepoint], -1)
+                                      for codepoint in self.codepoints.tolist()],
+                                     dtype=np.int64)
+    self._cmap = cmap
+
+  def glyph_index(self, name):
+    """ The index of glyph `name` into the arrays, None if it has no
+    metrics. """
+    return self._indexes.get(name, None)
+
+  def advance_width(self, name):
+    return int(self.advance_widths[self._indexes[name]])
+
+  def get_glyph_name(self, codepoint):
+    """ Like `get_glyph_name`, the name of the glyph of `codepoint` in
+    the best cmap or None. """
+    return self._cmap.get(codepoint, None)
+
+  def get_glyph_indexes(self, start, end):
+    """ The sorted unique indexes of the glyphs with metrics, of the
+    codepoints from start to end (inclusive). """
+    import numpy as np
+    first, last = np.searchsorted(self.codepoints, [start, end + 1])
+    indexes = self.codepoint_glyphs[first:last]
+    return np.unique(indexes[indexes >= 0])
+
+
+class LayoutIndex:
+  """ The parts of the GSUB, GPOS and GDEF tables of a font that checks
+  look up. Each part is collected in one pass over the tables, when it's
+  used for the first time, and then shared by all checks.
+
+  The results are cached, don't modify them.
+  """
+  def __init__(self, ttFont):
+    self._ttFont = ttFont
+    self._cache = {}
+
+  def _get(self, key, build, *args):
+    if key not in self._cache:
+      self._cache[key] = build(*args)
+    return self._cache[key]
+
+  def _get_table(self, tag):
+    if tag not in self._ttFont:
+      return None
+    return self._ttFont[tag].table
+
+  def get_feature_lookups(self, table_tag, feature_tag):
+    """ The indexes of the lookups of all feature records of `feature_tag`
+    in the GSUB or GPOS table, in order and without duplicates. """
+    features = self._get(('features', table_tag),
+                         self._index_features, table_tag)
+    return features.get(feature_tag, [])
+
+  def _index_features(self, table_tag):
+    table = self._get_table(table_tag)
+    features = {}
+    if table is None or not table.FeatureList:
+      return features
+    for record in table.FeatureList.FeatureRecord:
+      lookups = features.setdefault(record.FeatureTag, {})
+      for index in record.Feature.LookupListIndex:
+        lookups[index] = None
+    return {tag: list(lookups) for tag, lookups in features.items()}
+
+  def get_lookup_subtables(self, table_tag, index):
+    """ Returns a tuple (lookup type, subtables) of a lookup of the GSUB or
+    GPOS table, the subtables of extension lookups are resolved. """
+    lookup = self._get_table(table_tag).LookupList.Lookup[index]
+    subtables = lookup.SubTable
+    lookup_type = lookup.LookupType
+    if subtables and hasattr(subtables[0], 'ExtSubTable'):
+      lookup_type = subtables[0].ExtensionLookupType
+      subtables = [subtable.ExtSubTable for subtable in subtables]
+    return lookup_type, subtables
+
+  def _get_feature_subtables(self, table_tag, feature_tag, lookup_type):
+    table = self._get_table(table_tag)
+    if table is None or not table.LookupList:
+      return
+    for index in self.get_feature_lookups(table_tag, feature_tag):
+      subtables_type, subtables = self.get_lookup_subtables(table_tag, index)
+      if subtables_type == lookup_type:
+        for subtable in subtables:
+          yield subtable
+
+  @property
+  def ligatures(self):
+    """ The ligatures of the 'liga' feature: a dict of first glyph to a
+    list of tuples of the other components. """
+    return self._get('ligatures', self._index_ligatures)
+
+  def _index_ligatures(self):
+    ligatures = {}
+    for subtable in self._get_feature_subtables('GSUB', 'liga', 4):
+      for first, ligature_set in subtable.ligatures.items():
+        components = ligatures.setdefault(first, {})
+        for ligature in ligature_set:
+          components[tuple(ligature.Component)] = None
+    return {first: list(components) for first, components in ligatures.items()}
+
+  @property
+  def ligature_glyphs(self):
+    """ The ligature glyphs of the 'liga' feature, a list in order of
+    appearance. """
+    return self._get('ligature_glyphs', self._index_ligature_glyphs)
+
+  def _index_ligature_glyphs(self):
+    glyphs = {}
+    for subtable in self._get_feature_subtables('GSUB', 'liga', 4):
+      for ligature_set in subtable.ligatures.values():
+        for ligature in ligature_set:
+          glyphs[ligature.LigGlyph] = None
+    return list(glyphs)
+
+  @property
+  def has_kerning_info(self):
+    """ Whether the GPOS table has at least one Pair Adjustment lookup,
+    directly or through an extension lookup. """
+    return self._get('has_kerning_info', self._index_has_kerning_info)
+
+  def _index_has_kerning_info(self):
+    table = self._get_table('GPOS')
+    if table is None or not table.LookupList:
+      return False
+    for lookup in table.LookupList.Lookup:
+      if lookup.LookupType == 2:  # type 2 = Pair Adjustment
+        return True
+      elif lookup.LookupType == 9:  # type 9 = Extension subtable
+        for ext in lookup.SubTable:
+          if ext.ExtensionLookupType == 2:
+            return True
+    return False
+
+  @property
+  def kerning_pairs(self):
+    """ The set of (first, second) glyph pairs of the 'kern' feature of
+    the GPOS table that are kerned individually, i.e. by Pair Adjustment
+    subtables in format 1. Class based kerning is not included. """
+    return self._get('kerning_pairs', self._index_kerning_pairs)
+
+  def _index_kerning_pairs(self):
+    pairs = set()
+    for subtable in self._get_feature_subtables('GPOS', 'kern', 2):
+      if subtable.Format != 1:
+        continue
+      for first, pair_set in zip(subtable.Coverage.glyphs, subtable.PairSet):
+        pairs.update((first, record.SecondGlyph)
+                     for record in pair_set.PairValueRecord)
+    return pairs
+
+  @property
+  def mark_glyphs(self):
+    """ The set of glyphs in the GDEF mark glyph class. """
+    return self._get('mark_glyphs', self._index_mark_glyphs)
+
+  def _index_mark_glyphs(self):
+    from fontbakery.constants import GlyphClass
+    table = self._get_table('GDEF')
+    if table is None or not table.GlyphClassDef:
+      return set()
+    return {name for name, value in table.GlyphClassDef.classDefs.items()
+                 if value == GlyphClass.MARK}
+
+
+class LogCapture(logging.Handler):
+  """ Collects the distinct messages logged to `logger_name` (and its
+  children) by the current thread, while used as a context manager.
+  The logger is left as it is, its records, also those of the other
+  threads, are still passed on to the handlers of the parent loggers.
+  """
+  def __init__(self, logger_name, level=logging.WARNING):
+    super(LogCapture, self).__init__(level)
+    self._logger = logging.getLogger(logger_name)
+    self._thread = threading.get_ident()
+    self.messages = []
+
+  def emit(self, record):
+    if record.thread != self._thread:
+      return
+    message = record.getMessage()
+    if message not in self.messages:
+      self.messages.append(message)
+
+  def __enter__(self):
+    self._logger.addHandler(self)
+    return self
+
+  def __exit__(self, *exc_info):
+    self._logger.removeHandler(self)
+
+
+def ttx_roundtrip(font_path, tables=None, max_size=32 * 1024 * 1024):
+  """ Dumps the font to TTX and imports it again, in memory: the XML is
+  written to a spooled buffer, which only goes to a temporary file once
+  it exceeds `max_size` bytes.
+
+  tables: optional, a list of table tags, to round-trip only these.
+  Returns the lists of the messages fontTools logged during the export
+  and during the import. Raises `xml.parsers.expat.ExpatError` if the
+  dumped XML can't be parsed.
+  """
+  import tempfile
+  from fontTools import ttx
+
+  with LogCapture('fontTools') as capture, \
+       tempfile.SpooledTemporaryFile(max_size=max_size) as buffer:
+    ttFont = ttx.TTFont(font_path)
+    ttFont.saveXML(buffer, tables=tables)
+    export_msgs = list(capture.messages)
+    buffer.seek(0)
+    ttx.TTFont().importXML(buffer)
+    import_msgs = capture.messages[len(export_msgs):]
+  return export_msgs, import_msgs
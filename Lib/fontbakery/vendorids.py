@@ -0,0 +1,34 @@
+"""The vendor IDs registered with Microsoft, used by
+com.google.fonts/check/vendor_id.
+
+The list is parsed from a copy of Microsoft's web page, in
+data/fontbakery-microsoft-vendorlist.cache, by
+`fontbakery.commands.update_vendor_ids` and stored as a JSON mapping of
+the space padded 4 character vendor IDs to the vendor names in
+data/microsoft_vendor_ids.json. It is only loaded when it's used for
+the first time.
+"""
+import os
+import json
+from functools import lru_cache
+
+VENDORLIST_CACHE_PATH = os.path.join(os.path.dirname(__file__),
+                                     'data',
+                                     'fontbakery-microsoft-vendorlist.cache')
+VENDOR_IDS_PATH = os.path.join(os.path.dirname(__file__),
+                               'data', 'microsoft_vendor_ids.json')
+
+
+@lru_cache(maxsize=None)
+def get_registered_vendor_ids():
+  """Returns a dict of vendor ID to vendor name. Each vendor ID is in it
+  twice, padded to 4 characters with spaces and with NULL bytes,
+  e.g. "CF  " and "CF\\0\\0".
+
+  The result is cached, don't modify it.
+  """
+  with open(VENDOR_IDS_PATH, encoding='utf-8') as f:
+    vendor_ids = json.load(f)
+  for code, name in list(vendor_ids.items()):
+    vendor_ids[code.rstrip(' ').ljust(4, chr(0))] = name
+  return vendor_ids
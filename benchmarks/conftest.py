@@ -0,0 +1,60 @@
+import importlib
+
+from fontbakery.checkrunner import CheckRunner
+from fontbakery.utils import TEST_FILE
+
+CABIN_FONTS = [TEST_FILE(f"cabin/Cabin-{style}.ttf")
+               for style in ("Regular", "Italic", "Bold", "BoldItalic",
+                             "Medium", "MediumItalic", "SemiBold",
+                             "SemiBoldItalic")]
+
+SOURCE_SANS_FONTS = [TEST_FILE(f"source-sans-pro/OTF/SourceSansPro-{style}.otf")
+                     for style in ("Regular", "It", "Bold", "BoldIt")]
+
+PROFILE_FONTS = {
+  "universal": CABIN_FONTS,
+  "opentype": CABIN_FONTS,
+  "googlefonts": CABIN_FONTS,
+  "notofonts": CABIN_FONTS,
+  "typotheque": CABIN_FONTS,
+  "adobefonts": SOURCE_SANS_FONTS,
+}
+
+# Conditions that download fonts or query web services. Checks using
+# them would measure the network.
+NETWORK_CONDITIONS = {
+  "listed_on_gfonts_api",
+  "remote_styles",
+  "github_gfonts_ttFont",
+}
+
+
+def get_profile(profile_name):
+  module = importlib.import_module(f"fontbakery.profiles.{profile_name}")
+  return module.profile
+
+
+def is_reproducible(profile, check):
+  """ False if the check's time depends on the network, subprocesses
+  or anything else that is not the checked files. """
+  if check.io_bound or check.volatile:
+    return False
+  return not NETWORK_CONDITIONS & profile.get_deep_check_dependencies(check)
+
+
+def get_runner(profile_name, fonts=None, **kwds):
+  return CheckRunner(get_profile(profile_name),
+                     values={"fonts": fonts or PROFILE_FONTS[profile_name]},
+                     **kwds)
+
+
+def get_order(runner):
+  return [identity for identity in runner.order
+          if is_reproducible(runner.profile, identity[1])]
+
+
+def run_checks(runner, order):
+  """ Run the checks of `order` without the check runner protocol. """
+  for _, check, iterargs in order:
+    for _ in runner._run_check(check, iterargs):
+      pass
@@ -0,0 +1,27 @@
+"""
+Benchmarks of individual checks that dominate the run time of their
+profiles. The conditions are evaluated before, so only the checks are
+measured.
+"""
+import pytest
+
+from conftest import CABIN_FONTS, SOURCE_SANS_FONTS, get_runner, run_checks
+
+HOT_CHECKS = [
+  ("googlefonts", "com.google.fonts/check/contour_count", CABIN_FONTS[:2]),
+  ("universal", "com.google.fonts/check/points_out_of_bounds", CABIN_FONTS[:2]),
+  ("universal", "com.google.fonts/check/ttx-roundtrip", CABIN_FONTS[:2]),
+  ("adobefonts", "com.adobe.fonts/check/find_empty_letters", SOURCE_SANS_FONTS[:2]),
+  ("typotheque", "com.typotheque/check/short-segments--otf_ttf", CABIN_FONTS[:2]),
+]
+
+
+@pytest.mark.parametrize("profile_name, check_id, fonts", HOT_CHECKS,
+                         ids=[check_id for _, check_id, _ in HOT_CHECKS])
+def test_check(benchmark, profile_name, check_id, fonts):
+  runner = get_runner(profile_name, fonts, explicit_checks=[check_id])
+  order = [identity for identity in runner.order if identity[1].id == check_id]
+  assert order
+  # evaluate and cache the conditions
+  run_checks(runner, order)
+  benchmark.pedantic(run_checks, args=(runner, order), rounds=5, iterations=1)
@@ -0,0 +1,43 @@
+"""
+Benchmarks of whole profiles, run against the fonts in data/test.
+"""
+import subprocess
+import sys
+
+import pytest
+
+from conftest import PROFILE_FONTS, get_runner, get_order
+
+PROFILES = sorted(PROFILE_FONTS)
+
+
+@pytest.mark.parametrize("profile_name", PROFILES)
+def test_profile_run(benchmark, profile_name):
+  """ Run all reproducible checks of a profile, like `fontbakery check-*`
+  does, including loading the fonts and evaluating the conditions. """
+  def run():
+    runner = get_runner(profile_name)
+    return list(runner.run(order=get_order(runner)))
+
+  events = benchmark.pedantic(run, rounds=3, iterations=1)
+  assert events
+
+
+@pytest.mark.parametrize("profile_name", PROFILES)
+def test_profile_import(benchmark, profile_name):
+  """ Import a profile module in a fresh interpreter. """
+  code = f"import fontbakery.profiles.{profile_name}"
+  benchmark.pedantic(subprocess.check_call, args=([sys.executable, "-c", code],),
+                     rounds=5, iterations=1)
+
+
+@pytest.mark.parametrize("profile_name", PROFILES)
+def test_execution_order(benchmark, profile_name):
+  """ Compute the execution order of a profile, without the order
+  cached by the profile, like in a new process. """
+  def order():
+    runner = get_runner(profile_name)
+    runner.profile._execution_orders.clear()
+    return runner.order
+
+  assert benchmark(order)
@@ -57,3 +57,12 @@ def test_command_check_ufo_sources():
 
   with pytest.raises(subprocess.CalledProcessError):
     subprocess.check_output(["fontbakery", "check-ufo-sources"])
+
+
+def test_command_coordinator_and_worker():
+  """Test if `fontbakery coordinator` and `fontbakery worker` can run successfully`."""
+  subprocess.check_output(["fontbakery", "coordinator", "-h"])
+  subprocess.check_output(["fontbakery", "worker", "-h"])
+
+  with pytest.raises(subprocess.CalledProcessError):
+    subprocess.check_output(["fontbakery", "worker"])
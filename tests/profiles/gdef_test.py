@@ -2,6 +2,7 @@ from fontTools.ttLib import TTFont, newTable
 from fontTools.ttLib.tables import otTables
 from fontbakery.utils import TEST_FILE
 from fontbakery.checkrunner import (WARN, PASS, SKIP)
+from fontbakery.profiles.shared_conditions import layout_index
 
 
 def get_test_font():
@@ -30,18 +31,18 @@ def test_check_gdef_spacing_marks():
 
   print ("Test: SKIP if a font lacks a GDEF table")
   test_font = get_test_font()
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, layout_index(test_font)))[-1]
   assert status == SKIP
 
   print ("Test: PASS with an empty GDEF table")
   add_gdef_table(test_font, {})
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, layout_index(test_font)))[-1]
   assert status == PASS
 
   print ("Test: WARN if a mark glyph has non-zero width")
   # Add a table with 'A' defined as a mark glyph:
   add_gdef_table(test_font, {'A': 3})
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, layout_index(test_font)))[-1]
   assert status == WARN and message.code == 'spacing-mark-glyphs'
 
 
@@ -51,20 +52,20 @@ def test_check_gdef_mark_chars():
 
   print ("Test: SKIP if a font lacks a GDEF table...")
   test_font = get_test_font()
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, layout_index(test_font)))[-1]
   assert status == SKIP
 
   print ("Test: WARN if a mark-char is not listed...")
   # Add a GDEF table not including `acutecomb` (U+0301) as a mark char:
   add_gdef_table(test_font, {})
-  status, msg = list(check(test_font))[-1]
+  status, msg = list(check(test_font, layout_index(test_font)))[-1]
   assert status == WARN and msg.code == "mark-chars"
   assert 'U+0301' in msg.message
 
   print ("Test: PASS when properly declared...")
   # Include it in the table to see the check PASS:
   add_gdef_table(test_font, {'acutecomb': 3})
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, layout_index(test_font)))[-1]
   assert status == PASS
 
 
@@ -74,21 +75,21 @@ def test_check_gdef_non_mark_chars():
 
   print ("Test: SKIP if a font lacks a GDEF table...")
   test_font = get_test_font()
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, layout_index(test_font)))[-1]
   assert status == SKIP
 
   print ("Test: PASS with an empty GDEF table")
   add_gdef_table(test_font, {})
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, layout_index(test_font)))[-1]
   assert status == PASS
 
   print ("Test: PASS with an GDEF with only properly declared mark chars")
   add_gdef_table(test_font, {'acutecomb': 3})
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, layout_index(test_font)))[-1]
   assert status == PASS
 
   print ("Test: PASS with an GDEF with a non-mark char (U+00B4, 'acute') misdeclared")
   add_gdef_table(test_font, {'acute': 3, 'acutecomb': 3})
-  status, msg = list(check(test_font))[-1]
+  status, msg = list(check(test_font, layout_index(test_font)))[-1]
   assert status == WARN and msg.code == "non-mark-chars"
   assert 'U+00B4' in msg.message
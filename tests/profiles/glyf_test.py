@@ -52,13 +52,15 @@ def test_check_glyf_unused_data():
 def test_check_points_out_of_bounds():
   """ Check for points out of bounds. """
   from fontbakery.profiles.glyf import com_google_fonts_check_points_out_of_bounds as check
+  from fontbakery.profiles.shared_conditions import glyph_geometry
 
   test_font = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(glyph_geometry(test_font)))[-1]
   assert status == WARN and message.code == "points-out-of-bounds"
+  assert "('Jcircumflex', 15, -7)" in message.message
 
   test_font2 = TTFont(TEST_FILE("familysans/FamilySans-Regular.ttf"))
-  status, _ = list(check(test_font2))[-1]
+  status, _ = list(check(glyph_geometry(test_font2)))[-1]
   assert status == PASS
 
 
@@ -634,6 +634,19 @@ def test_condition__registered_vendor_ids():
   assert "????" not in registered_ids
 
 
+def test_vendor_ids_are_up_to_date():
+  """ data/microsoft_vendor_ids.json matches the cached vendor list. """
+  from fontbakery.commands.update_vendor_ids import parse_vendorlist
+  from fontbakery.vendorids import (VENDORLIST_CACHE_PATH,
+                                    get_registered_vendor_ids)
+  with open(VENDORLIST_CACHE_PATH, encoding='utf-8') as f:
+    parsed = parse_vendorlist(f.read())
+  expected = dict(parsed)
+  for code, name in parsed.items():
+    expected[code.rstrip(' ').ljust(4, chr(0))] = name
+  assert get_registered_vendor_ids() == expected
+
+
 def test_check_vendor_id():
   """ Checking OS/2 achVendID """
   from fontbakery.profiles.googlefonts import (com_google_fonts_check_vendor_id as check,
@@ -871,12 +884,32 @@ def test_check_hinting_impact():
   # TODO: test the CFF code-path
 
   font = TEST_FILE("mada/Mada-Regular.ttf")
+  ttFont = TTFont(font)
 
   print('Test this check always emits an INFO result...')
-  status, message = list(check(TTFont(font), hinting_stats(font)))[-1]
+  status, message = list(check(font, hinting_stats(font, ttFont)))[-1]
   assert status == INFO and message.code == "size-impact"
 
 
+def test_hinting_stats_ttfautohint_version(monkeypatch):
+  """ The stored hinting stats are not reused after ttfautohint was
+  updated. """
+  import sys
+  import types
+  from fontbakery.profiles.googlefonts_conditions import hinting_stats
+  from fontbakery.resultcache import ResultCache
+
+  def get_version(version_string):
+    library = types.ModuleType('ttfautohint.libttfautohint')
+    library.version_string = version_string
+    monkeypatch.setitem(sys.modules, 'ttfautohint.libttfautohint', library)
+    monkeypatch.setattr('ttfautohint.libttfautohint', library, raising=False)
+    return ResultCache(None).get_version(hinting_stats)
+
+  assert get_version('1.8.2') == get_version('1.8.2')
+  assert get_version('1.8.2') != get_version('1.8.3')
+
+
 def test_check_name_version_format():
   """ Version format is correct in 'name' table ? """
   from fontbakery.profiles.googlefonts import com_google_fonts_check_name_version_format as check
@@ -2357,22 +2390,37 @@ def test_check_mac_style():
 def test_check_contour_count(montserrat_ttFonts):
   """Check glyphs contain the recommended contour count"""
   from fontbakery.profiles.googlefonts import com_google_fonts_check_contour_count as check
+  from fontbakery.profiles.shared_conditions import contour_counts
 
   # TODO: FAIL, "lacks-cmap"
 
 
   # Montserrat should PASS this check since it was used to assemble the glyph data
   for ttFont in montserrat_ttFonts:
-    status, message = list(check(ttFont))[-1]
+    status, message = list(check(ttFont, contour_counts(ttFont)))[-1]
     assert status == PASS
 
   # Lets swap the glyf a (2 contours) with glyf c (1 contour)
   for ttFont in montserrat_ttFonts:
     ttFont['glyf']['a'] = ttFont['glyf']['c']
-    status, message = list(check(ttFont))[-1]
+    status, message = list(check(ttFont, contour_counts(ttFont)))[-1]
     assert status == WARN and message.code == "contour-count"
 
 
+def test_contour_counts():
+  from fontbakery.profiles.shared_conditions import contour_counts
+  from fontbakery.utils import glyph_contour_count
+
+  ttFont = TTFont(TEST_FILE("source-sans-pro/TTF/SourceSansPro-Regular.ttf"))
+  counts = contour_counts(ttFont)
+  assert counts.typecode == 'H'
+  assert len(counts) == len(ttFont.getGlyphOrder())
+  # Aacute is a composite of A (2 contours) and an acute accent (1 contour)
+  assert counts[ttFont.getGlyphID('Aacute')] == 3
+  for name in ('A', 'Aacute', 'i', 'space'):
+    assert counts[ttFont.getGlyphID(name)] == glyph_contour_count(ttFont, name)
+
+
 # FIXME!
 # Temporarily disabled since GFonts hosted Cabin files seem to have changed in ways
 # that break some of the assumptions in the code-test below.
@@ -3119,14 +3167,32 @@ def test_check_varfont_weight_instances():
   assert status == PASS
 
 
-def NOT_IMPLEMENTED_test_check_family_tnum_horizontal_metrics():
+def test_check_family_tnum_horizontal_metrics():
   """ All tabular figures must have the same width across the RIBBI-family. """
-  # from fontbakery.profiles.googlefonts import com_google_fonts_check_family_tnum_horizontal_metrics as check
-  # TODO: Implement-me!
-  #
-  # code-paths:
-  # - FAIL, "inconsistent-widths"
-  # - PASS
+  from fontbakery.profiles.googlefonts import com_google_fonts_check_family_tnum_horizontal_metrics as check
+  from fontbakery.profiles.googlefonts_conditions import (RIBBI_ttFonts,
+                                                          RIBBI_glyph_metrics)
+
+  # The tabular figures of Source Sans Pro are wider in the Bold.
+  fonts = [portable_path("data/test/source-sans-pro/OTF/SourceSansPro-Regular.otf"),
+           portable_path("data/test/source-sans-pro/OTF/SourceSansPro-Bold.otf")]
+  ttFonts = RIBBI_ttFonts(fonts)
+  assert len(ttFonts) == 2
+
+  print('Test PASS with a single style...')
+  status, message = list(check(RIBBI_glyph_metrics(ttFonts[:1])))[-1]
+  assert status == PASS
+
+  print('Test FAIL with tabular figures of different widths...')
+  status, message = list(check(RIBBI_glyph_metrics(ttFonts)))[-1]
+  assert status == FAIL and message.code == "inconsistent-widths"
+
+  print('Test PASS when the other font has no hmtx table...')
+  del ttFonts[1]['hmtx']
+  metrics = RIBBI_glyph_metrics(ttFonts)
+  assert metrics[1] is None
+  status, message = list(check(metrics))[-1]
+  assert status == PASS
 
 
 def test_check_integer_ppem_if_hinted():
@@ -3154,11 +3220,12 @@ def test_check_integer_ppem_if_hinted():
 def test_check_ligature_carets():
   """ Is there a caret position declared for every ligature ? """
   from fontbakery.profiles.googlefonts import com_google_fonts_check_ligature_carets as check
-  from fontbakery.profiles.shared_conditions import ligatures
+  from fontbakery.profiles.shared_conditions import (layout_index,
+                                                     ligature_glyphs)
 
   # Our reference Mada Medium is known to be bad
   ttFont = TTFont(TEST_FILE("mada/Mada-Medium.ttf"))
-  lig = ligatures(ttFont)
+  lig = ligature_glyphs(layout_index(ttFont))
 
   # So it must emit a WARN:
   print ("Test WARN with a bad font...")
@@ -3167,7 +3234,7 @@ def test_check_ligature_carets():
 
   # And FamilySans Regular is known to be bad
   ttFont = TTFont("data/test/familysans/FamilySans-Regular.ttf")
-  lig = ligatures(ttFont)
+  lig = ligature_glyphs(layout_index(ttFont))
 
   # So it must emit a WARN:
   print ("Test WARN with a bad font...")
@@ -3185,25 +3252,27 @@ def test_check_kerning_for_non_ligated_sequences():
   from fontbakery.profiles.gpos import has_kerning_info
   from fontbakery.profiles.googlefonts import (
     com_google_fonts_check_kerning_for_non_ligated_sequences as check)
-  from fontbakery.profiles.shared_conditions import ligatures
+  from fontbakery.profiles.shared_conditions import layout_index, ligatures
   # Our reference Mada Medium is known to be good
   ttFont = TTFont(TEST_FILE("mada/Mada-Medium.ttf"))
-  lig = ligatures(ttFont)
-  has_kinfo = has_kerning_info(ttFont)
+  index = layout_index(ttFont)
+  lig = ligatures(index)
+  has_kinfo = has_kerning_info(index)
 
   # So it must PASS the check:
   print ("Test PASS with a good font...")
-  status, message = list(check(ttFont, lig, has_kinfo))[-1]
+  status, message = list(check(lig, index, has_kinfo))[-1]
   assert status == PASS
 
   # And Merriweather Regular is known to be bad
   ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
-  lig = ligatures(ttFont)
-  has_kinfo = has_kerning_info(ttFont)
+  index = layout_index(ttFont)
+  lig = ligatures(index)
+  has_kinfo = has_kerning_info(index)
 
   # So the check must emit a WARN in this testcase:
   print ("Test WARN with a bad font...")
-  status, message = list(check(ttFont, lig, has_kinfo))[-1]
+  status, message = list(check(lig, index, has_kinfo))[-1]
   assert status == WARN and message.code == "lacks-kern-info"
 
 
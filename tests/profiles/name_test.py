@@ -71,7 +71,8 @@ def results_contain(results, expected_status, expected_code):
 def test_check_monospace():
   """ Checking correctness of monospaced metadata. """
   from fontbakery.profiles.name import com_google_fonts_check_monospace as check
-  from fontbakery.profiles.shared_conditions import glyph_metrics_stats
+  from fontbakery.profiles.shared_conditions import (glyph_metrics,
+                                                     glyph_metrics_stats)
   from fontbakery.constants import (PANOSE_Proportion,
                                     IsFixedWidth)
 
@@ -86,7 +87,7 @@ def test_check_monospace():
   # Our reference Mada Regular is a non-monospace font
   # know to have good metadata for this check.
   ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
-  stats = glyph_metrics_stats(ttFont)
+  stats = glyph_metrics_stats(glyph_metrics(ttFont))
   status, message = list(check(ttFont, stats))[-1]
   assert status == PASS and message.code == "good"
 
@@ -114,7 +115,7 @@ def test_check_monospace():
   # a monospaced font with good metadata here.
   ttFont = TTFont(TEST_FILE("overpassmono/OverpassMono-Regular.ttf"))
 
-  stats = glyph_metrics_stats(ttFont)
+  stats = glyph_metrics_stats(glyph_metrics(ttFont))
   assert stats['most_common_width'] == 616
   status, message = list(check(ttFont, stats))[-1]
   # WARN is emitted when there's at least one outlier.
@@ -84,7 +84,11 @@ def test_check_family_panose_familytype(mada_ttFonts):
 
 def test_check_xavgcharwidth():
   """ Check if OS/2 xAvgCharWidth is correct. """
-  from fontbakery.profiles.os2 import com_google_fonts_check_xavgcharwidth as check
+  from fontbakery.profiles.os2 import com_google_fonts_check_xavgcharwidth
+  from fontbakery.profiles.shared_conditions import glyph_metrics
+
+  def check(ttFont):
+    return com_google_fonts_check_xavgcharwidth(ttFont, glyph_metrics(ttFont))
 
   test_font_path = TEST_FILE("nunito/Nunito-Regular.ttf")
 
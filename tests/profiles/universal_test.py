@@ -217,13 +217,21 @@ def DISABLED_test_check_glyphnames_max_length():
   assert status == PASS
 
 
-def test_check_ttx_roundtrip(): 
+def test_check_ttx_roundtrip():
   """ Checking with fontTools.ttx """ 
   from fontbakery.profiles.universal import com_google_fonts_check_ttx_roundtrip as check 
  
   good_font_path = TEST_FILE("mada/Mada-Regular.ttf") 
-  status, _ = list(check(good_font_path))[-1] 
+  status, message = list(check(good_font_path, None))[-1]
   assert status == PASS 
+  assert message == "Hey! It all looks good!"
+  # The XML dump is kept in memory, nothing is written next to the font.
+  assert not os.path.exists(good_font_path + ".xml")
+
+  # Round-tripping only some of the tables:
+  status, message = list(check(good_font_path, ["name", "OS/2"]))[-1]
+  assert status == PASS
+  assert message.endswith("Round-tripped only these tables: name, OS/2")
  
   # TODO: Can anyone show us a font file that fails ttx roundtripping?! 
   #bad_font_path = TEST_FILE("...") 
@@ -231,6 +239,36 @@ def test_check_ttx_roundtrip():
   #assert status == FAIL 
  
  
+def test_log_capture():
+  """ Only the messages of the current thread are captured, the records
+  of all threads are still passed on to the parent loggers. """
+  import logging
+  import threading
+  from fontbakery.utils import LogCapture
+
+  class Collect(logging.Handler):
+    def __init__(self):
+      super().__init__(logging.WARNING)
+      self.messages = []
+
+    def emit(self, record):
+      self.messages.append(record.getMessage())
+
+  parent = Collect()
+  logging.getLogger('fontTools').addHandler(parent)
+  try:
+    logger = logging.getLogger('fontTools.ttLib')
+    with LogCapture('fontTools') as capture:
+      logger.warning('this thread')
+      thread = threading.Thread(target=logger.warning, args=('other thread',))
+      thread.start()
+      thread.join()
+  finally:
+    logging.getLogger('fontTools').removeHandler(parent)
+  assert capture.messages == ['this thread']
+  assert parent.messages == ['this thread', 'other thread']
+
+
 def test_is_up_to_date(): 
   from fontbakery.profiles.universal import is_up_to_date 
   # is_up_to_date(installed, latest) 
@@ -344,16 +382,17 @@ def test_check_mandatory_glyphs():
   """ Font contains the first few mandatory glyphs (.null or NULL, CR and
   space)? """
   from fontbakery.profiles.universal import com_google_fonts_check_mandatory_glyphs as check
+  from fontbakery.profiles.shared_conditions import glyph_ink_map
 
   test_font = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, glyph_ink_map(test_font)))[-1]
   assert status == PASS
 
   import fontTools.subset
   subsetter = fontTools.subset.Subsetter()
   subsetter.populate(glyphs="n")  # Arbitrarily remove everything except n.
   subsetter.subset(test_font)
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, glyph_ink_map(test_font)))[-1]
   assert status == WARN
 
 
@@ -444,19 +483,20 @@ def test_check_whitespace_glyphnames():
 def test_check_whitespace_ink():
   """ Whitespace glyphs have ink? """
   from fontbakery.profiles.universal import com_google_fonts_check_whitespace_ink as check
+  from fontbakery.profiles.shared_conditions import glyph_ink_map
 
   test_font = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, glyph_ink_map(test_font)))[-1]
   assert status == PASS
 
   print ("Test for whitespace character having composites (with ink).")
   test_font["cmap"].tables[0].cmap[0x0020] = "uni1E17"
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, glyph_ink_map(test_font)))[-1]
   assert status == FAIL
 
   print ("Test for whitespace character having outlines (with ink).")
   test_font["cmap"].tables[0].cmap[0x0020] = "scedilla"
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, glyph_ink_map(test_font)))[-1]
   assert status == FAIL
 
   print ("Test for whitespace character having composites (without ink).")
@@ -464,7 +504,7 @@ def test_check_whitespace_ink():
   pen = fontTools.pens.ttGlyphPen.TTGlyphPen(test_font.getGlyphSet())
   pen.addComponent("space", (1, 0, 0, 1, 0, 0))
   test_font["glyf"].glyphs["uni200B"] = pen.glyph()
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, glyph_ink_map(test_font)))[-1]
   assert status == FAIL
 
 
@@ -593,6 +633,67 @@ def test_glyph_has_ink():
   assert(glyph_has_ink(cff2_test_font, 'space') is False)
 
 
+def test_glyph_ink_map_cff(monkeypatch):
+  """ The quick look at the charstrings agrees with drawing them. """
+  from fontbakery import utils
+  from fontbakery.utils import GlyphInkMap
+  from fontTools.ttLib import TTFont
+
+  for path in ("source-sans-pro/OTF/SourceSansPro-Regular.otf",
+               "source-sans-pro/VAR/SourceSansVariable-Roman.otf",
+               "subr_test_fonts/subr_test_font_infinite_recursion.otf",
+               "subr_test_fonts/var_subr_test_font_infinite_recursion.otf"):
+    ttFont = TTFont(TEST_FILE(path))
+    glyph_order = ttFont.getGlyphOrder()
+    quick = GlyphInkMap(ttFont)
+    quick = [quick[glyph_name] for glyph_name in glyph_order]
+    with monkeypatch.context() as patch:
+      # always draw the glyphs
+      patch.setattr(utils, '_char_string_has_ink', lambda char_string: None)
+      drawn = GlyphInkMap(TTFont(TEST_FILE(path)))
+      assert quick == [drawn[glyph_name] for glyph_name in glyph_order]
+
+  # glyph F calls a subroutine that calls itself, it's considered inked
+  assert drawn['F'] is True
+
+
+def test_unicoderange_bits():
+  from fontbakery.utils import (chars_in_range,
+                                compute_unicoderange_bits,
+                                get_preferred_cmap)
+
+  ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+  codepoints = sorted(get_preferred_cmap(ttFont))
+  bits = compute_unicoderange_bits(ttFont)
+  assert bits & (1 << 0) # Basic Latin
+  assert bits & (1 << 13) # Arabic
+  assert not bits & (1 << 59) # CJK Unified Ideographs
+  assert chars_in_range(ttFont, 0) == [c for c in codepoints if c <= 0x7F]
+  assert chars_in_range(ttFont, 59, codepoints) == []
+
+
+def test_glyph_ink_map():
+  from fontbakery.profiles.shared_conditions import glyph_ink_map
+  import fontTools.pens.ttGlyphPen
+
+  ttf_test_font = TTFont(TEST_FILE("source-sans-pro/TTF/SourceSansPro-Regular.ttf"))
+  ink = glyph_ink_map(ttf_test_font)
+  assert ink['Aacute'] is True # composite
+  assert ink['space'] is False
+  assert 'A' in ink # resolved as a component of Aacute
+
+  # a composite of components without ink has no ink
+  pen = fontTools.pens.ttGlyphPen.TTGlyphPen(ttf_test_font.getGlyphSet())
+  pen.addComponent("space", (1, 0, 0, 1, 0, 0))
+  ttf_test_font["glyf"].glyphs["uni200B"] = pen.glyph()
+  assert glyph_ink_map(ttf_test_font)['uni200B'] is False
+
+  cff_test_font = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Regular.otf"))
+  ink = glyph_ink_map(cff_test_font)
+  assert ink['Aacute'] is True
+  assert ink['space'] is False
+
+
 mada_fonts = [
   TEST_FILE("mada/Mada-Black.ttf"),
   TEST_FILE("mada/Mada-ExtraLight.ttf"),
@@ -0,0 +1,830 @@
+import os
+
+from fontbakery.checkrunner import CheckRunner, START, END
+from fontbakery.utils import TEST_FILE
+
+cabin_fonts = [
+  TEST_FILE("cabin/Cabin-Regular.ttf"),
+  TEST_FILE("cabin/Cabin-Bold.ttf"),
+  TEST_FILE("cabin/Cabin-Italic.ttf")
+]
+
+explicit_checks = [
+  "com.google.fonts/check/family/single_directory",
+  "com.google.fonts/check/family/panose_proportion",
+  "com.google.fonts/check/xavgcharwidth",
+  "com.google.fonts/check/mandatory_glyphs",
+  "com.google.fonts/check/fontbakery_version"
+]
+
+
+def summarize(events):
+  return [(status.name, getattr(message, 'name', str(message)),
+           check.id if check else None, iterargs)
+          for status, message, (_, check, iterargs) in events]
+
+
+def get_runner(runner_class=CheckRunner, **kwds):
+  from fontbakery.profiles.universal import profile
+  return runner_class(profile,
+                      values={"fonts": cabin_fonts},
+                      explicit_checks=explicit_checks,
+                      **kwds)
+
+
+def test_multiprocessing_runner():
+  """ Parallel execution must yield the same events as a serial run. """
+  from fontbakery.multiproc import MultiprocessingRunner, get_shards
+  runner = get_runner(MultiprocessingRunner, jobs=2)
+
+  # all checks of one font end up in the same shard
+  shards = get_shards(runner.order)
+  for shard in shards:
+    assert len(set(runner.order[index][2] for index in shard)) == 1
+
+  events = list(runner.run())
+  assert events[0][0] == START
+  assert events[-1][0] == END
+  serial = get_runner()
+  assert summarize(events) == summarize(serial.run())
+  assert sum(events[-1][1].values()) == len(runner.order)
+
+  # the durations measured by the workers are transferred
+  def get_executed(runner):
+    return [runner.get_check_duration(check, iterargs) is not None
+                                        for _, check, iterargs in runner.order]
+  assert any(get_executed(runner))
+  assert get_executed(runner) == get_executed(serial)
+
+
+def test_io_bound_checks_in_threads():
+  """ io_bound checks run in a thread pool, but are reported in order. """
+  import threading
+  from fontbakery.callable import check
+  from fontbakery.checkrunner import Profile, Section, PASS
+
+  threads = {}
+
+  @check(id='test/io_bound', io_bound=True)
+  def io_bound_check(font):
+    """An io bound check."""
+    threads[font] = threading.current_thread()
+    yield PASS, f"{font} io"
+
+  @check(id='test/cpu_bound')
+  def cpu_bound_check(font):
+    """A cpu bound check."""
+    yield PASS, f"{font} cpu"
+
+  profile = Profile(sections=[Section('Test', checks=[io_bound_check,
+                                                      cpu_bound_check])],
+                    iterargs={'font': 'fonts'})
+  values = {'fonts': ['a', 'b', 'c']}
+  threaded = CheckRunner(profile, values=dict(values), io_threads=2)
+  events = summarize(threaded.run())
+  assert sorted(threads) == ['a', 'b', 'c']
+  assert threading.current_thread() not in threads.values()
+  assert events == summarize(CheckRunner(profile, values=dict(values)).run())
+
+
+def test_io_bound_checks_run_once():
+  """ Each io_bound check is executed exactly once per identity. """
+  from collections import Counter
+  from fontbakery.callable import check
+  from fontbakery.checkrunner import Profile, Section, PASS
+
+  calls = Counter()
+
+  @check(id='test/io_bound_a', io_bound=True)
+  def io_bound_check_a(font):
+    """An io bound check."""
+    calls[('a', font)] += 1
+    yield PASS, f"{font} a"
+
+  @check(id='test/io_bound_b', io_bound=True)
+  def io_bound_check_b(font):
+    """Another io bound check."""
+    calls[('b', font)] += 1
+    yield PASS, f"{font} b"
+
+  profile = Profile(sections=[Section('Test', checks=[io_bound_check_a,
+                                                      io_bound_check_b])],
+                    iterargs={'font': 'fonts'})
+  runner = CheckRunner(profile, values={'fonts': ['a', 'b', 'c']},
+                       io_threads=4)
+  list(runner.run())
+  assert calls == Counter({(name, font): 1 for name in 'ab'
+                                           for font in 'abc'})
+
+
+def test_io_bound_lookahead():
+  """ The arguments of io-bound checks are prepared just a few
+  identities before their turn, not all at once. """
+  from fontbakery.callable import check, condition
+  from fontbakery.checkrunner import Profile, Section, PASS
+
+  log = []
+
+  @condition
+  def font_data(font):
+    log.append(('load', font))
+    return font
+
+  @check(id='test/io_bound', io_bound=True)
+  def io_bound_check(font_data):
+    """An io bound check."""
+    yield PASS, font_data
+
+  @check(id='test/plain')
+  def plain_check(font):
+    """A check running in order."""
+    log.append(('plain', font))
+    yield PASS, font
+
+  profile = Profile(sections=[Section('Test', checks=[io_bound_check,
+                                                      plain_check])],
+                    iterargs={'font': 'fonts'},
+                    conditions={'font_data': font_data})
+  fonts = list('abcdef')
+  runner = CheckRunner(profile, values={'fonts': fonts}, io_threads=4,
+                       io_lookahead=1, major_iterarg='font')
+  list(runner.run())
+  # one identity ahead: font_data of a font is loaded before the plain
+  # check of the previous font, but after that of the font before it
+  for previous, font in zip(fonts, fonts[2:]):
+    assert log.index(('load', font)) > log.index(('plain', previous))
+
+
+def test_result_cache(tmp_path):
+  """ A second run replays the results from the cache, except for
+  volatile checks.
+  """
+  from fontbakery.callable import check
+  from fontbakery.checkrunner import Profile, Section, PASS
+  from fontbakery.resultcache import ResultCache
+
+  calls = []
+
+  @check(id='test/cached')
+  def cached_check(font):
+    """A cached check."""
+    calls.append(('cached', font))
+    yield PASS, f"{font} cached"
+
+  @check(id='test/volatile', volatile=True)
+  def volatile_check(font):
+    """A volatile check."""
+    calls.append(('volatile', font))
+    yield PASS, f"{font} volatile"
+
+  profile = Profile(sections=[Section('Test', checks=[cached_check,
+                                                      volatile_check])],
+                    iterargs={'font': 'fonts'})
+  font = tmp_path / 'font.txt'
+  font.write_text('a')
+  values = {'fonts': [str(font)]}
+
+  def run():
+    cache = ResultCache(str(tmp_path / 'cache'), salt='test')
+    return summarize(CheckRunner(profile, values=dict(values),
+                                 result_cache=cache).run())
+
+  events = run()
+  assert calls == [('cached', str(font)), ('volatile', str(font))]
+  del calls[:]
+  assert run() == events
+  assert calls == [('volatile', str(font))]
+
+  # changed contents invalidate the cached result
+  del calls[:]
+  font.write_text('b')
+  run()
+  assert calls == [('cached', str(font)), ('volatile', str(font))]
+
+  # so does a renamed file with the same contents, checks may read the
+  # filename or its directory
+  del calls[:]
+  renamed = tmp_path / 'renamed.txt'
+  font.rename(renamed)
+  values['fonts'] = [str(renamed)]
+  run()
+  assert calls == [('cached', str(renamed)), ('volatile', str(renamed))]
+
+
+def test_result_cache_tool_version(tmp_path):
+  """ The `tool_version` of checks and their conditions is part of the
+  result cache key. """
+  from fontbakery.callable import check, condition
+  from fontbakery.checkrunner import Profile, Section, PASS
+  from fontbakery.resultcache import ResultCache
+
+  versions = {'check': '1.0', 'condition': '1.0'}
+
+  @condition(tool_version=lambda: versions['condition'])
+  def tool_condition(font):
+    return font
+
+  @check(id='test/tool', tool_version=lambda: versions['check'])
+  def tool_check(tool_condition):
+    """A check running an external tool."""
+    yield PASS, "tool"
+
+  profile = Profile(sections=[Section('Test', checks=[tool_check])],
+                    iterargs={'font': 'fonts'},
+                    conditions={'tool_condition': tool_condition})
+  font = tmp_path / 'font.txt'
+  font.write_text('a')
+
+  def get_key():
+    runner = CheckRunner(profile, values={'fonts': [str(font)]},
+                         result_cache=ResultCache(None))
+    _, check, iterargs = runner.order[0]
+    return runner.get_result_key(check, iterargs)
+
+  key = get_key()
+  assert get_key() == key
+  versions['check'] = '2.0'
+  check_key = get_key()
+  assert check_key != key
+  versions['condition'] = '2.0'
+  assert get_key() not in (key, check_key)
+
+
+def test_persistent_condition(tmp_path):
+  """ The values of persistent conditions are stored in the result cache,
+  even when the checks using them are not.
+  """
+  from fontbakery.callable import check, condition
+  from fontbakery.checkrunner import Profile, Section, PASS
+  from fontbakery.resultcache import ResultCache
+
+  calls = []
+
+  @condition(persistent=True)
+  def font_size(font):
+    calls.append(font)
+    return {'size': len(open(font).read())}
+
+  @check(id='test/volatile', volatile=True)
+  def volatile_check(font_size):
+    """A volatile check."""
+    yield PASS, f"{font_size['size']} bytes"
+
+  profile = Profile(sections=[Section('Test', checks=[volatile_check])],
+                    iterargs={'font': 'fonts'},
+                    conditions={'font_size': font_size})
+  font = tmp_path / 'font.txt'
+  font.write_text('abc')
+  values = {'fonts': [str(font)]}
+
+  def run():
+    cache = ResultCache(str(tmp_path / 'cache'), salt='test')
+    return summarize(CheckRunner(profile, values=dict(values),
+                                 result_cache=cache).run())
+
+  events = run()
+  assert calls == [str(font)]
+  del calls[:]
+  assert run() == events
+  assert calls == []
+
+  font.write_text('abcd')
+  assert run() != events
+  assert calls == [str(font)]
+
+def test_condition_cache():
+  """ Conditions are released after their last use in the execution
+  order and the least recently used entries are dropped when the cache
+  is full.
+  """
+  from fontbakery.checkrunner import ConditionCache
+
+  cache = ConditionCache(max_entries=2)
+  cache[('a', ())] = None, 1
+  cache[('b', (('font', 0),))] = None, 2
+  assert cache[('a', ())] == (None, 1)
+  cache[('c', (('font', 1),))] = None, 3
+  # 'b' was the least recently used entry
+  assert ('b', (('font', 0),)) not in cache
+  assert len(cache) == 2
+  cache.release(('font', 1))
+  assert list(cache._entries) == [('a', ())]
+
+  cache = ConditionCache()
+  runner = get_runner(condition_cache=cache)
+  releases = runner._get_condition_releases(runner.order)
+  assert sorted(iterarg for iterargs in releases.values()
+                        for iterarg in iterargs) == [('font', 0), ('font', 1),
+                                                     ('font', 2)]
+  events = list(runner.run())
+  assert summarize(events) == summarize(get_runner().run())
+  # nothing per font is left after the run
+  assert not any(used_iterargs for _, used_iterargs in cache._entries)
+
+
+def test_font_major_order():
+  """ With a major iterarg, all checks of a font run before the checks
+  of the next font, checks without that iterarg run last.
+  """
+  runner = get_runner(major_iterarg='font')
+  fonts = [dict(iterargs).get('font', None)
+           for _, _, iterargs in runner.order]
+  assert fonts == sorted(fonts, key=lambda index: (index is None, index))
+  assert fonts[-1] is None
+  assert sorted(runner.order, key=repr) == sorted(get_runner().order, key=repr)
+
+  events = list(runner.run())
+  assert events[-1][1] == list(get_runner().run())[-1][1]
+
+
+def test_timings():
+  """ Timings are recorded per check, condition and font, also when
+  the checks are executed in worker processes.
+  """
+  from fontbakery.multiproc import MultiprocessingRunner
+  from fontbakery.timings import Timings
+
+  for runner in (get_runner(timings=Timings()),
+                 get_runner(MultiprocessingRunner, jobs=2, timings=Timings())):
+    list(runner.run())
+    summary = runner.timings.get_summary(runner.get_iterarg)
+    checks = {item['name']: item for item in summary['checks']}
+    assert set(checks) == set(explicit_checks)
+    assert sum(item['count'] for item in checks.values()) == len(runner.order)
+    conditions = {item['name']: item for item in summary['conditions']}
+    assert conditions['ttFont']['count'] == conditions['ttFont']['misses']
+    assert conditions['ttFont']['misses'] >= len(cabin_fonts)
+    assert sorted(item['value'] for item in summary['iterargs']) \
+                                                    == sorted(cabin_fonts)
+
+
+def test_timings_peak(monkeypatch):
+  """ The memory peak is recorded while tracemalloc is tracing, if it
+  can be reset (Python 3.9 and later). """
+  import tracemalloc
+  from fontbakery.timings import Timings, CHECK
+
+  def measure():
+    timings = Timings()
+    with timings.measure(CHECK, 'test/peak'):
+      data = bytearray(1 << 20)
+    del data
+    return timings.get_summary()['checks'][0]['peak']
+
+  tracemalloc.start()
+  try:
+    if hasattr(tracemalloc, 'reset_peak'):
+      assert measure() >= 1 << 20
+      monkeypatch.delattr(tracemalloc, 'reset_peak')
+    assert measure() is None
+  finally:
+    tracemalloc.stop()
+
+
+def test_execution_order_cache():
+  """ The execution order is computed once per profile and arguments,
+  until checks are registered, and can be saved and loaded. """
+  import io
+  import json
+  from fontbakery.callable import check, FontBakeryExpectedValue
+  from fontbakery.checkrunner import Profile, Section, PASS
+
+  @check(id='test/a')
+  def check_a(font):
+    """Check a."""
+    yield PASS, font
+
+  @check(id='test/b')
+  def check_b(font):
+    """Check b."""
+    yield PASS, font
+
+  section = Section('Test', checks=[check_a])
+  # declared, to be used by the family check below
+  fonts = FontBakeryExpectedValue('fonts', default=[])
+  profile = Profile(sections=[section], iterargs={'font': 'fonts'},
+                    expected_values={'fonts': fonts})
+  values = {'fonts': ['a', 'b']}
+  runner = CheckRunner(profile, values=dict(values))
+  assert CheckRunner(profile, values=dict(values)).order is runner.order
+  assert len(runner.order) == 2
+
+  saved = io.StringIO()
+  runner.dump_order(saved)
+
+  section.add_check(check_b)
+  other = CheckRunner(profile, values=dict(values))
+  assert len(other.order) == 4
+  # computed for other checks
+  saved.seek(0)
+  assert not CheckRunner(profile, values=dict(values)).load_order(saved)
+
+  section.remove_check('test/b')
+  loaded = CheckRunner(profile, values=dict(values))
+  saved.seek(0)
+  assert loaded.load_order(saved)
+  assert [(c.id, i) for _, c, i in loaded.order] == \
+         [(c.id, i) for _, c, i in runner.order]
+
+  # the same check id, but iterating over other values
+  @check(id='test/a')
+  def family_check_a(fonts):
+    """Check a, of the family."""
+    yield PASS, fonts
+
+  section.remove_check('test/a')
+  section.add_check(family_check_a)
+  saved.seek(0)
+  assert not CheckRunner(profile, values=dict(values)).load_order(saved)
+
+  # identities that don't match their check are rejected
+  section.remove_check('test/a')
+  section.add_check(check_a)
+  data = json.loads(saved.getvalue())
+  data['order'] = [item.replace('["font",1]', '["font",2]')
+                                                  for item in data['order']]
+  assert not CheckRunner(profile, values=dict(values)).load_order(
+                                                io.StringIO(json.dumps(data)))
+
+
+def test_distributed_runner(tmp_path):
+  """ Workers run the checks handed out by the coordinator, which
+  reports them like a serial run. """
+  import threading
+  from fontbakery.distributed import DistributedRunner, run_worker
+
+  address = str(tmp_path / 'coordinator.sock')
+  runner = get_runner(DistributedRunner, address=address, authkey=b'test',
+                      setup={'fonts': cabin_fonts})
+
+  def runner_factory(setup):
+    assert setup == {'fonts': cabin_fonts}
+    return get_runner()
+
+  workers = [threading.Thread(target=run_worker,
+                              args=(address, b'test', runner_factory))
+             for _ in range(2)]
+  for worker in workers:
+    worker.start()
+  events = list(runner.run())
+  for worker in workers:
+    worker.join()
+  assert summarize(events) == summarize(get_runner().run())
+
+
+def test_distributed_runner_lost_worker(tmp_path):
+  """ The shard of a worker that is lost is run by another worker, which
+  waits for it instead of finishing. """
+  import threading
+  import time
+  from multiprocessing.connection import Client
+  from fontbakery.distributed import DistributedRunner, run_worker
+
+  address = str(tmp_path / 'coordinator.sock')
+  runner = get_runner(DistributedRunner, address=address, authkey=b'test')
+  lost_shard = []
+  executed = []
+  rest_done = threading.Event()
+
+  def lost_worker():
+    while True:
+      try:
+        connection = Client(address, authkey=b'test')
+        break
+      except (ConnectionRefusedError, FileNotFoundError):
+        time.sleep(0.05)
+    with connection:
+      connection.recv() # setup
+      connection.send(('ready', None))
+      _, shard = connection.recv()
+      lost_shard.extend(shard)
+      threading.Thread(target=run_worker,
+                       args=(address, b'test', runner_factory)).start()
+      # the other worker ran all other shards, without a result of this one,
+      # and asks for the next shard
+      rest_done.wait()
+      time.sleep(0.5)
+
+  def runner_factory(setup):
+    worker_runner = get_runner()
+    run_check = worker_runner._run_check
+    def counting_run_check(*args, **kwds):
+      events = list(run_check(*args, **kwds))
+      executed.append(args)
+      if len(executed) == len(runner.order) - len(lost_shard):
+        rest_done.set()
+      return events
+    worker_runner._run_check = counting_run_check
+    return worker_runner
+
+  threading.Thread(target=lost_worker).start()
+  events = []
+  coordinator = threading.Thread(target=lambda: events.extend(runner.run()),
+                                 daemon=True)
+  coordinator.start()
+  coordinator.join(60)
+  assert not coordinator.is_alive(), 'The lost shard was never run.'
+  assert summarize(events) == summarize(get_runner().run())
+  assert len(executed) == len(runner.order)
+
+
+def test_jsonl_reporter():
+  """ The records of the JSONL reporter fold into the document of the
+  serialize reporter. """
+  import io
+  import json
+  from fontbakery.checkrunner import distribute_generator
+  from fontbakery.reporters.serialize import SerializeReporter
+  from fontbakery.reporters.jsonl import JSONLReporter, fold
+
+  for results_by in (None, '*check'):
+    runner = get_runner()
+    sr = SerializeReporter(runner=runner, collect_results_by=results_by)
+    f = io.StringIO()
+    jr = JSONLReporter(f, runner=runner, collect_results_by=results_by)
+    distribute_generator(runner.run(), [sr.receive, jr.receive])
+
+    lines = f.getvalue().splitlines()
+    # START, one record per check, END
+    assert len(lines) == len(runner.order) + 2
+    # the items of finished checks are not kept
+    assert not any(check for _, check, _ in jr._serializer._items)
+    assert jr._results == [] and jr._serializer._results == []
+    assert not isinstance(jr, SerializeReporter)
+    assert fold(lines) == json.loads(json.dumps(sr.getdoc()))
+
+
+def test_html_and_markdown_reporters(tmp_path):
+  """ The HTML and Markdown reports are written while the checks run,
+  the HTML summary table is filled in at the top at the end. """
+  from fontbakery.checkrunner import ENDSECTION
+  from fontbakery.reporters.html import HTMLReporter
+  from fontbakery.reporters.ghmarkdown import GHMarkdownReporter
+
+  runner = get_runner()
+  html_path, md_path = tmp_path / 'report.html', tmp_path / 'report.md'
+  with open(html_path, 'w', encoding='utf-8') as html_file, \
+       open(md_path, 'w', encoding='utf-8') as md_file:
+    hr = HTMLReporter(None, file=html_file, runner=runner)
+    mdr = GHMarkdownReporter(None, file=md_file, runner=runner)
+    for event in runner.run():
+      hr.receive(event)
+      mdr.receive(event)
+      if event[0] == ENDSECTION:
+        # the section is already written
+        assert '<h2>' in html_path.read_text(encoding='utf-8')
+    # the items of finished checks are not kept
+    assert not any(check for _, check, _ in hr._items)
+    assert not any(check for _, check, _ in mdr._items)
+
+  html = html_path.read_text(encoding='utf-8')
+  assert html.index('<h2>Summary</h2>') < html.index('<h2>&lt;Section')
+  assert html.rstrip().endswith('</html>')
+  assert html.count('<details>') == len(runner.order)
+  md = md_path.read_text(encoding='utf-8')
+  assert md.startswith('## Fontbakery report')
+  assert '### Summary' in md
+  for font in cabin_fonts:
+    assert os.path.basename(font) in md
+
+
+def test_result_store(tmp_path):
+  """ The results of each run are appended to the result store. """
+  from fontbakery.reporters.resultstore import ResultStoreReporter
+  from fontbakery.resultstore import ResultStore
+
+  store = ResultStore(str(tmp_path / 'results.sqlite'))
+  for _ in range(2):
+    runner = get_runner()
+    ResultStoreReporter(store, version='test', runner=runner).run()
+
+  runs = store.get_runs()
+  assert [run['id'] for run in runs] == [1, 2]
+  assert all(run['finished'] for run in runs)
+  assert sum(runs[0]['results'].values()) == len(runner.order)
+  assert runs[0]['results'] == runs[1]['results']
+  assert store.get_regressions() == []
+
+  check_id = 'com.google.fonts/check/mandatory_glyphs'
+  trend = store.get_trend(check_id, 'Cabin-Bold')
+  assert [sum(counter.values()) for _, _, counter in trend] == [1, 1]
+
+  # a third run, where the check fails for one font
+  run_id = store.start_run()
+  for (check, filename), (status, code) in store.get_results(2).items():
+    if check == check_id and filename == 'Cabin-Bold.ttf':
+      status, code = 'FAIL', 'empty'
+    store.add_result(run_id, check, status, code=code, filename=filename)
+  store.finish_run(run_id)
+  assert store.get_regressions() == [(check_id, 'Cabin-Bold.ttf',
+                                      'PASS', 'FAIL', 'empty')]
+  store.close()
+
+
+def test_result_store_relative_names(tmp_path):
+  """ Results of files of the same name in different directories are
+  kept apart. """
+  from fontbakery.resultstore import ResultStore
+
+  store = ResultStore(str(tmp_path / 'results.sqlite'))
+  for statuses in (('PASS', 'PASS'), ('FAIL', 'PASS')):
+    run_id = store.start_run()
+    for directory, status in zip('ba', statuses):
+      store.add_result(run_id, 'test/check', status,
+                       filename=os.path.join('/fonts', directory, 'Font.ttf'))
+    store.finish_run(run_id)
+  assert store.get_regressions() == [('test/check',
+                                      os.path.join('b', 'Font.ttf'),
+                                      'PASS', 'FAIL', None)]
+  store.close()
+
+
+def test_result_store_durations(tmp_path):
+  """ The durations are those of the check executions, unknown for
+  results replayed from the result cache. """
+  import sqlite3
+  from fontbakery.reporters.resultstore import ResultStoreReporter
+  from fontbakery.resultcache import ResultCache
+  from fontbakery.resultstore import ResultStore
+
+  path = str(tmp_path / 'results.sqlite')
+  store = ResultStore(path)
+  for _ in range(2):
+    runner = get_runner(result_cache=ResultCache(str(tmp_path / 'cache')))
+    ResultStoreReporter(store, runner=runner).run()
+  store.close()
+
+  connection = sqlite3.connect(path)
+  durations = {}
+  for run_id, check_id, duration in connection.execute(
+                        'SELECT run_id, check_id, duration FROM results'):
+    durations.setdefault(run_id, {})[check_id] = duration
+  connection.close()
+  assert sum(filter(None, durations[1].values())) > 0
+  # fontbakery_version is volatile, it is never cached
+  volatile = 'com.google.fonts/check/fontbakery_version'
+  assert durations[2].pop(volatile) is not None
+  assert set(durations[2].values()) == {None}
+
+
+def test_terminal_progressbar():
+  """ The progress bar is broken into lines of the terminal width. """
+  import io
+  from fontbakery.reporters.terminal import TerminalProgress
+
+  class TTY(io.StringIO):
+    def isatty(self):
+      return True
+
+  progress = TerminalProgress(stdout=TTY(), theme={})
+  progress._order = ()
+  progress._progressbar = list('P' * 25)
+  bar = progress._draw_progressbar(columns=10, len_prefix=2)
+  # the prefix is reserved for the spinner
+  assert bar.split('\n') == ['[PPPPPPP', 'PPPPPPPPPP', 'PPPPPPPP]', '  0%']
+  assert progress._draw_progressbar() == '[' + 'P' * 25 + ']   0%'
+
+
+def test_baseline():
+  """ Check executions recorded in a baseline report are not executed
+  again, their results are replayed, changes are reported. """
+  import json
+  from fontbakery.baseline import Baseline, get_check_id, iter_check_items
+  from fontbakery.checkrunner import distribute_generator
+  from fontbakery.reporters.baseline import BaselineDiffReporter
+  from fontbakery.reporters.serialize import SerializeReporter
+  from fontbakery.resultcache import ResultCache
+
+  runner = get_runner(result_cache=ResultCache(None))
+  sr = SerializeReporter(runner=runner)
+  sr.run()
+  doc = json.loads(json.dumps(sr.getdoc()))
+  items = list(iter_check_items(doc))
+  recorded = [item for item in items if 'resultKey' in item]
+  assert recorded
+
+  # a recorded result is replayed, not executed
+  replayed = recorded[0]
+  replayed['result'] = 'WARN'
+  replayed['logs'] = [dict(status='WARN', message='from the baseline',
+                           code='baseline')]
+  # a result without key is executed again
+  executed = recorded[1]
+  del executed['resultKey']
+  executed['result'] = 'ERROR'
+
+  baseline = Baseline(doc)
+  runner = get_runner(result_cache=baseline)
+  sr = SerializeReporter(runner=runner)
+  dr = BaselineDiffReporter(baseline, runner=runner)
+  distribute_generator(runner.run(), [sr.receive, dr.receive])
+
+  assert dr.reused == len(recorded) - 1
+  new_doc = json.loads(json.dumps(sr.getdoc()))
+  results = {json.dumps(item['key']): item
+                                    for item in iter_check_items(new_doc)}
+  item = results[json.dumps(replayed['key'])]
+  assert item['result'] == 'WARN'
+  assert item['logs'][0]['message'] == 'from the baseline'
+  assert item['logs'][0]['code'] == 'baseline'
+  assert [transition[0] for transition in dr.transitions] \
+                                                == [get_check_id(executed)]
+  assert dr.transitions[0][2] == 'ERROR'
+
+
+def test_baseline_relative_names():
+  """ Files are matched by their path relative to the common directory,
+  not by their name. """
+  from fontbakery.baseline import get_relative_names
+
+  assert get_relative_names(['/old/a/Font.ttf', '/old/b/Font.ttf', None]) \
+                    == {'/old/a/Font.ttf': os.path.join('a', 'Font.ttf'),
+                        '/old/b/Font.ttf': os.path.join('b', 'Font.ttf')}
+  assert get_relative_names(['/new/Font.ttf']) == {'/new/Font.ttf': 'Font.ttf'}
+
+
+def test_baseline_renamed_files(tmp_path):
+  """ Recorded results are only reused for files of the same name,
+  relative to the common directory, and path. """
+  import json
+  from fontbakery.callable import check
+  from fontbakery.checkrunner import Profile, Section, PASS
+  from fontbakery.reporters.baseline import BaselineDiffReporter
+  from fontbakery.reporters.serialize import SerializeReporter
+  from fontbakery.resultcache import ResultCache
+  from fontbakery.baseline import Baseline
+
+  calls = []
+
+  @check(id='test/name')
+  def name_check(font):
+    """Reports the name of the file."""
+    calls.append(font)
+    yield PASS, f"{os.path.basename(font)} is fine"
+
+  profile = Profile(sections=[Section('Test', checks=[name_check])],
+                    iterargs={'font': 'fonts'})
+  for directory in 'ab':
+    (tmp_path / directory).mkdir()
+    (tmp_path / directory / 'font.txt').write_text('a')
+  fonts = [str(tmp_path / directory / 'font.txt') for directory in 'ab']
+
+  sr = SerializeReporter(runner=CheckRunner(profile, values={'fonts': fonts},
+                                            result_cache=ResultCache(None)))
+  sr.run()
+  doc = json.loads(json.dumps(sr.getdoc()))
+
+  def run(fonts):
+    del calls[:]
+    baseline = Baseline(doc, filenames=fonts)
+    runner = CheckRunner(profile, values={'fonts': fonts},
+                         result_cache=baseline)
+    dr = BaselineDiffReporter(baseline, runner=runner)
+    dr.run()
+    return dr
+
+  dr = run(fonts)
+  assert calls == [] and dr.reused == 2
+
+  # recorded as 'a/font.txt', now it is 'font.txt'
+  dr = run(fonts[:1])
+  assert calls == fonts[:1] and dr.reused == 0
+
+  renamed = str(tmp_path / 'b' / 'renamed.txt')
+  os.rename(fonts[1], renamed)
+  dr = run([fonts[0], renamed])
+  assert calls == [renamed] and dr.reused == 1
+  assert dr.transitions == [('test/name', renamed, None, 'PASS')]
+
+
+def test_result_key_computed_once(monkeypatch):
+  """ The reporters get the result keys the runner computed. """
+  from fontbakery.checkrunner import distribute_generator
+  from fontbakery.reporters.baseline import BaselineDiffReporter
+  from fontbakery.reporters.serialize import SerializeReporter
+  from fontbakery.resultcache import ResultCache
+  from fontbakery.baseline import Baseline
+
+  runner = get_runner(result_cache=ResultCache(None))
+  sr = SerializeReporter(runner=runner)
+  sr.run()
+  baseline = Baseline(sr.getdoc())
+
+  calls = []
+  get_key = ResultCache.get_key
+  def counting_get_key(self, check, *args, **kwds):
+    calls.append(check.id)
+    return get_key(self, check, *args, **kwds)
+  monkeypatch.setattr(ResultCache, 'get_key', counting_get_key)
+
+  runner = get_runner(result_cache=baseline)
+  reporters = [SerializeReporter(runner=runner),
+               SerializeReporter(runner=runner),
+               BaselineDiffReporter(baseline, runner=runner)]
+  distribute_generator(runner.run(), [reporter.receive
+                                                for reporter in reporters])
+  assert calls
+  assert len(calls) == len(set((check.id, iterargs)
+                    for _, check, iterargs in runner.order
+                    if runner.get_result_key(check, iterargs) is not None))
+  assert reporters[2].transitions == []